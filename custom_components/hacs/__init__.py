@@ -12,8 +12,8 @@ from awesomeversion import AwesomeVersion
 from homeassistant.components.frontend import async_remove_panel
 from homeassistant.components.lovelace.system_health import system_health_info
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import Platform, __version__ as HAVERSION
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform, __version__ as HAVERSION
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntry
@@ -21,15 +21,23 @@ from homeassistant.helpers.entity_registry import async_get as async_get_entity_
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.start import async_at_start
 from homeassistant.loader import async_get_integration
+from homeassistant.util.ssl import get_default_context
 
 from .base import HacsBase
 from .const import DOMAIN, HACS_SYSTEM_ID, MINIMUM_HA_VERSION
 from .data_client import HacsDataClient
 from .enums import HacsDisabledReason, HacsStage, LovelaceMode
 from .frontend import async_register_frontend
+from .utils.concurrency import HacsConcurrencySession
+from .utils.connection_pool import HacsConnectionPools, HacsConnectionPoolSession
 from .utils.data import HacsData
+from .utils.http_cache import HacsHttpCache, HacsHttpCacheSession
 from .utils.queue_manager import QueueManager
-from .utils.store import STORE_CACHE_KEY
+from .utils.rate_limit import HacsRateLimitSession
+from .utils.raw_cache import HacsRawCache
+from .utils.retry import HacsRetrySession
+from .utils.store import STORE_CACHE_KEY, get_store_for_key
+from .utils.tree_cache import HacsTreeCache
 from .utils.version import version_left_higher_or_equal_then_right
 from .websocket import async_register_websocket_commands
 
@@ -63,7 +71,27 @@ async def _async_initialize_integration(
 
     hacs.log.info("Starting HACS[%s]", integration.version)
 
-    clientsession = async_get_clientsession(hass)
+    session = async_get_clientsession(hass)
+    if hacs.configuration.dedicated_connections:
+        hacs.connection_pools = pools = HacsConnectionPools(
+            ssl_context=get_default_context(),
+            headers={"User-Agent": f"HACS/{integration.version}"},
+        )
+        session = HacsConnectionPoolSession(session, pools)
+
+        # The pools can not use the shared connector of Home Assistant,
+        # so they are closed with the config entry, or when Home Assistant closes
+        async def _async_close_connection_pools(_: Event) -> None:
+            await pools.async_close()
+
+        config_entry.async_on_unload(pools.async_close)
+        config_entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connection_pools)
+        )
+
+    # Requests to every upstream host share an adaptive concurrency limit,
+    # failed requests are retried outside of it so waiting does not hold a slot
+    clientsession = HacsRetrySession(HacsConcurrencySession(session, hacs.concurrency), hacs.retry)
 
     hacs.integration = integration
     hacs.version = integration.version
@@ -74,7 +102,12 @@ async def _async_initialize_integration(
     hacs.data_client = HacsDataClient(
         session=clientsession,
         client_name=f"HACS/{integration.version}",
+        single_flight=hacs.single_flight,
+        store=get_store_for_key(hass, "data_client"),
+        delta=True,
+        transfer_stats=hacs.transfer_stats,
     )
+    await hacs.data_client.async_load()
     hacs.system.running = True
     hacs.session = clientsession
 
@@ -90,10 +123,20 @@ async def _async_initialize_integration(
     if hacs.core.ha_version is None:
         hacs.core.ha_version = AwesomeVersion(HAVERSION)
 
+    hacs.http_cache = HacsHttpCache(hass, hacs.configuration.token)
+    await hacs.http_cache.async_load()
+    githubsession = HacsHttpCacheSession(
+        HacsRateLimitSession(clientsession, hacs.rate_limit), hacs.http_cache
+    )
+    hacs.raw_cache = HacsRawCache(hass, hass.config.path(".storage", "hacs", "raw"))
+    await hacs.raw_cache.async_load()
+    hacs.tree_cache = HacsTreeCache(hass, hass.config.path(".storage", "hacs", "trees"))
+    await hacs.tree_cache.async_load()
+
     # Legacy GitHub client
     hacs.github = GitHub(
         hacs.configuration.token,
-        clientsession,
+        githubsession,
         headers={
             "User-Agent": f"HACS/{hacs.version}",
             "Accept": ACCEPT_HEADERS["preview"],
@@ -103,7 +146,7 @@ async def _async_initialize_integration(
     # New GitHub client
     hacs.githubapi = GitHubAPI(
         token=hacs.configuration.token,
-        session=clientsession,
+        session=githubsession,
         **{"client_name": f"HACS/{hacs.version}"},
     )
 
@@ -204,9 +247,14 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     for task in hacs.recurring_tasks:
         # Cancel all pending tasks
         task()
+    hacs.async_cancel_queue_after_reset()
 
     # Store data
     await hacs.data.async_write(force=True)
+    await hacs.data_client.async_save()
+    for cache in (hacs.http_cache, hacs.raw_cache, hacs.tree_cache):
+        if cache is not None:
+            await cache.async_save()
 
     try:
         if hass.data.get("frontend_panels", {}).get("hacs"):
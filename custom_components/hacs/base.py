@@ -7,7 +7,6 @@ from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 import gzip
-import math
 import os
 import pathlib
 import shutil
@@ -19,6 +18,7 @@ from aiogithubapi import (
     GitHubAPI,
     GitHubAuthenticationException,
     GitHubException,
+    GitHubGraphQLException,
     GitHubNotModifiedException,
     GitHubRatelimitException,
 )
@@ -32,12 +32,20 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 from homeassistant.loader import Integration
 from homeassistant.util import dt
 
-from .const import DOMAIN, TV, URL_BASE
+from .const import (
+    DEFAULT_BULK_CONCURRENT_TASKS,
+    DOMAIN,
+    METADATA_BATCH_SIZE,
+    PREFETCH_API_COST,
+    REPOSITORY_UPDATE_API_COST,
+    TV,
+    URL_BASE,
+)
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
@@ -47,6 +55,7 @@ from .enums import (
     HacsGitHubRepo,
     HacsStage,
     LovelaceMode,
+    RateLimitPriority,
 )
 from .exceptions import (
     AddonRepositoryException,
@@ -60,16 +69,34 @@ from .exceptions import (
 )
 from .repositories import REPOSITORY_CLASSES
 from .repositories.base import HACS_MANIFEST_KEYS_TO_EXPORT, REPOSITORY_KEYS_TO_EXPORT
+from .utils.compression import ACCEPT_ENCODING, TransferStats, async_read_decoded
+from .utils.concurrency import HacsConcurrency
 from .utils.file_system import async_exists
 from .utils.json import json_loads
 from .utils.logger import LOGGER
+from .utils.prefix_index import PrefixIndex
+from .utils.preflight import PREFLIGHT_QUERY, preflight_repository, preflight_variables
 from .utils.queue_manager import QueueManager
+from .utils.rate_limit import HacsRateLimit
+from .utils.repository_metadata import (
+    METADATA_FIELDS,
+    metadata_moved,
+    metadata_query,
+    metadata_variables,
+    parse_metadata,
+)
+from .utils.retry import HacsRetry
+from .utils.single_flight import SingleFlight, call_key
 from .utils.store import async_load_from_store, async_save_to_store
 from .utils.workarounds import async_register_static_path
 
 if TYPE_CHECKING:
     from .repositories.base import HacsRepository
     from .utils.data import HacsData
+    from .utils.http_cache import HacsHttpCache
+    from .utils.connection_pool import HacsConnectionPools
+    from .utils.raw_cache import HacsRawCache
+    from .utils.tree_cache import HacsTreeCache
     from .validate.manager import ValidationManager
 
 
@@ -116,7 +143,9 @@ class HacsConfiguration:
     config: dict[str, Any] = field(default_factory=dict)
     config_entry: ConfigEntry | None = None
     country: str = "ALL"
+    data_bundle: bool = False
     debug: bool = False
+    dedicated_connections: bool = False
     dev: bool = False
     frontend_repo_url: str = ""
     frontend_repo: str = ""
@@ -201,6 +230,9 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    _full_name_index: PrefixIndex = field(default_factory=PrefixIndex)
+    _renamed_index: PrefixIndex = field(default_factory=PrefixIndex)
+    _renamed_index_source: int | None = None
 
     @property
     def list_all(self) -> list[HacsRepository]:
@@ -246,6 +278,8 @@ class HacsRepositories:
 
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
+        for key in self._index_keys(repository):
+            self._full_name_index.add(key, repo_id)
 
         if default:
             self.mark_default(repository)
@@ -268,6 +302,35 @@ class HacsRepositories:
 
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
+        for key in self._index_keys(repository):
+            self._full_name_index.remove(key, repo_id)
+
+    @staticmethod
+    def _index_keys(repository: HacsRepository) -> tuple[str, ...]:
+        """Return the prefix index keys for a repository."""
+        full_name = repository.data.full_name
+        return (full_name, full_name.split("/")[-1])
+
+    def search(self, prefix: str, limit: int = 10) -> list[HacsRepository]:
+        """Return repositories where the full name or name starts with prefix."""
+        return [
+            self._repositories_by_id[repo_id]
+            for repo_id in self._full_name_index.search(prefix, limit)
+            if repo_id in self._repositories_by_id
+        ]
+
+    def renamed_changed(self) -> None:
+        """Rebuild the renamed index on the next search, call it when the renamed map changes."""
+        self._renamed_index_source = None
+
+    def search_renamed(self, prefix: str, renamed: dict[str, str], limit: int = 10) -> list[str]:
+        """Return old full names from renamed that start with prefix."""
+        if self._renamed_index_source != id(renamed):
+            self._renamed_index.clear()
+            for old_name in renamed:
+                self._renamed_index.add(old_name, old_name)
+            self._renamed_index_source = id(renamed)
+        return self._renamed_index.search(prefix, limit)
 
     def mark_default(self, repository: HacsRepository) -> None:
         """Mark a repository as default."""
@@ -355,17 +418,21 @@ class HacsRepositories:
 class HacsBase:
     """Base HACS class."""
 
+    connection_pools: HacsConnectionPools | None = None
     data: HacsData | None = None
     data_client: HacsDataClient | None = None
     frontend_version: str | None = None
     github: GitHub | None = None
     githubapi: GitHubAPI | None = None
     hass: HomeAssistant | None = None
+    http_cache: HacsHttpCache | None = None
     integration: Integration | None = None
     queue: QueueManager | None = None
+    raw_cache: HacsRawCache | None = None
     repository: AIOGitHubAPIRepository | None = None
     session: ClientSession | None = None
     stage: HacsStage | None = None
+    tree_cache: HacsTreeCache | None = None
     validation: ValidationManager | None = None
     version: AwesomeVersion | None = None
 
@@ -376,10 +443,17 @@ class HacsBase:
         self.coordinators: dict[HacsCategory, HacsUpdateCoordinator] = {}
         self.core = HacsCore()
         self.log = LOGGER
+        self.concurrency = HacsConcurrency()
+        self.rate_limit = HacsRateLimit()
+        self.retry = HacsRetry()
+        self.single_flight = SingleFlight()
+        self.transfer_stats = TransferStats()
         self.recurring_tasks: list[Callable[[], None]] = []
         self.repositories = HacsRepositories()
         self.status = HacsStatus()
         self.system = HacsSystem()
+        self._queue_after_reset: Callable[[], None] | None = None
+        self._bulk_download_running = False
 
     @property
     def integration_dir(self) -> pathlib.Path:
@@ -460,26 +534,13 @@ class HacsBase:
 
         return await async_exists(self.hass, file_path)
 
-    async def async_can_update(self) -> int:
+    @callback
+    def async_can_update(
+        self,
+        priority: RateLimitPriority = RateLimitPriority.BACKGROUND,
+    ) -> int:
         """Helper to calculate the number of repositories we can fetch data for."""
-        try:
-            response = await self.async_github_api_method(self.githubapi.rate_limit)
-            if ((limit := response.data.resources.core.remaining or 0) - 1000) >= 10:
-                return math.floor((limit - 1000) / 10)
-            reset = dt.as_local(dt.utc_from_timestamp(response.data.resources.core.reset))
-            self.log.info(
-                "GitHub API ratelimited - %s remaining (%s)",
-                response.data.resources.core.remaining,
-                f"{reset.hour}:{reset.minute}:{reset.second}",
-            )
-            self.disable_hacs(HacsDisabledReason.RATE_LIMIT)
-        except (
-            # lgtm [py/catch-base-exception] pylint: disable=broad-except
-            BaseException
-        ) as exception:
-            self.log.exception(exception)
-
-        return 0
+        return self.rate_limit.available(priority=priority) // REPOSITORY_UPDATE_API_COST
 
     async def async_github_api_method(
         self,
@@ -488,16 +549,21 @@ class HacsBase:
         raise_exception: bool = True,
         **kwargs,
     ) -> TV | None:
-        """Call a GitHub API method"""
+        """Call a GitHub API method, sharing the call with identical concurrent calls."""
         _exception = None
 
         try:
-            return await method(*args, **kwargs)
+            return await self.single_flight.async_call(
+                call_key(method, args, kwargs), lambda: method(*args, **kwargs)
+            )
         except GitHubAuthenticationException as exception:
             self.disable_hacs(HacsDisabledReason.INVALID_TOKEN)
             _exception = exception
         except GitHubRatelimitException as exception:
-            self.disable_hacs(HacsDisabledReason.RATE_LIMIT)
+            self.log.warning(
+                "GitHub API rate limit reached, resets in %s seconds",
+                round(self.rate_limit.seconds_until_reset() or 0),
+            )
             _exception = exception
         except GitHubNotModifiedException as exception:
             raise exception
@@ -514,6 +580,36 @@ class HacsBase:
             raise HacsException(_exception)
         return None
 
+    async def async_preflight_repository(
+        self,
+        repository_full_name: str,
+        category: HacsCategory,
+    ) -> str:
+        """Check a repository with a single GraphQL query before registering it."""
+        try:
+            response = await self.githubapi.graphql(
+                query=PREFLIGHT_QUERY,
+                variables=preflight_variables(repository_full_name, category),
+            )
+        except GitHubGraphQLException as exception:
+            if "Could not resolve to a Repository" not in str(exception):
+                self.log.debug("Preflight for %s failed - %s", repository_full_name, exception)
+                return repository_full_name
+            result = None
+        except GitHubException as exception:
+            # The full registration will surface any real problem.
+            self.log.debug("Preflight for %s failed - %s", repository_full_name, exception)
+            return repository_full_name
+        else:
+            result = response.data["data"]["repository"]
+
+        full_name = preflight_repository(repository_full_name, category, result)
+        if full_name != repository_full_name:
+            self.log.info("%s has been renamed to %s", repository_full_name, full_name)
+            self.common.renamed_repositories[repository_full_name] = full_name
+            self.repositories.renamed_changed()
+        return full_name
+
     async def async_register_repository(
         self,
         repository_full_name: str,
@@ -523,6 +619,7 @@ class HacsBase:
         ref: str | None = None,
         repository_id: str | None = None,
         default: bool = False,
+        preflight: bool = False,
     ) -> None:
         """Register a repository."""
         if repository_full_name in self.common.skip:
@@ -548,6 +645,11 @@ class HacsBase:
         if (renamed := self.common.renamed_repositories.get(repository_full_name)) is not None:
             repository_full_name = renamed
 
+        if preflight:
+            repository_full_name = await self.async_preflight_repository(
+                repository_full_name, category
+            )
+
         repository: HacsRepository = REPOSITORY_CLASSES[category](self, repository_full_name)
         if check:
             try:
@@ -631,10 +733,13 @@ class HacsBase:
         )
 
         self.recurring_tasks.append(
-            async_track_time_interval(self.hass, self.async_check_rate_limit, timedelta(minutes=5))
+            async_track_time_interval(self.hass, self.async_process_queue, timedelta(minutes=10))
         )
+
         self.recurring_tasks.append(
-            async_track_time_interval(self.hass, self.async_process_queue, timedelta(minutes=10))
+            async_track_time_interval(
+                self.hass, self.async_prefetch_pending_updates, timedelta(minutes=30)
+            )
         )
 
         self.recurring_tasks.append(
@@ -654,6 +759,10 @@ class HacsBase:
         self.status.startup = False
         self.async_dispatch(HacsDispatchEvent.STATUS, {})
 
+        if self.configuration.data_bundle:
+            await self.data_client.async_prefetch_bundle(
+                [*self.common.categories, "removed", "critical"]
+            )
         await self.async_handle_removed_repositories()
         await self.async_get_all_category_repositories()
 
@@ -673,75 +782,237 @@ class HacsBase:
         headers: dict | None = None,
         keep_url: bool = False,
         nolog: bool = False,
-        handle_rate_limit: bool = False,
+        cache_key: str | None = None,
         **_,
     ) -> bytes | None:
-        """Download files, and return the content."""
+        """Download files, and return the content.
+
+        Pass cache_key for content that can not change (pinned to a tag or commit),
+        to serve it from the raw content cache.
+        """
         if url is None:
             return None
 
+        if cache_key is not None and self.raw_cache is not None:
+            if (content := await self.raw_cache.async_get(cache_key)) is not None:
+                self.log.debug("Using cached content for %s", url)
+                return content
+
         if not keep_url and "tags/" in url:
             url = url.replace("tags/", "")
 
+        return await self.single_flight.async_call(
+            f"download|{url}|{headers!r}|{cache_key}",
+            lambda: self._async_download_file(
+                url,
+                headers=headers,
+                nolog=nolog,
+                cache_key=cache_key,
+            ),
+        )
+
+    async def _async_download_file(
+        self,
+        url: str,
+        *,
+        headers: dict | None,
+        nolog: bool,
+        cache_key: str | None,
+    ) -> bytes | None:
+        """Download a file, failed attempts are retried by the session.
+
+        The body is decompressed by HACS, outside the event loop when it is large.
+        """
         self.log.debug("Trying to download %s", url)
-        attempt_count = 0
+        try:
+            request = await self.session.get(
+                url=url,
+                timeout=ClientTimeout(total=60),
+                headers={**(headers or {}), "Accept-Encoding": ACCEPT_ENCODING},
+                auto_decompress=False,
+            )
 
-        while attempt_count < 5:
-            try:
-                request = await self.session.get(
-                    url=url,
-                    timeout=ClientTimeout(total=60),
-                    headers=headers,
+            # Make sure that we got a valid result
+            if request.status == 200:
+                content = await async_read_decoded(request, self.transfer_stats)
+                if cache_key is not None and self.raw_cache is not None:
+                    await self.raw_cache.async_set(cache_key, content)
+                return content
+
+            raise HacsException(f"Got status code {request.status} when trying to download {url}")
+        except TimeoutError:
+            self.log.warning(
+                "A timeout of 60! seconds was encountered on every attempt to download %s, "
+                "using over 60 seconds to download a single file is not normal. "
+                "This is not a problem with HACS but how your host communicates with GitHub.",
+                url,
+            )
+
+        except (
+            # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            BaseException
+        ) as exception:
+            if not nolog:
+                self.log.exception("Download failed - %s", exception)
+
+        return None
+
+    async def async_download_repositories(
+        self,
+        repositories: list[HacsRepository],
+    ) -> dict[str, str]:
+        """Download several repositories as one plan.
+
+        Repository information is refreshed once per repository before the
+        downloads start, downloads run with bounded concurrency, and reloads,
+        entity recreation and the store write are done once at the end.
+        Returns the IDs of the repositories that failed, with the reason.
+        """
+        if self._bulk_download_running:
+            raise HacsExecutionStillInProgress("A bulk download is already running")
+
+        failed: dict[str, str] = {}
+        reloads: dict[str, Callable[[], Awaitable[None]]] = {}
+        completed = 0
+        semaphore = asyncio.Semaphore(DEFAULT_BULK_CONCURRENT_TASKS)
+        was_installed = {
+            repository.data.id: repository.data.installed for repository in repositories
+        }
+
+        def _handle_result(repository: HacsRepository, exception: Exception | None) -> None:
+            nonlocal completed
+            if exception is not None:
+                repository.logger.error("%s %s", repository.string, exception)
+                failed[repository.data.id] = str(exception) or type(exception).__name__
+            completed += 1
+            self.async_dispatch(
+                HacsDispatchEvent.BULK_PROGRESS,
+                {
+                    "action": "download",
+                    "completed": completed,
+                    "failed": len(failed),
+                    "repository": repository.data.full_name,
+                    "total": len(repositories),
+                },
+            )
+
+        async def _refresh(repository: HacsRepository) -> None:
+            async with semaphore:
+                try:
+                    await repository.update_repository(force=True)
+                except Exception as exception:  # pylint: disable=broad-except
+                    _handle_result(repository, exception)
+
+        async def _download(repository: HacsRepository) -> None:
+            async with semaphore:
+                try:
+                    await repository.async_download_repository(refresh=False, reloads=reloads)
+                except Exception as exception:  # pylint: disable=broad-except
+                    _handle_result(repository, exception)
+                else:
+                    _handle_result(repository, None)
+
+        self._bulk_download_running = True
+        try:
+            async with self.single_flight.async_cycle():
+                await asyncio.gather(*(_refresh(repository) for repository in repositories))
+                await asyncio.gather(
+                    *(
+                        _download(repository)
+                        for repository in repositories
+                        if repository.data.id not in failed
+                    )
                 )
+            for reload in reloads.values():
+                await reload()
+        finally:
+            self._bulk_download_running = False
+
+        if any(
+            repository.data.installed and not was_installed[repository.data.id]
+            for repository in repositories
+        ):
+            self.async_dispatch(HacsDispatchEvent.RELOAD, {"force": True})
+            await self.async_recreate_entities()
+
+        await self.data.async_write()
+        for category in {repository.data.category for repository in repositories}:
+            if coordinator := self.coordinators.get(category):
+                coordinator.async_update_listeners()
 
-                # Make sure that we got a valid result
-                if request.status == 200:
-                    return await request.read()
+        return failed
 
-                # Handle rate-limits
-                if handle_rate_limit and request.status == 429:
-                    try:
-                        header = int(request.headers.get("retry-after") or 10)
-                    except (ValueError, TypeError):
-                        header = 10
-                    retry_after = min(header, 60)  # Limit to 60 seconds
+    async def async_refresh_repositories(
+        self,
+        repositories: list[HacsRepository],
+    ) -> dict[str, Any]:
+        """Refresh several repositories within the current GitHub API budget.
+
+        Repositories that do not fit in the budget are added to the queue,
+        which is processed when the rate limit allows it.
+        """
+        result = {
+            "estimated_api_calls": len(repositories) * REPOSITORY_UPDATE_API_COST,
+            "failed": {},
+            "queued": [],
+            "refreshed": [],
+        }
+        if not repositories:
+            return result
 
-                    self.log.warning(
-                        "GitHub has imposed a ratelimit on the request for %s, "
-                        "retrying after %s seconds",
-                        url,
-                        retry_after,
+        can_update = self.rate_limit.consume_estimate(
+            REPOSITORY_UPDATE_API_COST,
+            count=len(repositories),
+            priority=RateLimitPriority.USER,
+        )
+        scheduled = repositories[:can_update]
+        completed = 0
+        semaphore = asyncio.Semaphore(DEFAULT_BULK_CONCURRENT_TASKS)
+
+        async def _refresh(repository: HacsRepository) -> None:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    await repository.update_repository(ignore_issues=True, force=True)
+                except Exception as exception:  # pylint: disable=broad-except
+                    repository.logger.error("%s %s", repository.string, exception)
+                    result["failed"][repository.data.id] = (
+                        str(exception) or type(exception).__name__
                     )
-                    attempt_count += 1
-                    await asyncio.sleep(retry_after)
-                    continue
+                else:
+                    result["refreshed"].append(repository.data.id)
+            completed += 1
+            self.async_dispatch(
+                HacsDispatchEvent.BULK_PROGRESS,
+                {
+                    "action": "refresh",
+                    "completed": completed,
+                    "failed": len(result["failed"]),
+                    "repository": repository.data.full_name,
+                    "total": len(scheduled),
+                },
+            )
 
-                raise HacsException(
-                    f"Got status code {request.status} when trying to download {url}"
-                )
-            except TimeoutError:
-                self.log.warning(
-                    "A timeout of 60! seconds was encountered while downloading %s, "
-                    "using over 60 seconds to download a single file is not normal. "
-                    "This is not a problem with HACS but how your host communicates with GitHub. "
-                    "Retrying up to 5 times to mask/hide your host/network problems to "
-                    "stop the flow of issues opened about it. "
-                    "Tries left %s",
-                    url,
-                    (4 - attempt_count),
-                )
-                attempt_count += 1
-                await asyncio.sleep(1)
-                continue
+        async with self.single_flight.async_cycle():
+            await asyncio.gather(*(_refresh(repository) for repository in scheduled))
 
-            except (
-                # lgtm [py/catch-base-exception] pylint: disable=broad-except
-                BaseException
-            ) as exception:
-                if not nolog:
-                    self.log.exception("Download failed - %s", exception)
+        for repository in repositories[can_update:]:
+            self.queue.add(repository.update_repository(ignore_issues=True, force=True))
+            result["queued"].append(repository.data.id)
 
-            return None
+        if result["queued"]:
+            self.log.info(
+                "GitHub API budget allows refreshing %s repositories now, %s are queued",
+                len(scheduled),
+                len(result["queued"]),
+            )
+
+        await self.data.async_write()
+        for category in {repository.data.category for repository in scheduled}:
+            if coordinator := self.coordinators.get(category):
+                coordinator.async_update_listeners()
+
+        return result
 
     async def async_recreate_entities(self) -> None:
         """Recreate entities."""
@@ -897,17 +1168,30 @@ class HacsBase:
         self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
         self.coordinators[category].async_update_listeners()
 
-    async def async_check_rate_limit(self, _=None) -> None:
-        """Check rate limit."""
-        if not self.system.disabled or self.system.disabled_reason != HacsDisabledReason.RATE_LIMIT:
+    @callback
+    def async_schedule_queue_after_reset(self) -> None:
+        """Process the queue again when the GitHub API rate limit resets.
+
+        Only one run is scheduled, a new reset time replaces the previous one.
+        """
+        if (delay := self.rate_limit.seconds_until_reset()) is None:
             return
+        self.async_cancel_queue_after_reset()
+
+        @callback
+        def _process_queue(_) -> None:
+            self._queue_after_reset = None
+            self.hass.async_create_task(self.async_process_queue())
 
-        self.log.debug("Checking if ratelimit has lifted")
-        can_update = await self.async_can_update()
-        self.log.debug("Ratelimit indicate we can update %s", can_update)
-        if can_update > 0:
-            self.enable_hacs()
-            await self.async_process_queue()
+        self.log.info("GitHub API budget is used, the queue continues in %s seconds", round(delay))
+        self._queue_after_reset = async_call_later(self.hass, delay + 1, _process_queue)
+
+    @callback
+    def async_cancel_queue_after_reset(self) -> None:
+        """Cancel the scheduled queue run."""
+        if self._queue_after_reset is not None:
+            self._queue_after_reset()
+            self._queue_after_reset = None
 
     async def async_process_queue(self, _=None) -> None:
         """Process the queue."""
@@ -922,24 +1206,68 @@ class HacsBase:
             return
 
         async def _handle_queue():
-            if not self.queue.has_pending_tasks:
-                await self.data.async_write()
-                return
-            can_update = await self.async_can_update()
-            self.log.debug(
-                "Can update %s repositories, items in queue %s",
-                can_update,
-                self.queue.pending_tasks,
-            )
-            if can_update != 0:
+            while self.queue.has_pending_tasks:
+                # When the budget does not cover the queue, the updates are
+                # spread over the time until the rate limit resets
+                delay = self.rate_limit.pacing_delay(
+                    REPOSITORY_UPDATE_API_COST, self.queue.pending_tasks
+                )
+                can_update = self.rate_limit.consume_estimate(
+                    REPOSITORY_UPDATE_API_COST,
+                    count=1 if delay else self.queue.pending_tasks,
+                )
+                self.log.debug(
+                    "Can update %s repositories, items in queue %s",
+                    can_update,
+                    self.queue.pending_tasks,
+                )
+                if can_update == 0:
+                    self.async_schedule_queue_after_reset()
+                    return
+
                 try:
                     await self.queue.execute(can_update)
                 except HacsExecutionStillInProgress:
                     return
 
-                await _handle_queue()
+                if delay and self.queue.has_pending_tasks:
+                    await asyncio.sleep(delay)
+
+            await self.data.async_write()
+            # The queue is drained, use the idle period to warm pending updates
+            await self.async_prefetch_pending_updates()
+
+        async with self.single_flight.async_cycle():
+            await _handle_queue()
 
-        await _handle_queue()
+    async def async_prefetch_pending_updates(self, _=None) -> None:
+        """Warm the update dialog of repositories with a pending update.
+
+        This has the lowest priority, it only runs while the queue is idle
+        and within the GitHub API budget that is left for background work.
+        It runs when the queue is drained, and on a timer for when nothing was queued.
+        """
+        if self.system.disabled or self.queue.running or self.queue.has_pending_tasks:
+            return
+        repositories = [
+            repository
+            for repository in self.repositories.list_downloaded
+            if repository.pending_update
+            and repository.prefetched_version != repository.display_available_version
+        ]
+        if not repositories:
+            return
+
+        can_prefetch = self.rate_limit.consume_estimate(PREFETCH_API_COST, count=len(repositories))
+        self.log.debug("Can prefetch %s of %s pending updates", can_prefetch, len(repositories))
+        for repository in repositories[:can_prefetch]:
+            if self.queue.running or self.queue.has_pending_tasks:
+                # Other work came in, continue with the next idle period
+                return
+            try:
+                await repository.async_prefetch_pending_update()
+            except HacsException as exception:
+                repository.logger.debug("%s Prefetch failed: %s", repository.string, exception)
 
     async def async_handle_removed_repositories(self, _=None) -> None:
         """Handle removed repositories."""
@@ -992,6 +1320,45 @@ class HacsBase:
         if need_to_save:
             await self.data.async_write()
 
+    async def async_refresh_repository_metadata(
+        self,
+        repositories: list[HacsRepository],
+    ) -> list[HacsRepository]:
+        """Refresh repository metadata in batches, return the repositories that need a full update.
+
+        Repositories where the default branch head and releases have not moved only get
+        their metadata updated. Batches that can not be fetched are returned as a whole.
+        """
+        moved = []
+        for start in range(0, len(repositories), METADATA_BATCH_SIZE):
+            batch = repositories[start : start + METADATA_BATCH_SIZE]
+            if not self.rate_limit.consume_estimate(1, resource="graphql"):
+                moved.extend(batch)
+                continue
+            try:
+                response = await self.githubapi.graphql(
+                    query=metadata_query(len(batch)),
+                    variables=metadata_variables(x.data.full_name for x in batch),
+                )
+            except GitHubException as exception:
+                self.log.debug("Could not fetch repository metadata - %s", exception)
+                moved.extend(batch)
+                continue
+
+            for idx, repository in enumerate(batch):
+                metadata = parse_metadata(response.data["data"].get(f"r{idx}"))
+                if metadata_moved(repository.data, metadata):
+                    moved.append(repository)
+                    continue
+                repository.data.update_data(
+                    {key: metadata[key] for key in METADATA_FIELDS},
+                    action=self.system.action,
+                )
+                repository.data.last_fetched = dt.utcnow()
+
+        self.log.debug("%s of %s repositories need a full update", len(moved), len(repositories))
+        return moved
+
     async def async_update_downloaded_custom_repositories(self, _=None) -> None:
         """Execute the task."""
         if self.system.disabled:
@@ -1009,13 +1376,19 @@ class HacsBase:
             if not repositories_to_update:
                 repositories_updated.set()
 
-        for repository in self.repositories.list_downloaded:
-            if (
-                repository.data.category in self.common.categories
+        repositories = await self.async_refresh_repository_metadata(
+            [
+                repository
+                for repository in self.repositories.list_downloaded
+                if repository.data.category in self.common.categories
                 and not self.repositories.is_default(repository.data.id)
-            ):
-                repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+            ]
+        )
+        for repository in repositories:
+            repositories_to_update += 1
+            self.queue.add(update_repository(repository))
+        if not repositories_to_update:
+            repositories_updated.set()
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
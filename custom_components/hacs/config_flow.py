@@ -27,6 +27,8 @@ from .const import CLIENT_ID, DOMAIN, LOCALE, MINIMUM_HA_VERSION
 from .utils.configuration_schema import (
     APPDAEMON,
     COUNTRY,
+    DATA_BUNDLE,
+    DEDICATED_CONNECTIONS,
     SIDEPANEL_ICON,
     SIDEPANEL_TITLE,
 )
@@ -220,6 +222,10 @@ class HacsOptionsFlowHandler(OptionsFlow):
             vol.Optional(SIDEPANEL_ICON, default=hacs.configuration.sidepanel_icon): str,
             vol.Optional(COUNTRY, default=hacs.configuration.country): vol.In(LOCALE),
             vol.Optional(APPDAEMON, default=hacs.configuration.appdaemon): bool,
+            vol.Optional(
+                DEDICATED_CONNECTIONS, default=hacs.configuration.dedicated_connections
+            ): bool,
+            vol.Optional(DATA_BUNDLE, default=hacs.configuration.data_bundle): bool,
         }
 
         return self.async_show_form(step_id="user", data_schema=vol.Schema(schema))
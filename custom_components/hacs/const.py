@@ -15,8 +15,60 @@ TV = TypeVar("TV")
 
 PACKAGE_NAME = "custom_components.hacs"
 
+# Initial and highest number of concurrent requests per host, adjusted from the responses
+CONCURRENCY_INITIAL = 10
+CONCURRENCY_MAX = 50
 DEFAULT_CONCURRENT_TASKS = 15
-DEFAULT_CONCURRENT_BACKOFF_TIME = 1
+DEFAULT_BULK_CONCURRENT_TASKS = 4
+
+# Rough number of GitHub API calls used to update a single repository
+REPOSITORY_UPDATE_API_COST = 10
+# Rough number of GitHub API calls used to prefetch a pending update
+PREFETCH_API_COST = 2
+# GitHub API calls to keep in reserve when deciding how much can be updated
+RATE_LIMIT_RESERVE = 1000
+
+# Size bound (compressed) and save delay (seconds) for the GitHub API response cache
+HTTP_CACHE_MAX_SIZE = 8 * 1024 * 1024
+HTTP_CACHE_SAVE_DELAY = 300
+# Size bound and save delay (seconds) for pinned raw.githubusercontent.com files
+RAW_CACHE_MAX_SIZE = 64 * 1024 * 1024
+RAW_CACHE_SAVE_DELAY = 300
+# Save delay (seconds) for the data-v2 ETags and payloads
+DATA_CLIENT_SAVE_DELAY = 300
+# Patches applied in a row before the whole data-v2 file is downloaded instead
+DATA_PATCH_MAX_CHAIN = 5
+# Size bound for recursive git trees, cached by tree SHA
+TREE_CACHE_MAX_SIZE = 32 * 1024 * 1024
+# Repository size (KB, as reported by GitHub) above which only the subtrees a category needs
+# are fetched, instead of the whole recursive tree
+TREE_TARGETED_MIN_SIZE = 50 * 1024
+
+# Connection limit per upstream host for the optional HACS owned connection pools,
+# and how long (seconds) idle connections are kept alive and resolved hosts are cached
+CONNECTION_POOL_LIMITS = {
+    "api.github.com": 20,
+    "raw.githubusercontent.com": 20,
+    "github.com": 10,
+    "objects.githubusercontent.com": 10,
+    "data-v2.hacs.xyz": 5,
+}
+CONNECTION_POOL_KEEPALIVE = 60
+CONNECTION_POOL_DNS_TTL = 300
+
+# Number of repositories fetched in a single GraphQL metadata query
+METADATA_BATCH_SIZE = 25
+
+# Seconds a result is reused for identical requests within a refresh cycle
+SINGLE_FLIGHT_MEMO_TTL = 30
+
+# Attempts and backoff (seconds) for failed idempotent requests
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 60
+# Consecutive failures before requests to a host are stopped, and for how long (seconds)
+CIRCUIT_BREAKER_THRESHOLD = 10
+CIRCUIT_BREAKER_COOLDOWN = 30
 
 HACS_REPOSITORY_ID = "172733314"
 
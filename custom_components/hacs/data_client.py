@@ -3,49 +3,211 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
+import json
+import time
 from typing import Any
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientError, ClientResponse, ClientSession, ClientTimeout, hdrs
+from homeassistant.helpers.storage import Store
 import voluptuous as vol
 
+from .const import DATA_CLIENT_SAVE_DELAY, DATA_PATCH_MAX_CHAIN
 from .exceptions import HacsException, HacsNotModifiedException
+from .utils.compression import ACCEPT_ENCODING, Decompressor, TransferStats, async_read_decoded
+from .utils.data_patch import data_version, is_patch
+from .utils.json_stream import JsonStream
 from .utils.logger import LOGGER
+from .utils.single_flight import SingleFlight
 from .utils.validate import (
-    VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
-    VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
-    VALIDATE_FETCHED_V2_REPO_DATA,
+    COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    COMPILED_FETCHED_V2_REPO_DATA,
 )
 
 CRITICAL_REMOVED_VALIDATORS = {
-    "critical": VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
-    "removed": VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    "critical": COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    "removed": COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA,
 }
 
+# Chunks read from the response, and the amount parsed per executor job
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_BATCH_SIZE = 512 * 1024
+
+
+def _entry_validator(section: str | None) -> Callable[[str | None, Any], Any | None]:
+    """Return the validator for the entries of a section, it returns None for invalid entries."""
+    if section in COMPILED_FETCHED_V2_REPO_DATA:
+        schema = COMPILED_FETCHED_V2_REPO_DATA[section]
+
+        def _validate_repository(key: str | None, repo_data: Any) -> Any | None:
+            try:
+                return schema(repo_data)
+            except vol.Invalid as exception:
+                LOGGER.info(
+                    "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
+                )
+                return None
+
+        return _validate_repository
+
+    if not (validator := CRITICAL_REMOVED_VALIDATORS.get(section)):
+        raise ValueError(f"Do not know how to validate {section}")
+
+    def _validate_item(_: str | None, repo_data: Any) -> Any | None:
+        try:
+            return validator(repo_data)
+        except vol.Invalid as exception:
+            LOGGER.info("Got invalid data for %s (%s)", section, exception)
+            return None
+
+    return _validate_item
+
+
+def _endpoint(filename: str, section: str | None) -> str:
+    """Return the endpoint of a file."""
+    return "/".join([v for v in [section, filename] if v is not None])
+
 
 class HacsDataClient:
-    """HACS Data client."""
+    """HACS Data client.
+
+    With a store, the ETag and the validated payload of every section are kept
+    across restarts. The first request after a restart is then conditional, and
+    a 304 response returns the stored payload once, later 304 responses raise
+    HacsNotModifiedException as usual.
+
+    With delta enabled, category data is updated from the patch published for
+    the version of the data the client has, only the changed entries are
+    downloaded then. When there is no patch for that version the whole file
+    is downloaded.
 
-    def __init__(self, session: ClientSession, client_name: str) -> None:
+    The data of several sections can be fetched with one request for the
+    bundle, the next get_data call for those sections uses it.
+
+    Responses are requested with the encodings that can be decoded, and are
+    decompressed and parsed outside the event loop when they are large.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        client_name: str,
+        single_flight: SingleFlight | None = None,
+        store: Store | None = None,
+        delta: bool = False,
+        transfer_stats: TransferStats | None = None,
+    ) -> None:
         """Initialize."""
         self._client_name = client_name
+        self._delta = delta
+        self._missing_patches: set[str] = set()
         self._etags = {}
         self._session = session
+        self._single_flight = single_flight or SingleFlight()
+        self._store = store
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._restored: set[str] = set()
+        self._dirty = False
+        self._bundle_etag: str | None = None
+        self._bundle_sections: dict[str, str] = {}
+        self._bundled: dict[str, Any] = {}
+        self._transfer_stats = transfer_stats or TransferStats()
+
+    async def async_load(self) -> None:
+        """Restore the ETags and payloads stored by the previous run."""
+        if self._store is None:
+            return
+        stored = await self._store.async_load() or {}
+        for endpoint, entry in stored.get("sections", {}).items():
+            self._stored[endpoint] = entry
+            self._restored.add(endpoint)
+            if entry["etag"] is not None:
+                self._etags[endpoint] = entry["etag"]
+            if (bundle_etag := entry.get("bundle_etag")) is not None:
+                self._bundle_sections[endpoint] = bundle_etag
+        self._bundle_etag = stored.get("bundle_etag")
+
+    async def async_save(self) -> None:
+        """Save the ETags and payloads if they have changed."""
+        if self._store is not None and self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._dirty = False
+        # An unchanged bundle is only trusted when every section of it is stored
+        bundle_stored = all(
+            self._stored.get(endpoint, {}).get("bundle_etag") == etag
+            for endpoint, etag in self._bundle_sections.items()
+        )
+        return {
+            "bundle_etag": self._bundle_etag if bundle_stored else None,
+            "sections": self._stored,
+        }
+
+    def _store_payload(
+        self,
+        endpoint: str,
+        payload: Any,
+        version: str | None = None,
+        *,
+        bundle_etag: str | None = None,
+    ) -> None:
+        """Store the validated payload of an endpoint with its ETag, and the version for delta.
+
+        A payload from the bundle is stored with the ETag of its section in the bundle,
+        that one is only sent with the bundle request. It is kept when the endpoint
+        is requested on its own and returns the same payload.
+        """
+        etag = self._etags.get(endpoint)
+        previous = self._stored.get(endpoint, {})
+        if bundle_etag is None and previous.get("bundle_etag") is not None:
+            if previous["data"] == payload:
+                bundle_etag = previous["bundle_etag"]
+            else:
+                self._bundle_sections.pop(endpoint, None)
+        if (self._store is None and version is None) or (etag is None and bundle_etag is None):
+            return
+        self._stored[endpoint] = {"etag": etag, "data": payload}
+        if version is not None:
+            self._stored[endpoint]["version"] = version
+        if bundle_etag is not None:
+            self._stored[endpoint]["bundle_etag"] = bundle_etag
+        if self._store is not None:
+            self._dirty = True
+            self._store.async_delay_save(self._data_to_save, DATA_CLIENT_SAVE_DELAY)
 
     async def _do_request(
         self,
         filename: str,
         section: str | None = None,
+        validator: Callable[[str | None, Any], Any | None] | None = None,
+    ) -> dict[str, dict[str, Any]] | list[str]:
+        """Do request, concurrent requests for the same endpoint share one call."""
+        endpoint = _endpoint(filename, section)
+        key = f"data|{endpoint}" if validator is None else f"data|{endpoint}|validated"
+        # Not memoized, callers rely on a repeated request raising HacsNotModifiedException
+        return await self._single_flight.async_call(
+            key, lambda: self._async_fetch(endpoint, validator), memo=False
+        )
+
+    async def _async_fetch(
+        self,
+        endpoint: str,
+        validator: Callable[[str | None, Any], Any | None] | None = None,
     ) -> dict[str, dict[str, Any]] | list[str]:
-        """Do request."""
-        endpoint = "/".join([v for v in [section, filename] if v is not None])
+        """Fetch an endpoint, validating every entry when a validator is passed."""
         try:
             response = await self._session.get(
                 f"https://data-v2.hacs.xyz/{endpoint}",
                 timeout=ClientTimeout(total=60),
                 headers={
                     "User-Agent": self._client_name,
+                    "Accept-Encoding": ACCEPT_ENCODING,
                     "If-None-Match": self._etags.get(endpoint, ""),
                 },
+                auto_decompress=False,
             )
             if response.status == 304:
                 raise HacsNotModifiedException() from None
@@ -59,39 +221,283 @@ class HacsDataClient:
 
         self._etags[endpoint] = response.headers.get("etag")
 
-        return await response.json()
+        try:
+            if validator is None:
+                return await self._async_read(response, json.loads)
+            return await self._async_read_validated(response, validator)
+        except TimeoutError:
+            raise HacsException("Timeout of 60s reached") from None
+        except (ClientError, ValueError) as exception:
+            raise HacsException(f"Error fetching data from HACS: {exception}") from exception
 
-    async def get_data(self, section: str | None, *, validate: bool) -> dict[str, dict[str, Any]]:
-        """Get data."""
-        data = await self._do_request(filename="data.json", section=section)
-        if not validate:
+    async def _async_read(
+        self, response: ClientResponse, decode: Callable[[bytes], Any] | None = None
+    ) -> Any:
+        """Return the decompressed body, passed to decode if given."""
+        return await async_read_decoded(response, self._transfer_stats, decode)
+
+    async def _async_read_validated(
+        self,
+        response: ClientResponse,
+        validator: Callable[[str | None, Any], Any | None],
+    ) -> dict[str, dict[str, Any]] | list[Any]:
+        """Read the response incrementally, and validate every entry as it completes.
+
+        Decompression, parsing and validation run in the executor, so the event loop
+        is not blocked while a large category arrives, and only the validated entries
+        are kept.
+        """
+        loop = asyncio.get_running_loop()
+        stream = JsonStream()
+        entries: list[tuple[str | None, Any]] = []
+        decompressor = Decompressor(response.headers.get(hdrs.CONTENT_ENCODING))
+        transferred = decoded = 0
+        loop_time = executor_time = 0.0
+
+        def _process(members: list[tuple[str | None, Any]]) -> None:
+            for key, value in members:
+                if (validated := validator(key, value)) is not None:
+                    entries.append((key, validated))
+
+        def _feed(chunk: bytes, final: bool) -> tuple[int, float]:
+            started = time.perf_counter()
+            data = decompressor.decompress(chunk)
+            if final:
+                data += decompressor.flush()
+            _process(stream.feed(data))
+            if final:
+                stream.close()
+            return len(data), time.perf_counter() - started
+
+        batch = bytearray()
+
+        async def _feed_batch(final: bool) -> None:
+            nonlocal decoded, executor_time
+            size, elapsed = await loop.run_in_executor(None, _feed, bytes(batch), final)
+            batch.clear()
+            decoded += size
+            executor_time += elapsed
+
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            started = time.perf_counter()
+            transferred += len(chunk)
+            batch += chunk
+            loop_time += time.perf_counter() - started
+            if len(batch) >= STREAM_BATCH_SIZE:
+                await _feed_batch(False)
+        await _feed_batch(True)
+        self._transfer_stats.add(
+            decompressor.encoding,
+            transferred,
+            decoded,
+            loop_time=loop_time,
+            executor_time=executor_time,
+        )
+
+        if stream.is_array:
+            return [value for _, value in entries]
+        return dict(entries)
+
+    async def _async_get_patch(
+        self, section: str, endpoint: str, version: str
+    ) -> dict[str, Any] | None:
+        """Return the patch published for a version of the data, None without one."""
+        if version in self._missing_patches:
+            return None
+        try:
+            response = await self._session.get(
+                f"https://data-v2.hacs.xyz/{section}/patch/{version}.json",
+                timeout=ClientTimeout(total=60),
+                headers={"User-Agent": self._client_name, "Accept-Encoding": ACCEPT_ENCODING},
+                auto_decompress=False,
+            )
+            if response.status == 404:
+                self._missing_patches.add(version)
+                return None
+            response.raise_for_status()
+            patch = await self._async_read(response, json.loads)
+        except Exception as exception:  # pylint: disable=broad-except
+            LOGGER.debug("Could not get the patch for %s (%s)", endpoint, exception)
+            return None
+        if not is_patch(patch):
+            LOGGER.debug("Got an invalid patch for %s", endpoint)
+            self._missing_patches.add(version)
+            return None
+        return patch
+
+    async def _async_get_patched(
+        self,
+        section: str,
+        endpoint: str,
+        validator: Callable[[str | None, Any], Any | None],
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return the data updated with the patches for the stored version, None without a patch.
+
+        Only the patch for the latest version is empty, the patches of older versions
+        are followed until it is reached. The whole file is used when that fails.
+        """
+        stored = self._stored.get(endpoint)
+        if not stored or not (version := stored.get("version")):
+            return None
+        data: dict[str, dict[str, Any]] = stored["data"]
+        loop = asyncio.get_running_loop()
+
+        def _apply(
+            data: dict[str, dict[str, Any]], patch: dict[str, Any]
+        ) -> dict[str, dict[str, Any]]:
+            data = dict(data)
+            for key in patch["remove"]:
+                data.pop(key, None)
+            for key, value in patch["upsert"].items():
+                if (validated := validator(key, value)) is None:
+                    data.pop(key, None)
+                else:
+                    data[key] = validated
             return data
 
-        if section in VALIDATE_FETCHED_V2_REPO_DATA:
+        for _ in range(DATA_PATCH_MAX_CHAIN):
+            if (patch := await self._async_get_patch(section, endpoint, version)) is None:
+                return None
+            if patch["version"] == version:
+                break
+            data = await loop.run_in_executor(None, _apply, data, patch)
+            version = patch["version"]
+        else:
+            LOGGER.debug("Too many patches for %s", endpoint)
+            return None
+
+        if version == stored["version"]:
+            raise HacsNotModifiedException()
+        self._store_payload(endpoint, data, version)
+        return data
+
+    async def async_prefetch_bundle(self, sections: Iterable[str]) -> None:
+        """Fetch the data of the sections with a single request.
+
+        Every section in the bundle has its own ETag, sections that did not
+        change since the last bundle are not modified. Sections that are missing,
+        or the whole bundle if the request fails, use their own request.
+        """
+        sections = set(sections)
+        self._bundled = {}
+        try:
+            response = await self._session.get(
+                "https://data-v2.hacs.xyz/bundle.json",
+                timeout=ClientTimeout(total=60),
+                headers={
+                    "User-Agent": self._client_name,
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                    "If-None-Match": self._bundle_etag or "",
+                },
+                auto_decompress=False,
+            )
+            if response.status == 304:
+                endpoints = (_endpoint("data.json", section) for section in sections)
+                self._bundled = {
+                    endpoint: None for endpoint in endpoints if endpoint in self._bundle_sections
+                }
+                return
+            response.raise_for_status()
+            content = await self._async_read(response)
+        except Exception as exception:  # pylint: disable=broad-except
+            LOGGER.debug("Could not get the data bundle (%s)", exception)
+            return
+
+        def _validate() -> dict[str, tuple[str, Any]]:
+            bundle = json.loads(content)
             validated = {}
-            for key, repo_data in data.items():
-                try:
-                    validated[key] = VALIDATE_FETCHED_V2_REPO_DATA[section](repo_data)
-                except vol.Invalid as exception:
-                    LOGGER.info(
-                        "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
-                    )
+            for section, entry in bundle["sections"].items():
+                if section not in sections or not isinstance(entry.get("etag"), str):
                     continue
-
+                endpoint = _endpoint("data.json", section)
+                if entry["etag"] == self._bundle_sections.get(endpoint):
+                    validated[endpoint] = (entry["etag"], None)
+                elif "data" in entry:
+                    validator = _entry_validator(section)
+                    data = entry["data"]
+                    if isinstance(data, dict):
+                        result = {}
+                        for key, value in data.items():
+                            if (item := validator(key, value)) is not None:
+                                result[key] = item
+                    else:
+                        result = [
+                            item for value in data if (item := validator(None, value)) is not None
+                        ]
+                    validated[endpoint] = (entry["etag"], result)
             return validated
 
-        if not (validator := CRITICAL_REMOVED_VALIDATORS.get(section)):
-            raise ValueError(f"Do not know how to validate {section}")
+        try:
+            validated = await asyncio.get_running_loop().run_in_executor(None, _validate)
+        except (AttributeError, KeyError, TypeError, ValueError) as exception:
+            LOGGER.debug("Got an invalid data bundle (%s)", exception)
+            return
 
-        validated = []
-        for repo_data in data:
-            try:
-                validated.append(validator(repo_data))
-            except vol.Invalid as exception:
-                LOGGER.info("Got invalid data for %s (%s)", section, exception)
-                continue
+        self._bundle_etag = response.headers.get("etag")
+        for endpoint, (etag, data) in validated.items():
+            self._bundle_sections[endpoint] = etag
+            self._bundled[endpoint] = data
 
-        return validated
+    async def get_data(self, section: str | None, *, validate: bool) -> dict[str, dict[str, Any]]:
+        """Get data."""
+        endpoint = _endpoint("data.json", section)
+        validator = _entry_validator(section) if validate else None
+        if validate and endpoint in self._bundled:
+            if (data := self._bundled.pop(endpoint)) is None:
+                if endpoint not in self._restored:
+                    raise HacsNotModifiedException()
+                # Validated before it was stored
+                self._restored.discard(endpoint)
+                return self._stored[endpoint]["data"]
+            self._restored.discard(endpoint)
+            # The ETag of the previous payload of the endpoint no longer matches it
+            self._etags.pop(endpoint, None)
+            await self._async_store_validated(
+                section, endpoint, data, bundle_etag=self._bundle_sections[endpoint]
+            )
+            return data
+        try:
+            data = None
+            if self._delta and validate and section in COMPILED_FETCHED_V2_REPO_DATA:
+                data = await self._single_flight.async_call(
+                    f"data|{endpoint}|patched",
+                    lambda: self._async_get_patched(section, endpoint, validator),
+                    memo=False,
+                )
+            if data is not None:
+                self._restored.discard(endpoint)
+                return data
+            data = await self._do_request(
+                filename="data.json", section=section, validator=validator
+            )
+        except HacsNotModifiedException:
+            if not validate or endpoint not in self._restored:
+                raise
+            # Validated before it was stored
+            self._restored.discard(endpoint)
+            return self._stored[endpoint]["data"]
+        self._restored.discard(endpoint)
+        if validate:
+            await self._async_store_validated(section, endpoint, data)
+        return data
+
+    async def _async_store_validated(
+        self,
+        section: str | None,
+        endpoint: str,
+        data: dict[str, dict[str, Any]] | list[Any],
+        *,
+        bundle_etag: str | None = None,
+    ) -> None:
+        """Store validated data, with the version when the section is updated with patches."""
+        version = None
+        if (
+            self._delta
+            and section in COMPILED_FETCHED_V2_REPO_DATA
+            and (bundle_etag is not None or self._etags.get(endpoint))
+        ):
+            version = await asyncio.get_running_loop().run_in_executor(None, data_version, data)
+        self._store_payload(endpoint, data, version, bundle_etag=bundle_etag)
 
     async def get_repositories(self, section: str) -> list[str]:
         """Get repositories."""
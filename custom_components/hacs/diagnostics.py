@@ -46,7 +46,9 @@ async def async_get_config_entry_diagnostics(
     for key in (
         "appdaemon",
         "country",
+        "data_bundle",
         "debug",
+        "dedicated_connections",
         "dev",
         "python_script",
         "release_limit",
@@ -71,6 +73,19 @@ async def async_get_config_entry_diagnostics(
             }
         )
 
+    data["concurrency"] = hacs.concurrency.stats
+    data["retry"] = hacs.retry.stats
+    data["single_flight"] = hacs.single_flight.stats
+    data["transfer"] = hacs.transfer_stats.stats
+    if hacs.connection_pools is not None:
+        data["connection_pools"] = hacs.connection_pools.stats
+    if hacs.http_cache is not None:
+        data["http_cache"] = hacs.http_cache.stats
+    if hacs.raw_cache is not None:
+        data["raw_cache"] = hacs.raw_cache.stats
+    if hacs.tree_cache is not None:
+        data["tree_cache"] = hacs.tree_cache.stats
+
     try:
         rate_limit_response = await hacs.githubapi.rate_limit()
         data["rate_limit"] = rate_limit_response.data.as_dict
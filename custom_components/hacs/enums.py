@@ -26,11 +26,13 @@ class HacsCategory(StrEnum):
 class HacsDispatchEvent(StrEnum):
     """HacsDispatchEvent."""
 
+    BULK_PROGRESS = "hacs_dispatch_bulk_progress"
     CONFIG = "hacs_dispatch_config"
     ERROR = "hacs_dispatch_error"
     RELOAD = "hacs_dispatch_reload"
     REPOSITORY = "hacs_dispatch_repository"
     REPOSITORY_DOWNLOAD_PROGRESS = "hacs_dispatch_repository_download_progress"
+    REPOSITORY_INFO = "hacs_dispatch_repository_info"
     STAGE = "hacs_dispatch_stage"
     STARTUP = "hacs_dispatch_startup"
     STATUS = "hacs_dispatch_status"
@@ -60,9 +62,15 @@ class HacsStage(StrEnum):
 
 
 class HacsDisabledReason(StrEnum):
-    RATE_LIMIT = "rate_limit"
     REMOVED = "removed"
     INVALID_TOKEN = "invalid_token"
     CONSTRAINS = "constrains"
     LOAD_HACS = "load_hacs"
     RESTORE = "restore"
+
+
+class RateLimitPriority(StrEnum):
+    """Priority of work that uses the GitHub API budget."""
+
+    BACKGROUND = "background"
+    USER = "user"
@@ -31,6 +31,12 @@ class HacsAppdaemonRepository(HacsRepository):
         """Return localpath."""
         return f"{self.hacs.core.config_path}/appdaemon/apps/{self.data.name}"
 
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree."""
+        if self.repository_manifest.content_in_root or "apps" not in directories:
+            return None
+        return ("apps",)
+
     async def validate_repository(self) -> bool:
         """Validate."""
         await self.common_validate()
@@ -46,7 +52,7 @@ class HacsAppdaemonRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues: bool = False, force: bool = False) -> None:
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
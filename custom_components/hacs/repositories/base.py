@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from asyncio import sleep
+from asyncio import Task, gather, sleep
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 import os
 import pathlib
@@ -16,10 +17,11 @@ from aiogithubapi import (
     AIOGitHubAPINotModifiedException,
     GitHubException,
 )
+from aiogithubapi.models.git_tree import GitHubGitTreeEntryModel
 import attr
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
 
-from ..const import DOMAIN
+from ..const import DOMAIN, TREE_TARGETED_MIN_SIZE
 from ..enums import HacsDispatchEvent, RepositoryFile
 from ..exceptions import (
     HacsException,
@@ -47,7 +49,6 @@ from ..utils.version import (
 from ..utils.workarounds import DOMAIN_OVERRIDES, LegacyTreeFile
 
 if TYPE_CHECKING:
-    from aiogithubapi.models.git_tree import GitHubGitTreeEntryModel
     from aiogithubapi.models.release import GitHubReleaseAssetModel, GitHubReleaseModel
     from aiogithubapi.objects.repository import AIOGitHubAPIRepository
 
@@ -305,6 +306,8 @@ class HacsRepository:
         self.content.path = RepositoryPath()
         self.repository_object: AIOGitHubAPIRepository | None = None
         self.updated_info = False
+        self.updated_info_task: Task | None = None
+        self.prefetched_version: str | None = None
         self.state = None
         self.force_branch = False
         self.integration_manifest = {}
@@ -316,6 +319,10 @@ class HacsRepository:
         self.treefiles = []
         self.ref = None
         self.logger = LOGGER
+        self._processed_head: tuple[Any, ...] | None = None
+        self._head_tree_sha: str | None = None
+        self._tag_tree_shas: dict[str, str] = {}
+        self._deferred_reloads: dict[str, Callable[[], Awaitable[None]]] | None = None
 
     def __str__(self) -> str:
         """Return a string representation of the repository."""
@@ -461,7 +468,7 @@ class HacsRepository:
     async def validate_repository(self) -> None:
         """Validate."""
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False) -> None:
         """Update the repository"""
 
@@ -503,13 +510,22 @@ class HacsRepository:
             self.data.last_updated = self.repository_object.attributes.get("pushed_at", 0)
             self.data.last_fetched = datetime.now(UTC)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def common_update(self, ignore_issues=False, force=False, skip_releases=False) -> bool:
         """Common information update steps of the repository."""
         self.logger.debug("%s Getting repository information", self.string)
 
+        # Only branch heads and tags resolved during this update may be used to find their trees
+        self._head_tree_sha = None
+        self._tag_tree_shas = {}
+        if not force and not await self.async_update_head_moved():
+            self.logger.debug("%s Did not update, %s has not moved", self.string, self.ref)
+            self.data.last_fetched = datetime.now(UTC)
+            return False
+
         # Attach repository
         current_etag = self.data.etag_repository
+        complete = True
         try:
             await self.common_update_data(
                 ignore_issues=ignore_issues,
@@ -523,35 +539,89 @@ class HacsRepository:
         except HacsException:
             if not ignore_issues and not force:
                 return False
+            complete = False
 
         if not self.data.installed and (current_etag == self.data.etag_repository) and not force:
             self.logger.debug("%s Did not update, content was not modified", self.string)
             return False
 
+        # The last commit, hacs.json and the info file are fetched at once,
+        # the info file of a repository that tracks commits needs the last commit first
+        requests = []
+        info_file_needs_last_commit = not self.data.installed and self.data.last_version is None
+
         # Update last updated
         if self.repository_object:
             self.data.last_updated = self.repository_object.attributes.get("pushed_at", 0)
 
             # Update last available commit
-            await self.async_set_last_commits()
+            requests.append(self.async_set_last_commits())
 
         # Get the content of hacs.json
         if RepositoryFile.HACS_JSON in [x.filename for x in self.tree]:
-            if manifest := await self.async_get_hacs_json():
-                self.repository_manifest = HacsManifest.from_dict(manifest)
-                self.data.update_data(
-                    self.repository_manifest.to_dict(),
-                    action=self.hacs.system.action,
-                )
+            requests.append(self._async_update_hacs_json())
 
         # Update "info.md"
-        self.additional_info = await self.async_get_info_file_contents()
+        if not info_file_needs_last_commit:
+            requests.append(self._async_update_info_file())
+
+        for result in await gather(*requests, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+        if info_file_needs_last_commit:
+            await self._async_update_info_file()
 
         # Set last fetch attribute
         self.data.last_fetched = datetime.now(UTC)
+        self._processed_head = self._update_head() if complete else None
 
         return True
 
+    def _update_head(self) -> tuple[Any, ...]:
+        """Return what decides if the content of the repository has to be processed again."""
+        return (
+            self.version_to_download(),
+            self.data.installed_version,
+            self.data.installed_commit,
+            self.data.last_version,
+            self.data.prerelease,
+            tuple(self.data.published_tags),
+            self.data.last_commit,
+        )
+
+    async def async_update_head_moved(self) -> bool:
+        """Return if the release tags or the branch head moved since the last processed update.
+
+        This is a single request, the releases for repositories that have them
+        and the head of the default branch for the others.
+        """
+        if self._processed_head is None:
+            return True
+        try:
+            if self.data.releases:
+                if (releases := await self._async_get_update_releases()) is None:
+                    return True
+                self._set_releases(releases)
+            else:
+                await self.async_set_last_commits()
+        except HacsException:
+            return True
+        return self._update_head() != self._processed_head
+
+    async def _async_update_hacs_json(self) -> None:
+        """Update the repository manifest from hacs.json."""
+        if manifest := await self.async_get_hacs_json():
+            self.repository_manifest = HacsManifest.from_dict(manifest)
+            self.data.update_data(
+                self.repository_manifest.to_dict(),
+                action=self.hacs.system.action,
+            )
+
+    async def _async_update_info_file(self) -> None:
+        """Update the additional info from the info file."""
+        self.additional_info = await self.async_get_info_file_contents()
+
     async def download_zip_files(self, validate: Validate) -> None:
         """Download ZIP archive from repository release."""
 
@@ -710,19 +780,52 @@ class HacsRepository:
     async def async_get_hacs_json(self, ref: str = None) -> dict[str, Any] | None:
         """Get the content of the hacs.json file."""
         try:
-            response = await self.hacs.async_github_api_method(
-                method=self.hacs.githubapi.repos.contents.get,
-                raise_exception=False,
-                repository=self.data.full_name,
-                path=RepositoryFile.HACS_JSON,
-                **{"params": {"ref": ref or self.version_to_download()}},
-            )
-            if response:
-                return json_loads(decode_content(response.data.content))
+            return await self.async_get_metadata_file(RepositoryFile.HACS_JSON, ref=ref)
         # lgtm [py/catch-base-exception] pylint: disable=broad-except
         except BaseException:
             pass
 
+    async def async_get_metadata_file(self, path: str, *, ref: str | None = None) -> Any | None:
+        """Get the content of a JSON metadata file, like hacs.json or manifest.json.
+
+        Files of tags and commits can not change, so they are downloaded from
+        raw.githubusercontent.com, which does not count against the API rate limit,
+        and kept in the raw content cache shared with the other downloads of the file.
+        Tags are addressed as refs/tags/<tag>, so a branch with the same name is never read.
+        Branches are read through the contents API, as the raw CDN can serve a file
+        that is minutes behind the tree, which is also the fallback for failed downloads.
+        """
+        ref = ref or self.version_to_download()
+        if (tag := self._ref_tag(ref)) is not None or self._is_commit_ref(ref):
+            url_ref = f"refs/tags/{tag}" if tag is not None else ref
+            if (content := await self._async_download_json(path, ref, url_ref=url_ref)) is not None:
+                return content
+
+        response = await self.hacs.async_github_api_method(
+            method=self.hacs.githubapi.repos.contents.get,
+            repository=self.data.full_name,
+            path=path,
+            **{"params": {"ref": ref}},
+        )
+        if response:
+            return json_loads(decode_content(response.data.content))
+        return None
+
+    async def _async_download_json(
+        self,
+        path: str,
+        ref: str,
+        *,
+        url_ref: str | None = None,
+    ) -> Any | None:
+        """Download a JSON file from raw.githubusercontent.com."""
+        result = await self.hacs.async_download_file(
+            f"https://raw.githubusercontent.com/{self.data.full_name}/{url_ref or ref}/{path}",
+            nolog=True,
+            cache_key=self.raw_cache_key(ref, path),
+        )
+        return json_loads(result) if result else None
+
     async def async_get_info_file_contents(self, *, version: str | None = None, **kwargs) -> str:
         """Get the content of the info.md file."""
 
@@ -868,21 +971,36 @@ class HacsRepository:
         await self.async_pre_install()
         self.logger.info("%s Pre installation steps completed", self.string)
 
-    async def async_install(self, *, version: str | None = None, **_) -> None:
-        """Run install steps."""
+    async def async_install(
+        self,
+        *,
+        version: str | None = None,
+        refresh: bool = True,
+        reloads: dict[str, Callable[[], Awaitable[None]]] | None = None,
+        **_,
+    ) -> None:
+        """Run install steps.
+
+        Reloads requested by the post installation steps are collected in
+        reloads when it is passed, the caller runs them.
+        """
         await self._async_pre_install()
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
             {"repository": self.data.full_name, "progress": 30},
         )
         self.logger.info("%s Running installation steps", self.string)
-        await self.async_install_repository(version=version)
+        await self.async_install_repository(version=version, refresh=refresh)
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
             {"repository": self.data.full_name, "progress": 90},
         )
         self.logger.info("%s Installation steps completed", self.string)
-        await self._async_post_install()
+        self._deferred_reloads = reloads
+        try:
+            await self._async_post_install()
+        finally:
+            self._deferred_reloads = None
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
             {"repository": self.data.full_name, "progress": False},
@@ -894,6 +1012,13 @@ class HacsRepository:
     async def async_post_uninstall(self):
         """Run post uninstall steps."""
 
+    async def async_reload(self, key: str, reload: Callable[[], Awaitable[None]]) -> None:
+        """Run a reload, or hand it over to the bulk download this install is part of."""
+        if self._deferred_reloads is not None:
+            self._deferred_reloads.setdefault(key, reload)
+            return
+        await reload()
+
     async def _async_post_uninstall(self):
         """Run post uninstall steps."""
         await self.async_post_uninstall()
@@ -914,13 +1039,20 @@ class HacsRepository:
         )
         self.logger.info("%s Post installation steps completed", self.string)
 
-    async def async_install_repository(self, *, version: str | None = None, **_) -> None:
+    async def async_install_repository(
+        self,
+        *,
+        version: str | None = None,
+        refresh: bool = True,
+        **_,
+    ) -> None:
         """Common installation steps of the repository."""
         persistent_directory = None
-        force_update = version is None or (
-            self.data.last_version is not None and version != self.data.last_version
-        )
-        await self.update_repository(force=force_update)
+        if refresh:
+            force_update = version is None or (
+                self.data.last_version is not None and version != self.data.last_version
+            )
+            await self.update_repository(force=force_update)
         if self.content.path.local is None:
             raise HacsException("repository.content.path.local is None")
         self.validate.errors.clear()
@@ -1016,19 +1148,148 @@ class HacsRepository:
     def update_filenames(self) -> None:
         """Get the filename to target."""
 
-    async def get_tree(self, ref: str) -> list[GitHubGitTreeEntryModel] | None:
-        """Return the repository tree."""
+    def _tree_cache_keys(self, ref: str) -> list[str]:
+        """Return the tree cache keys a ref can be resolved with, without a request."""
+        if ref == self.data.default_branch and self._head_tree_sha is not None:
+            return [self._head_tree_sha]
+        if (tag := self._ref_tag(ref)) is not None:
+            # Tags can be moved, so only the tree a tag resolved to during this update is used
+            return [tree_sha] if (tree_sha := self._tag_tree_shas.get(tag)) else []
+        if self._is_commit_ref(ref):
+            return [f"{self.data.full_name.lower()}/{ref}/tree"]
+        return []
+
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree, None for all of it.
+
+        The files in the root of the repository are always part of the tree.
+        """
+        return None
+
+    @property
+    def _fetch_targeted_tree(self) -> bool:
+        """Return if only the subtrees the category needs should be fetched."""
+        size = self.repository_object.attributes.get("size") if self.repository_object else None
+        return (size or 0) > TREE_TARGETED_MIN_SIZE
+
+    async def _async_get_tree_response(self, tree_sha: str, recursive: bool = False) -> Any:
+        """Return a single tree response."""
         try:
-            response = await self.hacs.async_github_api_method(
+            return await self.hacs.async_github_api_method(
                 method=self.hacs.githubapi.repos.git.get_tree,
                 repository=self.data.full_name,
-                tree_sha=ref,
-                params={"recursive": "true"},
+                tree_sha=tree_sha,
+                **({"params": {"recursive": "true"}} if recursive else {}),
             )
-            return response.data.tree
         except GitHubException as exception:
             raise HacsException(exception) from exception
 
+    async def _async_walk_tree(
+        self,
+        path: str,
+        response: Any,
+        directories: tuple[str, ...] | None = None,
+    ) -> tuple[list[GitHubGitTreeEntryModel], bool]:
+        """Return a tree level with the subtrees of its directories, and if it is complete.
+
+        Only the given directories are added, all of them when None.
+        """
+        complete = not response.data.truncated
+        if not complete:
+            self.logger.warning("%s The tree of %s is too large to list", self.string, path)
+        entries = [
+            entry
+            if not path
+            else GitHubGitTreeEntryModel({**entry.as_dict, "path": f"{path}/{entry.path}"})
+            for entry in response.data.tree or []
+        ]
+        subtrees = await gather(
+            *(
+                self._async_get_subtree(entry.path, entry.sha)
+                for entry in entries
+                if entry.type == "tree" and (directories is None or entry.path in directories)
+            )
+        )
+        for subtree, subtree_complete in subtrees:
+            entries.extend(subtree)
+            complete = complete and subtree_complete
+        return entries, complete
+
+    async def _async_get_subtree(
+        self, path: str, tree_sha: str
+    ) -> tuple[list[GitHubGitTreeEntryModel], bool]:
+        """Return the entries below a directory, and if they are complete.
+
+        The subtree is fetched recursively, and walked one level at a time if that is truncated.
+        """
+        response = await self._async_get_tree_response(tree_sha, recursive=True)
+        if response.data.truncated:
+            response = await self._async_get_tree_response(tree_sha)
+            return await self._async_walk_tree(path, response)
+        return [
+            GitHubGitTreeEntryModel({**entry.as_dict, "path": f"{path}/{entry.path}"})
+            for entry in response.data.tree or []
+        ], True
+
+    async def _async_set_cached_tree(
+        self, keys: list[str], tree: list[GitHubGitTreeEntryModel]
+    ) -> None:
+        """Cache a tree."""
+        if self.hacs.tree_cache is not None and tree:
+            await self.hacs.tree_cache.async_set_tree(keys, tree)
+
+    async def get_tree(self, ref: str) -> list[GitHubGitTreeEntryModel] | None:
+        """Return the repository tree.
+
+        Trees are served from the tree cache when the ref resolves to a known tree,
+        a commit by itself, and the default branch and tags through the tree SHA
+        they resolved to during this update.
+
+        The whole tree is fetched in a single recursive request. For large repositories,
+        and when that is truncated, only the subtrees the category needs are fetched,
+        and subtrees that are truncated themselves are walked one level at a time.
+        """
+        keys = self._tree_cache_keys(ref)
+        targeted_keys = [f"{key}#{self.data.category}" for key in keys]
+        if self.hacs.tree_cache is not None:
+            for key in (*keys, *targeted_keys):
+                if (tree := await self.hacs.tree_cache.async_get_tree(key)) is not None:
+                    return tree
+
+        tag = self._ref_tag(ref)
+        recursive = not self._fetch_targeted_tree
+        if recursive:
+            response = await self._async_get_tree_response(ref, recursive=True)
+            if tag is not None:
+                self._tag_tree_shas[tag] = response.data.sha
+            if not response.data.truncated:
+                await self._async_set_cached_tree([response.data.sha, *keys], response.data.tree)
+                return response.data.tree
+            self.logger.debug("%s The tree of %s is truncated, fetching subtrees", self.string, ref)
+
+        response = await self._async_get_tree_response(ref)
+        if tag is not None:
+            self._tag_tree_shas[tag] = response.data.sha
+        layout = self.get_tree_layout(
+            {entry.path for entry in response.data.tree or [] if entry.type == "tree"}
+        )
+        if layout is None and not recursive:
+            # All of the tree is needed, which only takes more requests when it is truncated
+            recursive_response = await self._async_get_tree_response(ref, recursive=True)
+            if not recursive_response.data.truncated:
+                await self._async_set_cached_tree(
+                    [recursive_response.data.sha, *keys], recursive_response.data.tree
+                )
+                return recursive_response.data.tree
+
+        tree, complete = await self._async_walk_tree("", response, layout)
+        if complete:
+            suffix = "" if layout is None else f"#{self.data.category}"
+            await self._async_set_cached_tree(
+                [f"{key}{suffix}" for key in (response.data.sha, *keys)], tree
+            )
+        return tree
+
     async def get_releases(self, prerelease=False, returnlimit=5) -> list[GitHubReleaseModel]:
         """Return the repository releases."""
         response = await self.hacs.async_github_api_method(
@@ -1044,6 +1305,68 @@ class HacsRepository:
             releases.append(release)
         return releases
 
+    async def async_ensure_releases(self, version: str) -> None:
+        """Fetch the releases when a version is not one of the known release tags."""
+        if version in self.data.published_tags:
+            return
+        releases = await self.get_releases(
+            prerelease=self.data.show_beta,
+            returnlimit=self.hacs.configuration.release_limit,
+        )
+        if releases:
+            self.data.releases = True
+            self.releases.objects = releases
+            self.data.published_tags = [x.tag_name for x in releases]
+            self.data.last_version = next(iter(self.data.published_tags))
+
+    async def async_prefetch_pending_update(self) -> None:
+        """Warm the release notes, tree, hacs.json and the info file of the pending update.
+
+        The files are pinned to the version, so they end up in the raw content cache,
+        the tree of a tag is fetched first to resolve the tree SHA they are keyed by.
+        """
+        version = self.display_available_version
+        if self.display_version_or_commit == "version":
+            await self.async_ensure_releases(version)
+            await self.get_tree(version)
+        await gather(
+            self.get_hacs_json(version=version),
+            self.async_get_info_file_contents(version=version),
+        )
+        self.prefetched_version = version
+
+    async def _async_get_update_releases(self) -> list[GitHubReleaseModel] | None:
+        """Return the releases for an update, None if they could not be fetched."""
+        try:
+            return await self.get_releases(prerelease=True, returnlimit=30)
+        except HacsException:
+            return None
+
+    def _set_releases(self, releases: list[GitHubReleaseModel]) -> None:
+        """Set the release information of the repository."""
+        if not releases:
+            return
+        self.data.prerelease = None
+        for release in releases:
+            if release.draft:
+                continue
+            elif release.prerelease:
+                if self.data.prerelease is None:
+                    self.data.prerelease = release.tag_name
+            else:
+                self.data.last_version = release.tag_name
+                break
+
+        self.data.releases = True
+
+        filtered_releases = [
+            release
+            for release in releases
+            if not release.draft and (self.data.show_beta or not release.prerelease)
+        ]
+        self.releases.objects = filtered_releases
+        self.data.published_tags = [x.tag_name for x in filtered_releases]
+
     async def common_update_data(
         self,
         ignore_issues: bool = False,
@@ -1053,15 +1376,28 @@ class HacsRepository:
     ) -> None:
         """Common update data."""
         releases = []
+        etag = None if force or self.data.installed else self.data.etag_repository
+        # Without an etag the repository object is always fetched in full,
+        # so the releases do not have to wait for it
+        fetch_releases_at_once = etag is None and not skip_releases
         try:
-            repository_object, etag = await self.async_get_legacy_repository_object(
-                etag=None if force or self.data.installed else self.data.etag_repository,
-            )
+            if fetch_releases_at_once:
+                repository_result, releases = await gather(
+                    self.async_get_legacy_repository_object(etag=etag),
+                    self._async_get_update_releases(),
+                    return_exceptions=True,
+                )
+                if isinstance(repository_result, BaseException):
+                    raise repository_result
+                repository_object, etag = repository_result
+            else:
+                repository_object, etag = await self.async_get_legacy_repository_object(etag=etag)
             self.repository_object = repository_object
             if self.data.full_name.lower() != repository_object.full_name.lower():
                 self.hacs.common.renamed_repositories[self.data.full_name] = (
                     repository_object.full_name
                 )
+                self.hacs.repositories.renamed_changed()
                 if not self.hacs.system.generator:
                     raise HacsRepositoryExistException
                 self.logger.error(
@@ -1099,35 +1435,18 @@ class HacsRepository:
 
         # Get releases.
         if not skip_releases:
-            try:
-                releases = await self.get_releases(prerelease=True, returnlimit=30)
-                if releases:
-                    self.data.prerelease = None
-                    for release in releases:
-                        if release.draft:
-                            continue
-                        elif release.prerelease:
-                            if self.data.prerelease is None:
-                                self.data.prerelease = release.tag_name
-                        else:
-                            self.data.last_version = release.tag_name
-                            break
-
-                    self.data.releases = True
-
-                    filtered_releases = [
-                        release
-                        for release in releases
-                        if not release.draft and (self.data.show_beta or not release.prerelease)
-                    ]
-                    self.releases.objects = filtered_releases
-                    self.data.published_tags = [x.tag_name for x in filtered_releases]
-
-            except HacsException:
+            if not fetch_releases_at_once:
+                releases = await self._async_get_update_releases()
+            if isinstance(releases, BaseException):
+                raise releases
+            if releases is None:
                 self.data.releases = False
+            else:
+                self._set_releases(releases)
 
         if not self.force_branch:
             self.ref = self.version_to_download()
+        requests = [self.get_tree(self.ref)]
         if self.data.releases:
             for release in self.releases.objects or []:
                 if release.tag_name == self.ref:
@@ -1135,14 +1454,21 @@ class HacsRepository:
                         if target_asset := self._find_target_asset(assets):
                             self.data.downloads = target_asset.download_count
         elif self.hacs.system.generator and self.repository_object:
-            await self.async_set_last_commits()
+            # The branch head and the tree both only depend on the resolved ref
+            requests.append(self.async_set_last_commits())
 
         self.hacs.log.debug(
             "%s Running checks against %s", self.string, self.ref.replace("tags/", "")
         )
 
+        tree, *results = await gather(*requests, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
         try:
-            tree = await self.get_tree(self.ref)
+            if isinstance(tree, BaseException):
+                raise tree
             if not tree:
                 raise HacsException("No files in tree")
             self.tree = [
@@ -1258,7 +1584,14 @@ class HacsRepository:
         try:
             self.logger.debug("%s Downloading %s", self.string, content.name)
 
-            filecontent = await self.hacs.async_download_file(content.download_url)
+            filecontent = await self.hacs.async_download_file(
+                content.download_url,
+                cache_key=(
+                    self.raw_cache_key(self.ref, content.path)
+                    if content.download_url.startswith("https://raw.githubusercontent.com/")
+                    else None
+                ),
+            )
 
             if filecontent is None:
                 self.validate.errors.append(f"[{content.name}] was not downloaded.")
@@ -1326,6 +1659,33 @@ class HacsRepository:
 
         return self.data.default_branch or "main"
 
+    def _ref_tag(self, ref: str | None) -> str | None:
+        """Return the release tag a ref names, None if it is not one."""
+        if ref and (tag := ref.replace("tags/", "")) in (
+            *self.data.published_tags,
+            self.data.last_version,
+        ):
+            return tag
+        return None
+
+    def _is_commit_ref(self, ref: str | None) -> bool:
+        """Return if a ref is one of the known commits of the repository."""
+        return bool(ref) and ref in (self.data.last_commit, self.data.installed_commit)
+
+    def raw_cache_key(self, ref: str | None, path: str) -> str | None:
+        """Return the raw content cache key for a file, if the ref is a tag or commit.
+
+        Tags can be moved, so files of a tag are keyed by the tree SHA the tag
+        resolved to when its tree was last fetched, and not cached before that.
+        """
+        if (tag := self._ref_tag(ref)) is not None:
+            if (tree_sha := self._tag_tree_shas.get(tag)) is None:
+                return None
+            return f"{self.data.full_name.lower()}/{tree_sha}/{path}"
+        if not self._is_commit_ref(ref):
+            return None
+        return f"{self.data.full_name.lower()}/{ref}/{path}"
+
     async def get_documentation(
         self,
         *,
@@ -1356,6 +1716,7 @@ class HacsRepository:
         result = await self.hacs.async_download_file(
             f"https://raw.githubusercontent.com/{self.data.full_name}/{target_version}/{filename}",
             nolog=True,
+            cache_key=self.raw_cache_key(target_version, filename),
         )
 
         return (
@@ -1382,12 +1743,7 @@ class HacsRepository:
     ) -> dict[str, Any] | None:
         """Get the hacs.json file of the repository."""
         self.logger.debug("%s Getting hacs.json for version=%s", self.string, version)
-        result = await self.hacs.async_download_file(
-            f"https://raw.githubusercontent.com/{self.data.full_name}/{version}/hacs.json",
-            nolog=True,
-            handle_rate_limit=True,
-        )
-        return json_loads(result) if result else None
+        return await self._async_download_json(RepositoryFile.HACS_JSON, version)
 
     def _find_target_asset(
         self,
@@ -1449,8 +1805,20 @@ class HacsRepository:
         if target_manifest.hacs is not None and self.hacs.version < target_manifest.hacs:
             raise HacsException(f"This version requires HACS {target_manifest.hacs} or newer.")
 
-    async def async_download_repository(self, *, ref: str | None = None, **_) -> None:
-        """Download the content of a repository."""
+    async def async_download_repository(
+        self,
+        *,
+        ref: str | None = None,
+        refresh: bool = True,
+        reloads: dict[str, Callable[[], Awaitable[None]]] | None = None,
+        **_,
+    ) -> None:
+        """Download the content of a repository.
+
+        Pass refresh=False when the repository information was just updated,
+        to skip the update that is otherwise done before the download, and
+        reloads to collect the reloads instead of running them.
+        """
         await self._ensure_download_capabilities(ref)
         self.logger.info("Starting download, %s", ref)
         if self.display_version_or_commit == "version":
@@ -1458,7 +1826,7 @@ class HacsRepository:
                 HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
                 {"repository": self.data.full_name, "progress": 10},
             )
-            if not ref:
+            if not ref and refresh:
                 await self.update_repository(force=True)
             else:
                 self.ref = ref
@@ -1470,7 +1838,7 @@ class HacsRepository:
             )
 
         try:
-            await self.async_install(version=ref)
+            await self.async_install(version=ref, refresh=refresh, reloads=reloads)
         except HacsException as exception:
             raise HacsException(
                 f"Downloading {self.data.full_name} with version {ref or self.data.last_version or self.data.last_commit} failed with ({exception})"
@@ -1501,3 +1869,6 @@ class HacsRepository:
         if response is not None and response.data:
             last_commit = response.data["commit"]["sha"]
             self.data.last_commit = last_commit[:7]
+            self._head_tree_sha = (
+                response.data["commit"].get("commit", {}).get("tree", {}).get("sha")
+            )
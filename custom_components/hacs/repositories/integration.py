@@ -10,10 +10,8 @@ from homeassistant.loader import async_get_custom_components
 from ..const import DOMAIN
 from ..enums import HacsCategory, HacsDispatchEvent, HacsGitHubRepo, RepositoryFile
 from ..exceptions import AddonRepositoryException, HacsException
-from ..utils.decode import decode_content
 from ..utils.decorator import concurrent
 from ..utils.filters import get_first_directory_in_directory
-from ..utils.json import json_loads
 from .base import HacsRepository
 
 if TYPE_CHECKING:
@@ -37,12 +35,18 @@ class HacsIntegrationRepository(HacsRepository):
         """Return localpath."""
         return f"{self.hacs.core.config_path}/custom_components/{self.data.domain}"
 
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree."""
+        if self.repository_manifest.content_in_root or "custom_components" not in directories:
+            return None
+        return ("custom_components",)
+
     async def async_post_installation(self):
         """Run post installation steps."""
         self.pending_restart = True
         if self.data.config_flow:
             if self.data.full_name != HacsGitHubRepo.INTEGRATION:
-                await self.reload_custom_components()
+                await self.async_reload("custom_components", self.reload_custom_components)
             if self.data.first_install:
                 self.pending_restart = False
 
@@ -117,7 +121,7 @@ class HacsIntegrationRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -182,15 +186,7 @@ class HacsIntegrationRepository(HacsRepository):
 
         target_ref = ref or self.version_to_download()
         self.logger.debug("%s Getting %s for ref=%s", self.string, manifest_path, target_ref)
-
-        response = await self.hacs.async_github_api_method(
-            method=self.hacs.githubapi.repos.contents.get,
-            repository=self.data.full_name,
-            path=manifest_path,
-            **{"params": {"ref": target_ref}},
-        )
-        if response:
-            return json_loads(decode_content(response.data.content))
+        return await self.async_get_metadata_file(manifest_path, ref=target_ref)
 
     async def get_integration_manifest(self, *, version: str, **kwargs) -> dict[str, Any] | None:
         """Get the content of the manifest.json file."""
@@ -205,12 +201,6 @@ class HacsIntegrationRepository(HacsRepository):
 
         self.logger.debug("%s Getting manifest.json for version=%s", self.string, version)
         try:
-            result = await self.hacs.async_download_file(
-                f"https://raw.githubusercontent.com/{self.data.full_name}/{version}/{manifest_path}",
-                nolog=True,
-            )
-            if result is None:
-                return None
-            return json_loads(result)
+            return await self._async_download_json(manifest_path, version)
         except Exception:  # pylint: disable=broad-except
             return None
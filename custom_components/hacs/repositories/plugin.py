@@ -35,6 +35,12 @@ class HacsPluginRepository(HacsRepository):
         """Return localpath."""
         return f"{self.hacs.core.config_path}/www/community/{self.data.full_name.split('/')[-1]}"
 
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree."""
+        if self.repository_manifest.content_in_root:
+            return ()
+        return ("dist",)
+
     async def validate_repository(self):
         """Validate."""
         # Run common validation steps.
@@ -67,7 +73,7 @@ class HacsPluginRepository(HacsRepository):
         """Run post uninstall steps."""
         await self.remove_dashboard_resources()
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -33,6 +33,12 @@ class HacsPythonScriptRepository(HacsRepository):
         """Return localpath."""
         return f"{self.hacs.core.config_path}/python_scripts"
 
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree."""
+        if self.repository_manifest.content_in_root:
+            return ()
+        return ("python_scripts",) if "python_scripts" in directories else None
+
     async def validate_repository(self):
         """Validate."""
         # Run common validation steps.
@@ -67,7 +73,7 @@ class HacsPythonScriptRepository(HacsRepository):
         if self.hacs.system.action:
             await self.hacs.validation.async_run_repository_checks(self)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -33,9 +33,13 @@ class HacsTemplateRepository(HacsRepository):
         """Return localpath."""
         return f"{self.hacs.core.config_path}/custom_templates"
 
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree."""
+        return ()
+
     async def async_post_installation(self):
         """Run post installation steps."""
-        await self._reload_custom_templates()
+        await self.async_reload("custom_templates", self._reload_custom_templates)
 
     async def validate_repository(self):
         """Validate."""
@@ -83,7 +87,7 @@ class HacsTemplateRepository(HacsRepository):
         except HomeAssistantError as exception:
             self.logger.exception("%s %s", self.string, exception)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -33,9 +33,15 @@ class HacsThemeRepository(HacsRepository):
         """Return localpath."""
         return f"{self.hacs.core.config_path}/themes/{self.data.file_name.replace('.yaml', '')}"
 
+    def get_tree_layout(self, directories: set[str]) -> tuple[str, ...] | None:
+        """Return the root directories the category needs from the tree."""
+        if self.repository_manifest.content_in_root:
+            return ()
+        return ("themes",) if "themes" in directories else None
+
     async def async_post_installation(self):
         """Run post installation steps."""
-        await self._reload_frontend_themes()
+        await self.async_reload("themes", self._reload_frontend_themes)
 
     async def validate_repository(self):
         """Validate."""
@@ -84,7 +90,7 @@ class HacsThemeRepository(HacsRepository):
         """Run post uninstall steps."""
         await self._reload_frontend_themes()
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -95,16 +95,7 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
         if self.repository.pending_restart:
             return None
 
-        if self.latest_version not in self.repository.data.published_tags:
-            releases = await self.repository.get_releases(
-                prerelease=self.repository.data.show_beta,
-                returnlimit=self.hacs.configuration.release_limit,
-            )
-            if releases:
-                self.repository.data.releases = True
-                self.repository.releases.objects = releases
-                self.repository.data.published_tags = [x.tag_name for x in releases]
-                self.repository.data.last_version = next(iter(self.repository.data.published_tags))
+        await self.repository.async_ensure_releases(self.latest_version)
 
         release_notes = ""
         # Compile release notes from installed version up to the latest
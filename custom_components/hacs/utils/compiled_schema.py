@@ -0,0 +1,126 @@
+"""Compiled checks for voluptuous schemas."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import inspect
+from typing import Any
+
+import voluptuous as vol
+
+Check = Callable[[Any], bool]
+
+
+def _passes(validator: Callable[[Any], Any]) -> Check:
+    """Return a check that calls a validator the compiler does not know."""
+
+    def _check(value: Any) -> bool:
+        try:
+            validator(value)
+        except Exception:
+            # The validator raises again when it runs on its own
+            return False
+        return True
+
+    return _check
+
+
+def _compile_in(container: Any) -> Check:
+    """Return a check for vol.In, containers that can not hold the value reject it."""
+
+    def _check(value: Any) -> bool:
+        try:
+            return value in container
+        except TypeError:
+            return False
+
+    return _check
+
+
+def _compile_list(schema: list[Any], extra: int) -> Check:
+    """Return a check for a list of values that each match one of the validators."""
+    if not schema:
+        return lambda value: isinstance(value, list) and not value
+    checks = [compile_check(validator, extra) for validator in schema]
+    if len(checks) == 1:
+        check = checks[0]
+        return lambda value: isinstance(value, list) and all(check(item) for item in value)
+    return lambda value: (
+        isinstance(value, list) and all(any(check(item) for check in checks) for item in value)
+    )
+
+
+def _compile_dict(schema: dict[Any, Any], extra: int) -> Check:
+    """Return a check for a mapping with marked string keys."""
+    if not all(isinstance(key, vol.Marker) and isinstance(key.schema, str) for key in schema):
+        return _passes(vol.Schema(schema, extra=extra))
+
+    checks = {key.schema: compile_check(value, extra) for key, value in schema.items()}
+    required = tuple(key.schema for key in schema if isinstance(key, vol.Required))
+    prevent_extra = extra == vol.PREVENT_EXTRA
+
+    def _check(value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        for key, item in value.items():
+            if (check := checks.get(key)) is None:
+                if prevent_extra:
+                    return False
+            elif not check(item):
+                return False
+        return all(key in value for key in required)
+
+    return _check
+
+
+def compile_check(schema: Any, extra: int = vol.PREVENT_EXTRA) -> Check:
+    """Compile a voluptuous schema to a function that tells if a value is valid.
+
+    The check only answers yes or no, it does not build errors or new values.
+    Types, literals, lists, mappings with Required and Optional keys, vol.Any and
+    vol.In are compiled, other validators are called as they are, so the check
+    never accepts a value the schema rejects.
+    """
+    if isinstance(schema, vol.Schema):
+        return compile_check(schema.schema, schema.extra)
+    if isinstance(schema, dict):
+        return _compile_dict(schema, extra)
+    if isinstance(schema, list):
+        return _compile_list(schema, extra)
+    if inspect.isclass(schema):
+        return lambda value: isinstance(value, schema)
+    if type(schema) is vol.Any:
+        checks = [compile_check(validator, extra) for validator in schema.validators]
+        return lambda value: any(check(value) for check in checks)
+    if type(schema) is vol.In:
+        return _compile_in(schema.container)
+    if callable(schema):
+        return _passes(vol.Schema(schema, extra=extra))
+    # Literals are compared like voluptuous does
+    return lambda value: value == schema
+
+
+class CompiledValidator:
+    """Fast path for a voluptuous validator.
+
+    Values that pass the compiled check are converted with the result function,
+    which has to return what the validator returns for them. Everything else is
+    passed to the validator itself, so invalid data raises the same errors.
+    """
+
+    def __init__(
+        self,
+        validator: Callable[[Any], Any],
+        check: Check,
+        result: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Initialize."""
+        self.validator = validator
+        self._check = check
+        self._result = result
+
+    def __call__(self, data: Any) -> Any:
+        """Validate data."""
+        if self._check(data):
+            return data if self._result is None else self._result(data)
+        return self.validator(data)
@@ -0,0 +1,189 @@
+"""Content encodings HACS negotiates, and decodes outside the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import gzip
+import time
+from typing import Any
+import zlib
+
+from aiohttp import ClientResponse, hdrs
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+# Bodies that are received with less bytes than this are decoded on the event loop
+DECODE_EXECUTOR_MIN_SIZE = 32 * 1024
+
+# File extensions of the precompressed artifacts of the generator
+ENCODING_EXTENSIONS = {"br": "br", "gzip": "gz", "zstd": "zst"}
+
+
+def available_encodings() -> list[str]:
+    """Return the content encodings that can be decoded, preferred first."""
+    encodings = []
+    if zstd is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    return [*encodings, "gzip", "deflate"]
+
+
+ACCEPT_ENCODING = ", ".join(available_encodings())
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with a content encoding."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "deflate":
+        return zlib.compress(data, 9)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data)
+    if encoding == "zstd" and zstd is not None:
+        return zstd.compress(data, level=19)
+    raise ValueError(f"Unsupported content encoding {encoding}")
+
+
+class Decompressor:
+    """Incremental decoder for the content encoding of a response."""
+
+    def __init__(self, encoding: str | None) -> None:
+        """Initialize."""
+        self.encoding = (encoding or "identity").strip().lower()
+        self._decompress: Callable[[bytes], bytes] | None = None
+        self._flush: Callable[[], bytes] | None = None
+        if self.encoding == "identity":
+            return
+        if self.encoding in ("gzip", "x-gzip"):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._decompress, self._flush = decompressor.decompress, decompressor.flush
+        elif self.encoding == "deflate":
+            decompressor = zlib.decompressobj()
+            self._decompress, self._flush = decompressor.decompress, decompressor.flush
+        elif self.encoding == "br" and brotli is not None:
+            decompressor = brotli.Decompressor()
+            self._decompress = getattr(decompressor, "process", None) or decompressor.decompress
+        elif self.encoding == "zstd" and zstd is not None:
+            self._decompress = zstd.ZstdDecompressor().decompress
+        else:
+            raise ValueError(f"Unsupported content encoding {encoding}")
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decode a chunk of the body."""
+        if self._decompress is None:
+            return data
+        try:
+            return self._decompress(data)
+        except Exception as exception:  # pylint: disable=broad-except
+            # Each module has its own error, they are raised as ValueError
+            raise ValueError(f"Invalid {self.encoding} content ({exception})") from exception
+
+    def flush(self) -> bytes:
+        """Return what is left when the body is complete."""
+        if self._flush is None:
+            return b""
+        try:
+            return self._flush()
+        except Exception as exception:  # pylint: disable=broad-except
+            raise ValueError(f"Invalid {self.encoding} content ({exception})") from exception
+
+
+class TransferStats:
+    """Counters for the responses HACS decodes itself.
+
+    Transferred bytes are counted as received, decoded bytes after decompression.
+    Loop time is what the event loop spent on the bodies, executor time what was
+    moved off the loop to decompress and decode them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.responses = 0
+        self.transferred = 0
+        self.decoded = 0
+        self.encodings: dict[str, int] = {}
+        self.loop_time = 0.0
+        self.executor_time = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {
+            "decoded": self.decoded,
+            "encodings": dict(sorted(self.encodings.items())),
+            "executor_time": round(self.executor_time, 3),
+            "loop_time": round(self.loop_time, 3),
+            "responses": self.responses,
+            "transferred": self.transferred,
+        }
+
+    def add(
+        self,
+        encoding: str,
+        transferred: int,
+        decoded: int,
+        loop_time: float = 0.0,
+        executor_time: float = 0.0,
+    ) -> None:
+        """Count a response."""
+        self.responses += 1
+        self.transferred += transferred
+        self.decoded += decoded
+        self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+        self.loop_time += loop_time
+        self.executor_time += executor_time
+
+
+async def async_read_decoded(
+    response: ClientResponse,
+    stats: TransferStats | None = None,
+    decode: Callable[[bytes], Any] | None = None,
+) -> Any:
+    """Read a response that was requested with auto_decompress=False.
+
+    The body is decompressed, and passed to decode if given. Large bodies
+    are handled in the executor, small ones on the event loop.
+    """
+    body = await response.read()
+    decompressor = Decompressor(response.headers.get(hdrs.CONTENT_ENCODING))
+
+    def _decode() -> tuple[bytes, Any, float]:
+        started = time.perf_counter()
+        decoded = decompressor.decompress(body) + decompressor.flush()
+        result = decoded if decode is None else decode(decoded)
+        return decoded, result, time.perf_counter() - started
+
+    if len(body) < DECODE_EXECUTOR_MIN_SIZE:
+        decoded, result, loop_time = _decode()
+        executor_time = 0.0
+    else:
+        decoded, result, executor_time = await asyncio.get_running_loop().run_in_executor(
+            None, _decode
+        )
+        loop_time = 0.0
+
+    if stats is not None:
+        stats.add(
+            decompressor.encoding,
+            len(body),
+            len(decoded),
+            loop_time=loop_time,
+            executor_time=executor_time,
+        )
+    return result
@@ -0,0 +1,212 @@
+"""Adaptive request concurrency per upstream host."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+import time
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession, hdrs
+from multidict import CIMultiDict
+from yarl import URL
+
+from ..const import CONCURRENCY_INITIAL, CONCURRENCY_MAX
+
+# Longest time requests to a host are held back after it asked us to slow down
+MAX_RETRY_AFTER = 60
+# A response this many times slower than the average counts as a congestion signal
+LATENCY_FACTOR = 3
+LATENCY_WEIGHT = 0.2
+
+
+def retry_after(headers: CIMultiDict[str], now: float) -> float | None:
+    """Return the seconds the Retry-After or rate limit reset headers ask to wait, if any."""
+    if (value := headers.get(hdrs.RETRY_AFTER)) is not None:
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - now, 0)
+        except (TypeError, ValueError):
+            return 0.0
+    if headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(float(headers["X-RateLimit-Reset"]) - now, 0)
+        except (KeyError, ValueError):
+            return 0.0
+    return None
+
+
+def throttle_delay(status: int, headers: CIMultiDict[str], now: float) -> float | None:
+    """Return how long to back off if the response asks for it, None if it does not."""
+    if status not in (403, 429):
+        return None
+    if (delay := retry_after(headers, now)) is not None:
+        return min(delay, MAX_RETRY_AFTER)
+    return 0.0 if status == 429 else None
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit for a single host, adjusted with additive increase/multiplicative decrease.
+
+    Every successful response grows the limit by one per limit-sized window, throttling
+    responses halve it and hold requests back for the requested time, and responses
+    that are much slower than the average shrink it a little.
+    """
+
+    def __init__(
+        self,
+        initial: int = CONCURRENCY_INITIAL,
+        maximum: int = CONCURRENCY_MAX,
+        minimum: int = 1,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize."""
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.minimum = minimum
+        self.throttled = 0
+        self._time = time_func
+        self._active = 0
+        self._blocked_until = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latency: float | None = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the current state."""
+        return {
+            "active": self._active,
+            "latency": round(self._latency, 3) if self._latency is not None else None,
+            "limit": int(self.limit),
+            "throttled": self.throttled,
+        }
+
+    async def async_acquire(self) -> None:
+        """Wait for a free slot and take it, it is held until release is called."""
+        while (delay := self._blocked_until - self._time()) > 0:
+            await asyncio.sleep(delay)
+        while self._active >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._active += 1
+
+    def release(self) -> None:
+        """Free a slot, the waiting requests check the limit again."""
+        self._active -= 1
+        while self._waiters:
+            if not (waiter := self._waiters.popleft()).done():
+                waiter.set_result(None)
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot, and hold it while the request is made."""
+        await self.async_acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def success(self, latency: float) -> None:
+        """Adjust the limit after a successful response."""
+        if self._latency is not None and latency > self._latency * LATENCY_FACTOR:
+            self.limit = max(self.minimum, self.limit * 0.9)
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += (latency - self._latency) * LATENCY_WEIGHT
+
+    def throttle(self, delay: float) -> None:
+        """Adjust the limit after the host asked us to slow down."""
+        self.throttled += 1
+        self.limit = max(self.minimum, self.limit / 2)
+        self._blocked_until = max(self._blocked_until, self._time() + delay)
+
+
+class HacsConcurrency:
+    """Adaptive concurrency limits, shared per upstream host."""
+
+    def __init__(self, time_func: Callable[[], float] = time.monotonic) -> None:
+        """Initialize."""
+        self._time = time_func
+        self._hosts: dict[str, AdaptiveConcurrency] = {}
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the state per host."""
+        return {host: limiter.stats for host, limiter in sorted(self._hosts.items())}
+
+    def host(self, host: str) -> AdaptiveConcurrency:
+        """Return the limiter for a host."""
+        if (limiter := self._hosts.get(host)) is None:
+            limiter = self._hosts[host] = AdaptiveConcurrency(time_func=self._time)
+        return limiter
+
+
+class HacsConcurrencySession:
+    """Client session proxy that limits concurrent requests per host.
+
+    The slot is held until the body of the response is read or the response is
+    released, so the limit also bounds the transfers, and the latency fed to the
+    limiter covers the whole response.
+    """
+
+    def __init__(self, session: ClientSession, concurrency: HacsConcurrency) -> None:
+        """Initialize."""
+        self._session = session
+        self._concurrency = concurrency
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+    async def request(self, method: str, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a request."""
+        limiter = self._concurrency.host(URL(url).host or "")
+        await limiter.async_acquire()
+        start = time.monotonic()
+        try:
+            response = await self._session.request(method, url, **kwargs)
+        except TimeoutError:
+            limiter.throttle(0)
+            limiter.release()
+            raise
+        except BaseException:
+            limiter.release()
+            raise
+
+        throttled = throttle_delay(response.status, CIMultiDict(response.headers), time.time())
+        if throttled is not None:
+            limiter.throttle(throttled)
+
+        def _release() -> None:
+            if throttled is None:
+                limiter.success(time.monotonic() - start)
+            limiter.release()
+
+        # The connection is released once the body is read, or the response is released
+        if (connection := response.connection) is None:
+            _release()
+        else:
+            connection.add_callback(_release)
+        return response
+
+    async def get(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a GET request."""
+        return await self.request(hdrs.METH_GET, url, **kwargs)
+
+    async def post(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a POST request."""
+        return await self.request(hdrs.METH_POST, url, **kwargs)
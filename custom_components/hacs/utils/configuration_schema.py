@@ -7,3 +7,5 @@ APPDAEMON = "appdaemon"
 
 # Options:
 COUNTRY = "country"
+DATA_BUNDLE = "data_bundle"
+DEDICATED_CONNECTIONS = "dedicated_connections"
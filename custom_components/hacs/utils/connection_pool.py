@@ -0,0 +1,174 @@
+"""Dedicated connection pools per upstream host."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import ssl
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession, TCPConnector, TraceConfig, hdrs
+from yarl import URL
+
+from ..const import CONNECTION_POOL_DNS_TTL, CONNECTION_POOL_KEEPALIVE, CONNECTION_POOL_LIMITS
+
+
+class HostConnectionPool:
+    """Connector and client session for a single upstream host, with transfer counters.
+
+    Create it in the event loop, the connector needs the running loop.
+    The session is not opened again once it is closed.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        ssl_context: ssl.SSLContext | bool = True,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize."""
+        self.limit = limit
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.created = 0
+        self.reused = 0
+        self.queued = 0
+        self.queued_time = 0.0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        self.session = ClientSession(
+            connector=TCPConnector(
+                limit=limit,
+                keepalive_timeout=CONNECTION_POOL_KEEPALIVE,
+                ttl_dns_cache=CONNECTION_POOL_DNS_TTL,
+                ssl=ssl_context,
+            ),
+            headers=headers,
+            trace_configs=[self._trace_config()],
+        )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the counters of the pool."""
+        return {
+            "bytes": self.bytes,
+            "created": self.created,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "errors": self.errors,
+            "limit": self.limit,
+            "queued": self.queued,
+            "queued_time": round(self.queued_time, 3),
+            "requests": self.requests,
+            "reused": self.reused,
+        }
+
+    def _trace_config(self) -> TraceConfig:
+        """Return the trace config that keeps the counters."""
+        trace_config = TraceConfig()
+
+        async def on_request_start(_session, _context, _params) -> None:
+            self.requests += 1
+
+        async def on_request_exception(_session, _context, _params) -> None:
+            self.errors += 1
+
+        async def on_response_chunk_received(_session, _context, params) -> None:
+            self.bytes += len(params.chunk)
+
+        async def on_connection_queued_start(_session, context: SimpleNamespace, _params) -> None:
+            self.queued += 1
+            context.queued_at = time.monotonic()
+
+        async def on_connection_queued_end(_session, context: SimpleNamespace, _params) -> None:
+            self.queued_time += time.monotonic() - context.queued_at
+
+        async def on_connection_create_end(_session, _context, _params) -> None:
+            self.created += 1
+
+        async def on_connection_reuseconn(_session, _context, _params) -> None:
+            self.reused += 1
+
+        async def on_dns_cache_hit(_session, _context, _params) -> None:
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(_session, _context, _params) -> None:
+            self.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_response_chunk_received.append(on_response_chunk_received)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def async_close(self) -> None:
+        """Close the session and its connections."""
+        await self.session.close()
+
+
+class HacsConnectionPools:
+    """HACS owned connection pools for the upstream hosts with the most traffic.
+
+    Every host gets its own connector with a fixed connection limit, so bulk downloads
+    do not compete with other integrations for the connections of the shared session.
+    Idle connections are kept alive longer, and resolved hosts are cached.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, int] = CONNECTION_POOL_LIMITS,
+        ssl_context: ssl.SSLContext | bool = True,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize."""
+        self._pools = {
+            host: HostConnectionPool(limit, ssl_context, headers) for host, limit in limits.items()
+        }
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the counters per host."""
+        return {host: pool.stats for host, pool in sorted(self._pools.items())}
+
+    def pool(self, host: str) -> HostConnectionPool | None:
+        """Return the pool for a host, None if it uses the shared session."""
+        return self._pools.get(host)
+
+    async def async_close(self) -> None:
+        """Close all pools."""
+        for pool in self._pools.values():
+            await pool.async_close()
+
+
+class HacsConnectionPoolSession:
+    """Client session proxy that sends requests to the pool of the host, if it has one."""
+
+    def __init__(self, session: ClientSession, pools: HacsConnectionPools) -> None:
+        """Initialize."""
+        self._session = session
+        self._pools = pools
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+    async def request(self, method: str, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a request."""
+        if (pool := self._pools.pool(URL(url).host or "")) is None:
+            return await self._session.request(method, url, **kwargs)
+        return await pool.session.request(method, url, **kwargs)
+
+    async def get(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a GET request."""
+        return await self.request(hdrs.METH_GET, url, **kwargs)
+
+    async def post(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a POST request."""
+        return await self.request(hdrs.METH_POST, url, **kwargs)
@@ -198,6 +198,7 @@ class HacsData:
             value = renamed.get(entry)
             if value not in renamed:
                 self.hacs.common.renamed_repositories[entry] = value
+        self.hacs.repositories.renamed_changed()
 
         # Clear out doubble archived values
         for entry in hacs.get("archived_repositories", set()):
@@ -0,0 +1,42 @@
+"""Patches between versions of data-v2 category data."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+
+def data_version(data: dict[str, dict[str, Any]] | list[Any]) -> str:
+    """Return the version of section data, patches are published under it.
+
+    It only depends on the content, so the generator and the clients that
+    downloaded the whole file get the same version.
+    """
+    content = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+
+def create_patch(
+    current: dict[str, dict[str, Any]], updated: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """Return the patch that turns the current data into the updated data."""
+    return {
+        "remove": sorted(key for key in current if key not in updated),
+        "upsert": {
+            key: value
+            for key, value in updated.items()
+            if key not in current or current[key] != value
+        },
+        "version": data_version(updated),
+    }
+
+
+def is_patch(patch: Any) -> bool:
+    """Return True if the content is a patch."""
+    return (
+        isinstance(patch, dict)
+        and isinstance(patch.get("version"), str)
+        and isinstance(patch.get("upsert"), dict)
+        and isinstance(patch.get("remove"), list)
+    )
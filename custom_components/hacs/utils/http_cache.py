@@ -0,0 +1,239 @@
+"""Persistent HTTP cache for GitHub API responses."""
+
+from __future__ import annotations
+
+import base64
+from collections import OrderedDict
+import hashlib
+from typing import Any
+import zlib
+
+from aiohttp import ClientResponse, ClientSession, hdrs
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+from multidict import CIMultiDict
+from yarl import URL
+
+from ..const import HTTP_CACHE_MAX_SIZE, HTTP_CACHE_SAVE_DELAY
+from .logger import LOGGER
+from .store import get_store_for_key
+
+CACHED_HOSTS = ("api.github.com",)
+UNCACHED_PATHS = ("/rate_limit",)
+CACHED_HEADERS = (hdrs.CONTENT_TYPE, hdrs.LINK)
+
+
+def _compress(body: bytes) -> str:
+    """Compress a response body for storage."""
+    return base64.b64encode(zlib.compress(body)).decode("ascii")
+
+
+def _decompress(body: str) -> bytes:
+    """Decompress a stored response body."""
+    return zlib.decompress(base64.b64decode(body))
+
+
+class CachedResponse:
+    """A response replayed from the HTTP cache after a 304."""
+
+    status = 200
+    reason = "OK"
+
+    def __init__(self, url: URL, headers: CIMultiDict[str], body: bytes) -> None:
+        """Initialize."""
+        self.url = url
+        self.headers = headers
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def text(self, encoding: str | None = None, **_: Any) -> str:
+        """Return the body as text."""
+        return self._body.decode(encoding or "utf-8")
+
+    async def json(self, *, encoding: str | None = None, loads=json_loads, **_: Any) -> Any:
+        """Return the body as JSON."""
+        return loads(self._body.decode(encoding or "utf-8"))
+
+    def raise_for_status(self) -> None:
+        """Cached responses are always successful."""
+
+    def release(self) -> None:
+        """Cached responses do not hold a connection."""
+
+
+class HacsHttpCache:
+    """Size bounded LRU cache of GitHub API responses, persisted in .storage.
+
+    Entries are keyed by the token scope, the Accept header and the full URL.
+    When an entry exists the request is made conditional, and a 304 response
+    (which does not count against the rate limit) is answered with the cached body.
+    Requests that already carry their own conditional headers, or that decode
+    the body themselves, are passed through.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        token: str | None,
+        max_size: int = HTTP_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.max_size = max_size
+        self.scope = hashlib.sha256(token.encode()).hexdigest()[:16] if token else "anonymous"
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._size = 0
+        self._dirty = False
+        self._store = get_store_for_key(hass, "http_cache")
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        requests = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / requests, 3) if requests else 0.0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": self._size,
+        }
+
+    async def async_load(self) -> None:
+        """Load stored entries."""
+        stored = await self._store.async_load() or {}
+        for key, entry in stored.get("entries", {}).items():
+            self._entries[key] = entry
+            self._size += len(entry["body"])
+        self._async_evict()
+
+    async def async_save(self) -> None:
+        """Save entries if they have changed."""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._dirty = False
+        return {"entries": dict(self._entries)}
+
+    def _key(self, url: URL, headers: CIMultiDict[str]) -> str:
+        """Return the cache key for a request."""
+        accept = headers.get(hdrs.ACCEPT, "")
+        return hashlib.sha256(f"{self.scope}|{accept}|{url}".encode()).hexdigest()
+
+    async def async_request(
+        self,
+        session: ClientSession,
+        method: str,
+        url: str | URL,
+        **kwargs: Any,
+    ) -> ClientResponse | CachedResponse:
+        """Make a request, using the cache where possible."""
+        request_url = URL(url)
+        headers = CIMultiDict(kwargs.get("headers") or {})
+        if (
+            method.upper() != hdrs.METH_GET
+            or request_url.host not in CACHED_HOSTS
+            or request_url.path in UNCACHED_PATHS
+            or hdrs.IF_NONE_MATCH in headers
+            or hdrs.IF_MODIFIED_SINCE in headers
+            or kwargs.get("auto_decompress") is False
+        ):
+            return await session.request(method, url, **kwargs)
+
+        if params := kwargs.get("params"):
+            request_url = request_url.update_query(params)
+        key = self._key(request_url, headers)
+
+        if (entry := self._entries.get(key)) is not None:
+            if entry["etag"]:
+                headers[hdrs.IF_NONE_MATCH] = entry["etag"]
+            if entry["last_modified"]:
+                headers[hdrs.IF_MODIFIED_SINCE] = entry["last_modified"]
+            kwargs = {**kwargs, "headers": headers}
+
+        response = await session.request(method, url, **kwargs)
+
+        if response.status == 304 and entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            replayed = CIMultiDict(entry["headers"])
+            replayed.update(response.headers)
+            body = await self.hass.async_add_executor_job(_decompress, entry["body"])
+            return CachedResponse(response.url, replayed, body)
+
+        self.misses += 1
+        response_headers = CIMultiDict(response.headers)
+        etag = response_headers.get(hdrs.ETAG)
+        last_modified = response_headers.get(hdrs.LAST_MODIFIED)
+        if response.status == 200 and (etag or last_modified):
+            body = await response.read()
+            if isinstance(body, bytes):
+                await self._async_set(key, response_headers, etag, last_modified, body)
+        return response
+
+    async def _async_set(
+        self,
+        key: str,
+        headers: CIMultiDict[str],
+        etag: str | None,
+        last_modified: str | None,
+        body: bytes,
+    ) -> None:
+        """Store a response body."""
+        compressed = await self.hass.async_add_executor_job(_compress, body)
+        if (previous := self._entries.pop(key, None)) is not None:
+            self._size -= len(previous["body"])
+
+        if len(compressed) > self.max_size // 8:
+            LOGGER.debug("<HacsHttpCache> Response is too large to cache (%s)", len(compressed))
+            return
+
+        self._entries[key] = {
+            "body": compressed,
+            "etag": etag,
+            "headers": {name: headers[name] for name in CACHED_HEADERS if name in headers},
+            "last_modified": last_modified,
+        }
+        self._size += len(compressed)
+        self._async_evict()
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, HTTP_CACHE_SAVE_DELAY)
+
+    def _async_evict(self) -> None:
+        """Evict least recently used entries until the cache fits."""
+        while self._size > self.max_size and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= len(entry["body"])
+            self.evictions += 1
+            self._dirty = True
+
+
+class HacsHttpCacheSession:
+    """Client session proxy that sends GitHub API requests through the cache."""
+
+    def __init__(self, session: ClientSession, cache: HacsHttpCache) -> None:
+        """Initialize."""
+        self._session = session
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+    async def request(
+        self, method: str, url: str | URL, **kwargs: Any
+    ) -> ClientResponse | CachedResponse:
+        """Make a request."""
+        return await self._cache.async_request(self._session, method, url, **kwargs)
+
+    async def get(self, url: str | URL, **kwargs: Any) -> ClientResponse | CachedResponse:
+        """Make a GET request."""
+        return await self.request(hdrs.METH_GET, url, **kwargs)
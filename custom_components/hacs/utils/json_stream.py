@@ -0,0 +1,90 @@
+"""Incremental parsing of large JSON documents."""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any
+
+WHITESPACE = " \t\n\r"
+
+
+class JsonStream:
+    """Incremental parser for a JSON object or array.
+
+    Chunks of the document are fed as they arrive, and the members of the
+    top level container are returned as soon as they are complete, as
+    (key, value) pairs for objects and (None, value) pairs for arrays.
+    Only the incomplete member is buffered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.is_array: bool | None = None
+        self.done = False
+        self._buffer = ""
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def _skip(self, index: int) -> int:
+        """Return the index of the next character that is not whitespace."""
+        while index < len(self._buffer) and self._buffer[index] in WHITESPACE:
+            index += 1
+        return index
+
+    def feed(self, chunk: bytes) -> list[tuple[str | None, Any]]:
+        """Feed a chunk, return the members it completed."""
+        self._buffer += self._utf8.decode(chunk)
+        members: list[tuple[str | None, Any]] = []
+        index = self._skip(0)
+
+        if self.is_array is None:
+            if index == len(self._buffer):
+                self._buffer = ""
+                return members
+            if self._buffer[index] not in "{[":
+                raise ValueError("Expected a JSON object or array")
+            self.is_array = self._buffer[index] == "["
+            index = self._skip(index + 1)
+
+        while not self.done and index < len(self._buffer):
+            if self._buffer[index] in "}]":
+                self.done = True
+                index += 1
+                break
+            try:
+                key = None
+                position = index
+                if not self.is_array:
+                    if self._buffer[position] != '"':
+                        raise ValueError(f"Expected a key at {position}")
+                    key, position = self._decoder.raw_decode(self._buffer, position)
+                    position = self._skip(position)
+                    if position == len(self._buffer):
+                        break
+                    if self._buffer[position] != ":":
+                        raise ValueError(f"Expected ':' at {position}")
+                    position = self._skip(position + 1)
+                value, position = self._decoder.raw_decode(self._buffer, position)
+            except json.JSONDecodeError:
+                # The member is not complete yet
+                break
+            # A number is only complete when something follows it
+            position = self._skip(position)
+            if position == len(self._buffer):
+                break
+            if self._buffer[position] == ",":
+                position = self._skip(position + 1)
+            elif self._buffer[position] not in "}]":
+                raise ValueError(f"Expected ',' at {position}")
+            members.append((key, value))
+            index = position
+
+        self._buffer = self._buffer[index:]
+        return members
+
+    def close(self) -> None:
+        """Check that the document is complete."""
+        self._buffer += self._utf8.decode(b"", final=True)
+        if not self.done or self._buffer.strip():
+            raise ValueError("Incomplete or invalid JSON document")
@@ -0,0 +1,62 @@
+"""Prefix index for repository lookups."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+
+class PrefixIndex:
+    """Sorted array of (key, value) pairs that supports prefix lookups.
+
+    Keys are case insensitive, and the same value can be stored under
+    multiple keys. The array is sorted lazily on the first lookup after
+    a change, so bulk registration stays cheap.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._entries: set[tuple[str, str]] = set()
+        self._sorted: list[tuple[str, str]] = []
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def add(self, key: str, value: str) -> None:
+        """Add a value under a key."""
+        entry = (key.lower(), value)
+        if entry not in self._entries:
+            self._entries.add(entry)
+            self._dirty = True
+
+    def remove(self, key: str, value: str) -> None:
+        """Remove a value stored under a key."""
+        entry = (key.lower(), value)
+        if entry in self._entries:
+            self._entries.remove(entry)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._sorted = []
+        self._dirty = False
+
+    def search(self, prefix: str, limit: int = 10) -> list[str]:
+        """Return up to limit unique values with a key starting with prefix."""
+        if self._dirty:
+            self._sorted = sorted(self._entries)
+            self._dirty = False
+
+        prefix = prefix.lower()
+        results: list[str] = []
+        index = bisect_left(self._sorted, (prefix,))
+        while index < len(self._sorted) and len(results) < limit:
+            key, value = self._sorted[index]
+            if not key.startswith(prefix):
+                break
+            if value not in results:
+                results.append(value)
+            index += 1
+        return results
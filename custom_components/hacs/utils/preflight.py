@@ -0,0 +1,90 @@
+"""Preflight check for custom repositories."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..enums import HacsCategory
+from ..exceptions import (
+    AddonRepositoryException,
+    HacsException,
+    HacsRepositoryArchivedException,
+)
+from .json import json_loads
+
+PREFLIGHT_QUERY = """
+query ($owner: String!, $name: String!, $directory: String!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    isArchived
+    defaultBranchRef { name }
+    latestRelease { tagName }
+    hacsJson: object(expression: "HEAD:hacs.json") { ... on Blob { text } }
+    root: object(expression: "HEAD:") { ... on Tree { entries { name type } } }
+    directory: object(expression: $directory) { ... on Tree { entries { name type } } }
+  }
+}
+"""
+
+# Directory each category keeps its content in, and the tree entry that has to be there.
+CATEGORY_DIRECTORIES: dict[HacsCategory, tuple[str, str, str]] = {
+    HacsCategory.APPDAEMON: ("apps", "tree", ""),
+    HacsCategory.INTEGRATION: ("custom_components", "tree", ""),
+    HacsCategory.PYTHON_SCRIPT: ("python_scripts", "blob", ".py"),
+    HacsCategory.THEME: ("themes", "blob", ".yaml"),
+}
+
+ADDON_FILES = ("repository.json", "repository.yaml", "repository.yml")
+
+
+def preflight_variables(repository_full_name: str, category: HacsCategory) -> dict[str, str]:
+    """Return the variables for the preflight query."""
+    owner, name = repository_full_name.split("/", 1)
+    directory = CATEGORY_DIRECTORIES.get(category, ("",))[0]
+    return {"owner": owner, "name": name, "directory": f"HEAD:{directory}"}
+
+
+def preflight_repository(
+    repository_full_name: str,
+    category: HacsCategory,
+    result: dict[str, Any] | None,
+) -> str:
+    """Validate a preflight result and return the current full name of the repository.
+
+    Only problems that the full registration would also reject are raised here,
+    anything that depends on the release that will be used is left to the registration.
+    """
+    string = f"<{category.title()} {repository_full_name}>"
+    if not result:
+        raise HacsException(f"{string} Repository does not exist.")
+
+    if result["isArchived"]:
+        raise HacsRepositoryArchivedException(f"{string} Repository is archived.")
+
+    full_name = repository_full_name
+    if result["nameWithOwner"].lower() != repository_full_name.lower():
+        full_name = result["nameWithOwner"]
+
+    if result["latestRelease"] is not None or category not in CATEGORY_DIRECTORIES:
+        return full_name
+
+    manifest = {}
+    if result["hacsJson"] is not None:
+        try:
+            manifest = json_loads(result["hacsJson"]["text"])
+        except ValueError:
+            manifest = {}
+    if not isinstance(manifest, dict) or manifest.get("content_in_root"):
+        return full_name
+
+    _, entry_type, suffix = CATEGORY_DIRECTORIES[category]
+    entries = (result["directory"] or {}).get("entries", [])
+    if any(entry["type"] == entry_type and entry["name"].endswith(suffix) for entry in entries):
+        return full_name
+
+    root = {entry["name"] for entry in (result["root"] or {}).get("entries", [])}
+    if category == HacsCategory.INTEGRATION and root.intersection(ADDON_FILES):
+        raise AddonRepositoryException()
+
+    branch = (result["defaultBranchRef"] or {}).get("name", "HEAD")
+    raise HacsException(f"{string} Repository structure for {branch} is not compliant")
@@ -0,0 +1,183 @@
+"""GitHub API rate limit budget, driven by the x-ratelimit-* response headers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession, hdrs
+from multidict import CIMultiDict
+from yarl import URL
+
+from ..const import RATE_LIMIT_RESERVE
+from ..enums import RateLimitPriority
+
+HEADER_LIMIT = "X-RateLimit-Limit"
+HEADER_REMAINING = "X-RateLimit-Remaining"
+HEADER_RESET = "X-RateLimit-Reset"
+HEADER_RESOURCE = "X-RateLimit-Resource"
+HEADER_USED = "X-RateLimit-Used"
+
+# Limits for an authenticated user, used until the first response tells otherwise.
+DEFAULT_LIMITS = {"core": 5000, "graphql": 5000, "search": 30}
+# Longest pause between units of work when the budget is paced
+MAX_PACING_DELAY = 60
+
+
+@dataclass
+class RateLimitBucket:
+    """Budget for a single GitHub API resource."""
+
+    limit: int
+    remaining: int
+    reset: float | None = None
+    used: int = 0
+
+    def refill(self, now: float) -> None:
+        """Refill the bucket when the rate limit window has passed."""
+        if self.reset is not None and now >= self.reset:
+            self.remaining = self.limit
+            self.reset = None
+            self.used = 0
+
+
+class HacsRateLimit:
+    """Token bucket per GitHub API resource.
+
+    The buckets are updated from the rate limit headers of every GitHub API response,
+    callers are handed budget from them without extra calls to /rate_limit.
+    Background work keeps a reserve so user initiated actions can still go through.
+    """
+
+    def __init__(
+        self,
+        reserve: int = RATE_LIMIT_RESERVE,
+        time_func: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize."""
+        self.reserve = reserve
+        self._time = time_func
+        self.buckets = {
+            resource: RateLimitBucket(limit=limit, remaining=limit)
+            for resource, limit in DEFAULT_LIMITS.items()
+        }
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the current state of the buckets."""
+        now = self._time()
+        for bucket in self.buckets.values():
+            bucket.refill(now)
+        return {
+            resource: {
+                "limit": bucket.limit,
+                "remaining": bucket.remaining,
+                "reset": bucket.reset,
+                "used": bucket.used,
+            }
+            for resource, bucket in self.buckets.items()
+        }
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Update a bucket from the rate limit headers of a response."""
+        headers = CIMultiDict(headers)
+        if HEADER_REMAINING not in headers:
+            return
+        try:
+            remaining = int(headers[HEADER_REMAINING])
+            limit = int(headers.get(HEADER_LIMIT, remaining))
+            reset = float(headers[HEADER_RESET]) if HEADER_RESET in headers else None
+            used = int(headers.get(HEADER_USED, limit - remaining))
+        except ValueError:
+            return
+
+        resource = headers.get(HEADER_RESOURCE, "core")
+        self.buckets[resource] = RateLimitBucket(
+            limit=limit,
+            remaining=remaining,
+            reset=reset,
+            used=used,
+        )
+
+    def available(
+        self,
+        resource: str = "core",
+        priority: RateLimitPriority = RateLimitPriority.BACKGROUND,
+    ) -> int:
+        """Return the number of calls that can be made for a priority."""
+        if (bucket := self.buckets.get(resource)) is None:
+            return 0
+        bucket.refill(self._time())
+        reserve = self.reserve if priority == RateLimitPriority.BACKGROUND else 0
+        return max(bucket.remaining - reserve, 0)
+
+    def consume_estimate(
+        self,
+        cost: int,
+        count: int = 1,
+        resource: str = "core",
+        priority: RateLimitPriority = RateLimitPriority.BACKGROUND,
+    ) -> int:
+        """Count the estimated cost of up to count units of work, return how many fit.
+
+        Nothing is reserved, the estimate only lowers the bucket until the next
+        response replaces it with the usage GitHub reports.
+        """
+        granted = min(count, self.available(resource, priority) // cost)
+        if granted > 0:
+            self.buckets[resource].remaining -= granted * cost
+        return granted
+
+    def pacing_delay(
+        self,
+        cost: int,
+        pending: int,
+        resource: str = "core",
+        priority: RateLimitPriority = RateLimitPriority.BACKGROUND,
+    ) -> float:
+        """Return the delay between units of work that spreads the budget until the reset.
+
+        The budget is the one consume_estimate hands out for the priority,
+        there is no delay when it covers all pending work.
+        """
+        if (reset := self.seconds_until_reset(resource)) is None:
+            return 0.0
+        available = self.available(resource, priority)
+        if available >= cost * pending:
+            return 0.0
+        return min(reset / max(available // cost, 1), MAX_PACING_DELAY)
+
+    def seconds_until_reset(self, resource: str = "core") -> float | None:
+        """Return the seconds until the bucket for a resource is refilled."""
+        if (bucket := self.buckets.get(resource)) is None or bucket.reset is None:
+            return None
+        return max(bucket.reset - self._time(), 0)
+
+
+class HacsRateLimitSession:
+    """Client session proxy that feeds the rate limit headers of responses to the budget."""
+
+    def __init__(self, session: ClientSession, rate_limit: HacsRateLimit) -> None:
+        """Initialize."""
+        self._session = session
+        self._rate_limit = rate_limit
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+    async def request(self, method: str, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a request."""
+        response = await self._session.request(method, url, **kwargs)
+        self._rate_limit.update_from_headers(response.headers)
+        return response
+
+    async def get(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a GET request."""
+        return await self.request(hdrs.METH_GET, url, **kwargs)
+
+    async def post(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a POST request."""
+        return await self.request(hdrs.METH_POST, url, **kwargs)
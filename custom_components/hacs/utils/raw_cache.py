@@ -0,0 +1,174 @@
+"""Disk cache for raw.githubusercontent.com files pinned to a tag or commit."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from ..const import RAW_CACHE_MAX_SIZE, RAW_CACHE_SAVE_DELAY
+from .logger import LOGGER
+from .store import get_store_for_key
+
+
+class HacsRawCache:
+    """Size bounded, content addressed disk cache for pinned raw files.
+
+    Keys are "<repository>/<ref>/<path>" where ref is a tag or commit, so the
+    content behind a key does not change. Files are stored once per sha256 of
+    their content, shared by every key that points to the same content.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_size: int = RAW_CACHE_MAX_SIZE,
+        store_key: str = "raw_cache",
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.path = Path(path)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._index: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._references: dict[str, int] = {}
+        self._size = 0
+        self._dirty = False
+        self._store = get_store_for_key(hass, store_key)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        requests = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "files": len(self._references),
+            "hit_rate": round(self.hits / requests, 3) if requests else 0.0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": self._size,
+        }
+
+    def _file(self, digest: str) -> Path:
+        """Return the path of a cached file."""
+        return self.path / digest
+
+    async def async_load(self) -> None:
+        """Load the index and remove files that are no longer referenced."""
+        stored = await self._store.async_load() or {}
+        for key, (digest, size) in stored.get("entries", {}).items():
+            self._add(key, digest, size)
+
+        def _cleanup() -> set[str]:
+            self.path.mkdir(parents=True, exist_ok=True)
+            present = {file.name for file in self.path.iterdir()}
+            for filename in present - self._references.keys():
+                self._file(filename).unlink()
+            return present
+
+        present = await self.hass.async_add_executor_job(_cleanup)
+        for key, (digest, _) in list(self._index.items()):
+            if digest not in present:
+                self._remove(key)
+        await self._async_evict()
+
+    async def async_save(self) -> None:
+        """Save the index if it has changed."""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._dirty = False
+        return {"entries": {key: list(value) for key, value in self._index.items()}}
+
+    def _add(self, key: str, digest: str, size: int) -> None:
+        """Add a key to the index."""
+        if digest not in self._references:
+            self._references[digest] = 0
+            self._size += size
+        self._references[digest] += 1
+        self._index[key] = (digest, size)
+
+    def _remove(self, key: str) -> str | None:
+        """Remove a key from the index, return the digest if its file is now unused."""
+        digest, size = self._index.pop(key)
+        self._references[digest] -= 1
+        if self._references[digest] == 0:
+            del self._references[digest]
+            self._size -= size
+            return digest
+        return None
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Return cached content for a key."""
+        if (entry := self._index.get(key)) is None:
+            self.misses += 1
+            return None
+
+        def _read() -> bytes | None:
+            try:
+                return self._file(entry[0]).read_bytes()
+            except OSError:
+                return None
+
+        if (content := await self.hass.async_add_executor_job(_read)) is None:
+            self.misses += 1
+            self._remove(key)
+            self._dirty = True
+            return None
+
+        self.hits += 1
+        self._index.move_to_end(key)
+        return content
+
+    async def async_set(self, key: str, content: bytes) -> None:
+        """Cache content for a key."""
+        if not isinstance(content, bytes) or len(content) > self.max_size // 8:
+            return
+        if key in self._index:
+            return
+
+        digest = hashlib.sha256(content).hexdigest()
+        if digest not in self._references:
+
+            def _write() -> None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                self._file(digest).write_bytes(content)
+
+            try:
+                await self.hass.async_add_executor_job(_write)
+            except OSError as exception:
+                LOGGER.debug("<HacsRawCache> Could not write %s - %s", key, exception)
+                return
+
+        if key in self._index:
+            # Cached by a concurrent download while the file was written
+            return
+
+        self._add(key, digest, len(content))
+        await self._async_evict()
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, RAW_CACHE_SAVE_DELAY)
+
+    async def _async_evict(self) -> None:
+        """Evict least recently used keys until the cache fits."""
+        unused = []
+        while self._size > self.max_size and self._index:
+            if (digest := self._remove(next(iter(self._index)))) is not None:
+                unused.append(digest)
+            self._dirty = True
+
+        if not unused:
+            return
+
+        def _delete() -> None:
+            for digest in unused:
+                self._file(digest).unlink(missing_ok=True)
+
+        await self.hass.async_add_executor_job(_delete)
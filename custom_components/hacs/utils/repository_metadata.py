@@ -0,0 +1,89 @@
+"""Batched GraphQL metadata for repositories."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..repositories.base import RepositoryData
+
+METADATA_FRAGMENT = """
+fragment metadata on Repository {
+  nameWithOwner
+  isArchived
+  pushedAt
+  stargazerCount
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  defaultBranchRef { name target { oid } }
+  releases(first: 10, orderBy: {field: CREATED_AT, direction: DESC}) {
+    nodes { tagName isDraft isPrerelease }
+  }
+}
+"""
+
+# Fields that are only refreshed when they differ, anything else requires a full update.
+METADATA_FIELDS = ("last_updated", "open_issues", "stargazers_count")
+
+
+def metadata_query(count: int) -> str:
+    """Return a query for the metadata of count repositories."""
+    arguments = ", ".join(f"$owner{idx}: String!, $name{idx}: String!" for idx in range(count))
+    aliases = "\n".join(
+        f"  r{idx}: repository(owner: $owner{idx}, name: $name{idx}) {{ ...metadata }}"
+        for idx in range(count)
+    )
+    return f"query ({arguments}) {{\n{aliases}\n}}\n{METADATA_FRAGMENT}"
+
+
+def metadata_variables(repository_full_names: Iterable[str]) -> dict[str, str]:
+    """Return the variables for a metadata query."""
+    variables = {}
+    for idx, full_name in enumerate(repository_full_names):
+        variables[f"owner{idx}"], variables[f"name{idx}"] = full_name.split("/", 1)
+    return variables
+
+
+def parse_metadata(result: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Convert the result for a single repository to repository data."""
+    if not result:
+        return None
+
+    last_version = None
+    prerelease = None
+    for release in result["releases"]["nodes"]:
+        if release["isDraft"]:
+            continue
+        if release["isPrerelease"]:
+            if prerelease is None:
+                prerelease = release["tagName"]
+        else:
+            last_version = release["tagName"]
+            break
+
+    branch = result["defaultBranchRef"] or {}
+    return {
+        "archived": result["isArchived"],
+        "default_branch": branch.get("name"),
+        "full_name": result["nameWithOwner"],
+        "last_commit": (branch.get("target") or {}).get("oid", "")[:7] or None,
+        "last_updated": result["pushedAt"],
+        "last_version": last_version,
+        "open_issues": result["issues"]["totalCount"] + result["pullRequests"]["totalCount"],
+        "prerelease": prerelease,
+        "stargazers_count": result["stargazerCount"],
+    }
+
+
+def metadata_moved(data: RepositoryData, metadata: dict[str, Any] | None) -> bool:
+    """Return True if the repository needs a full update."""
+    if metadata is None:
+        return True
+    if metadata["full_name"].lower() != data.full_name.lower():
+        return True
+    return any(
+        getattr(data, key) != value
+        for key, value in metadata.items()
+        if key not in METADATA_FIELDS and key != "full_name"
+    )
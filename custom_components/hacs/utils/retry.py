@@ -0,0 +1,229 @@
+"""Retry with backoff, and circuit breaking per upstream host."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import random
+import time
+from typing import Any
+
+from aiohttp import ClientConnectionError, ClientResponse, ClientSession, hdrs
+from multidict import CIMultiDict
+from yarl import URL
+
+from ..const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+from .concurrency import retry_after
+
+
+class CircuitOpenError(ClientConnectionError):
+    """Requests to the host are stopped after too many failures."""
+
+    def __init__(self, host: str) -> None:
+        """Initialize."""
+        super().__init__(f"Too many failed requests to {host}, retrying later")
+        self.host = host
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before a failed request is retried.
+
+    Only idempotent requests are retried. The wait is the one asked for by the
+    Retry-After or rate limit reset headers, otherwise exponential backoff with full jitter.
+    Requests are not retried when the host asks to wait longer than max_delay.
+    """
+
+    attempts: int = RETRY_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    statuses: frozenset[int] = frozenset((429, 500, 502, 503, 504))
+    methods: frozenset[str] = frozenset((hdrs.METH_GET, hdrs.METH_HEAD))
+    random_func: Callable[[], float] = field(default=random.random, compare=False)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered backoff after a failed attempt (0 based)."""
+        return self.random_func() * min(self.max_delay, self.base_delay * 2**attempt)
+
+    def response_delay(
+        self,
+        attempt: int,
+        status: int,
+        headers: CIMultiDict[str],
+        now: float,
+    ) -> float | None:
+        """Return how long to wait before retrying a response, None if it should not be."""
+        requested = retry_after(headers, now)
+        if status not in self.statuses and not (status == 403 and requested is not None):
+            return None
+        if requested is None:
+            return self.backoff(attempt)
+        return requested if requested <= self.max_delay else None
+
+
+class CircuitBreaker:
+    """Stops requests to a host after consecutive failures.
+
+    Once the cooldown has passed a single request is let through as a probe,
+    the circuit closes when it succeeds and stays open for another cooldown when it fails.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: float = CIRCUIT_BREAKER_COOLDOWN,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = 0
+        self._time = time_func
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit."""
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._probing else "open"
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the current state."""
+        return {"failures": self.failures, "opened": self.opened, "state": self.state}
+
+    def allow(self) -> bool:
+        """Return if a request can be made."""
+        if self._opened_at is None:
+            return True
+        now = self._time()
+        if now - self._opened_at < self.cooldown:
+            return False
+        # Restarting the cooldown lets a single probe through
+        self._opened_at = now
+        self._probing = True
+        return True
+
+    def success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def failure(self) -> None:
+        """Count a failed request, and open the circuit at the threshold."""
+        self.failures += 1
+        if self._probing or (self._opened_at is None and self.failures >= self.threshold):
+            if self._opened_at is None:
+                self.opened += 1
+            self._opened_at = self._time()
+            self._probing = False
+
+
+class HacsRetry:
+    """Retry policy and circuit breakers, shared per upstream host."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize."""
+        self.policy = policy or RetryPolicy()
+        self.retries = 0
+        self.gave_up = 0
+        self.rejected = 0
+        self._time = time_func
+        self._hosts: dict[str, CircuitBreaker] = {}
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the retry counters and the state per host."""
+        return {
+            "gave_up": self.gave_up,
+            "hosts": {host: breaker.stats for host, breaker in sorted(self._hosts.items())},
+            "rejected": self.rejected,
+            "retries": self.retries,
+        }
+
+    def host(self, host: str) -> CircuitBreaker:
+        """Return the circuit breaker for a host."""
+        if (breaker := self._hosts.get(host)) is None:
+            breaker = self._hosts[host] = CircuitBreaker(time_func=self._time)
+        return breaker
+
+
+class HacsRetrySession:
+    """Client session proxy that retries failed requests, and stops requests to failing hosts.
+
+    Wrap it around the concurrency limited session so no slot is held while waiting.
+    Only getting the response is retried, timeouts while reading the body after the
+    headers arrived are raised to the caller.
+    """
+
+    def __init__(self, session: ClientSession, retry: HacsRetry) -> None:
+        """Initialize."""
+        self._session = session
+        self._retry = retry
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+    async def request(self, method: str, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a request."""
+        host = URL(url).host or ""
+        breaker = self._retry.host(host)
+        policy = self._retry.policy
+        retryable = method.upper() in policy.methods
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self._retry.rejected += 1
+                raise CircuitOpenError(host)
+            last_attempt = not retryable or attempt + 1 >= policy.attempts
+            try:
+                response = await self._session.request(method, url, **kwargs)
+            except (ClientConnectionError, TimeoutError):
+                breaker.failure()
+                if last_attempt:
+                    self._retry.gave_up += 1 if retryable else 0
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if response.status >= 500:
+                    breaker.failure()
+                else:
+                    breaker.success()
+                delay = policy.response_delay(
+                    attempt, response.status, CIMultiDict(response.headers), time.time()
+                )
+                if delay is None:
+                    return response
+                if last_attempt:
+                    self._retry.gave_up += 1 if retryable else 0
+                    return response
+                if (release := getattr(response, "release", None)) is not None:
+                    release()
+
+            attempt += 1
+            self._retry.retries += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a GET request."""
+        return await self.request(hdrs.METH_GET, url, **kwargs)
+
+    async def post(self, url: str | URL, **kwargs: Any) -> ClientResponse:
+        """Make a POST request."""
+        return await self.request(hdrs.METH_POST, url, **kwargs)
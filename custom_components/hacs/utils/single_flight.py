@@ -0,0 +1,106 @@
+"""Coalesce concurrent identical requests into a single call."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+import time
+from typing import Any, TypeVar
+
+from ..const import SINGLE_FLIGHT_MEMO_TTL
+
+_T = TypeVar("_T")
+
+
+def call_key(method: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> str:
+    """Return a key identifying a call of a bound method with its arguments."""
+    owner = getattr(method, "__self__", None)
+    name = getattr(method, "__qualname__", repr(method))
+    return f"{name}|{id(owner)}|{args!r}|{sorted(kwargs.items())!r}"
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers asking for the same key.
+
+    While a refresh cycle is running, results are also kept for a short time so
+    repeated requests in the same cycle are answered without a new call.
+    Exceptions are passed to every waiting caller, but are never kept.
+    """
+
+    def __init__(
+        self,
+        ttl: float = SINGLE_FLIGHT_MEMO_TTL,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize."""
+        self.ttl = ttl
+        self._time = time_func
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._memo: dict[Hashable, tuple[float, Any]] = {}
+        self._cycles = 0
+        self.calls = 0
+        self.coalesced = 0
+        self.memo_hits = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the number of calls made and saved."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "memo_hits": self.memo_hits,
+            "saved": self.coalesced + self.memo_hits,
+        }
+
+    @asynccontextmanager
+    async def async_cycle(self) -> AsyncIterator[None]:
+        """Keep results for repeated requests until the outermost cycle ends."""
+        self._cycles += 1
+        try:
+            yield
+        finally:
+            self._cycles -= 1
+            if not self._cycles:
+                self._memo.clear()
+
+    async def async_call(
+        self,
+        key: Hashable,
+        job: Callable[[], Awaitable[_T]],
+        *,
+        memo: bool = True,
+    ) -> _T:
+        """Run job, or wait for the identical call that is already running."""
+        if memo and (entry := self._memo.get(key)) is not None:
+            if entry[0] > self._time():
+                self.memo_hits += 1
+                return entry[1]
+            del self._memo[key]
+
+        if (task := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            task = asyncio.get_running_loop().create_task(self._async_run(key, job, memo))
+            # Make sure a failure nobody waits for anymore is not reported as unhandled
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._inflight[key] = task
+
+        # The call continues for the other callers if this one is cancelled
+        return await asyncio.shield(task)
+
+    async def _async_run(
+        self,
+        key: Hashable,
+        job: Callable[[], Awaitable[_T]],
+        memo: bool,
+    ) -> _T:
+        """Run the job for a key."""
+        try:
+            result = await job()
+        finally:
+            self._inflight.pop(key, None)
+        if memo and self._cycles:
+            self._memo[key] = (self._time() + self.ttl, result)
+        return result
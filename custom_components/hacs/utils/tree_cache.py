@@ -0,0 +1,54 @@
+"""Disk cache for recursive git trees."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import json
+from typing import Any
+
+from aiogithubapi.models.git_tree import GitHubGitTreeEntryModel
+from homeassistant.core import HomeAssistant
+
+from ..const import TREE_CACHE_MAX_SIZE
+from .json import json_loads
+from .raw_cache import HacsRawCache
+
+TREE_ENTRY_KEYS = ("mode", "path", "sha", "size", "type")
+
+
+class HacsTreeCache(HacsRawCache):
+    """Size bounded disk cache for recursive git trees.
+
+    Trees are immutable by SHA, so they are stored by tree SHA, and under the
+    "<repository>/<commit>" keys of the commits that point to them. Tags and
+    branches can be moved, so they are only resolved through their tree SHA.
+    Keys that point to the same tree share a single file.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_size: int = TREE_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize."""
+        super().__init__(hass, path, max_size=max_size, store_key="tree_cache")
+
+    async def async_get_tree(self, key: str) -> list[GitHubGitTreeEntryModel] | None:
+        """Return a cached tree."""
+        if (content := await self.async_get(key)) is None:
+            return None
+        return [GitHubGitTreeEntryModel(entry) for entry in json_loads(content)]
+
+    async def async_set_tree(
+        self,
+        keys: Iterable[str],
+        tree: list[GitHubGitTreeEntryModel],
+    ) -> None:
+        """Cache a tree under each of the keys."""
+        entries: list[dict[str, Any]] = [
+            {key: getattr(entry, key) for key in TREE_ENTRY_KEYS} for entry in tree
+        ]
+        content = json.dumps(entries, separators=(",", ":")).encode()
+        for key in keys:
+            await self.async_set(key, content)
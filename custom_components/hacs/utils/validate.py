@@ -11,6 +11,7 @@ from homeassistant.helpers.config_validation import url as url_validator
 import voluptuous as vol
 
 from ..const import LOCALE
+from .compiled_schema import Check, CompiledValidator, compile_check
 
 
 @dataclass
@@ -213,3 +214,68 @@ VALIDATE_GENERATED_V2_REMOVED_REPO_SCHEMA = vol.Schema(
         )
     ]
 )
+
+
+def _compiled_repo_data_check(schema: dict[str, Any], extra: int) -> Check:
+    """Return the compiled check for repo data, including validate_version."""
+    check = compile_check(schema, extra)
+    return lambda data: check(data) and ("last_commit" in data or "last_version" in data)
+
+
+def _compiled_generated_repo_data_check(schema: dict[str, Any]) -> Check:
+    """Return the compiled check for the generated data of a category."""
+    check = _compiled_repo_data_check(schema, vol.PREVENT_EXTRA)
+    return lambda data: (
+        isinstance(data, dict)
+        and all(isinstance(key, str) and check(value) for key, value in data.items())
+    )
+
+
+def _remove_extra(schema: dict[vol.Marker, Any]) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return a function that drops the keys the schema does not know, like REMOVE_EXTRA."""
+    keys = frozenset(key.schema for key in schema)
+    return lambda data: {key: value for key, value in data.items() if key in keys}
+
+
+# Compiled equivalents of the validators above, valid data skips voluptuous,
+# invalid data is passed to the voluptuous validator to raise the same errors.
+COMPILED_FETCHED_V2_REPO_DATA = {
+    category: CompiledValidator(
+        VALIDATE_FETCHED_V2_REPO_DATA[category],
+        _compiled_repo_data_check(schema, vol.REMOVE_EXTRA),
+    )
+    for category, schema in _V2_REPO_SCHEMAS.items()
+}
+
+COMPILED_GENERATED_V2_REPO_DATA = {
+    category: CompiledValidator(
+        VALIDATE_GENERATED_V2_REPO_DATA[category],
+        _compiled_generated_repo_data_check(schema),
+        dict,
+    )
+    for category, schema in _V2_REPO_SCHEMAS.items()
+}
+
+COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA = CompiledValidator(
+    VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    compile_check(VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA),
+    _remove_extra(V2_CRITICAL_REPO_DATA_SCHEMA),
+)
+
+COMPILED_GENERATED_V2_CRITICAL_REPO_SCHEMA = CompiledValidator(
+    VALIDATE_GENERATED_V2_CRITICAL_REPO_SCHEMA,
+    compile_check(VALIDATE_GENERATED_V2_CRITICAL_REPO_SCHEMA),
+    lambda data: [dict(item) for item in data],
+)
+
+COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA = CompiledValidator(
+    VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    compile_check(VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA),
+    _remove_extra(V2_REMOVED_REPO_DATA_SCHEMA),
+)
+
+COMPILED_GENERATED_V2_REMOVED_REPO_SCHEMA = CompiledValidator(
+    VALIDATE_GENERATED_V2_REMOVED_REPO_SCHEMA,
+    compile_check(VALIDATE_GENERATED_V2_REMOVED_REPO_SCHEMA),
+    lambda data: [dict(item) for item in data],
+)
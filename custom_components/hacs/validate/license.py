@@ -69,7 +69,7 @@ class Validator(ActionValidationBase):
             )
             return
 
-        result = await self.hacs.async_download_file(SPDX_LICENSE_LIST_URL, handle_rate_limit=True)
+        result = await self.hacs.async_download_file(SPDX_LICENSE_LIST_URL)
         if result is None:
             raise ValidationException("Could not fetch the SPDX license list")
 
@@ -13,8 +13,11 @@ from ..const import DOMAIN
 from .critical import hacs_critical_acknowledge, hacs_critical_list
 from .repositories import (
     hacs_repositories_add,
+    hacs_repositories_autocomplete,
     hacs_repositories_clear_new,
+    hacs_repositories_download_many,
     hacs_repositories_list,
+    hacs_repositories_refresh_many,
     hacs_repositories_remove,
     hacs_repositories_removed,
 )
@@ -56,7 +59,10 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
 
     websocket_api.async_register_command(hass, hacs_repositories_list)
     websocket_api.async_register_command(hass, hacs_repositories_add)
+    websocket_api.async_register_command(hass, hacs_repositories_autocomplete)
+    websocket_api.async_register_command(hass, hacs_repositories_refresh_many)
     websocket_api.async_register_command(hass, hacs_repositories_clear_new)
+    websocket_api.async_register_command(hass, hacs_repositories_download_many)
     websocket_api.async_register_command(hass, hacs_repositories_removed)
     websocket_api.async_register_command(hass, hacs_repositories_remove)
     websocket_api.async_register_command(hass, hacs_repository_releases)
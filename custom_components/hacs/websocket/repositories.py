@@ -13,11 +13,13 @@ from custom_components.hacs.utils import regex
 
 from ..const import DOMAIN
 from ..enums import HacsDispatchEvent
+from ..exceptions import HacsExecutionStillInProgress
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository
 
 
 @websocket_api.websocket_command(
@@ -167,6 +169,7 @@ async def hacs_repositories_add(
             await hacs.async_register_repository(
                 repository_full_name=repository,
                 category=category,
+                preflight=True,
             )
 
         except (
@@ -214,3 +217,144 @@ async def hacs_repositories_remove(
     await hacs.data.async_write()
 
     connection.send_message(websocket_api.result_message(msg["id"], {}))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/download_many",
+        vol.Required("repositories"): [cv.string],
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_download_many(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Download multiple repositories."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    repositories = []
+    for repository_id in msg["repositories"]:
+        if (repository := hacs.repositories.get_by_id(repository_id)) is None:
+            connection.send_error(
+                msg["id"],
+                "repository_not_found",
+                f"Repository with ID ({repository_id}) not found",
+            )
+            return
+        repositories.append(repository)
+
+    try:
+        failed = await hacs.async_download_repositories(repositories)
+    except HacsExecutionStillInProgress as exception:
+        connection.send_error(msg["id"], "in_progress", str(exception))
+        return
+
+    connection.send_message(websocket_api.result_message(msg["id"], {"failed": failed}))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/refresh_many",
+        vol.Optional("repositories"): [cv.string],
+        vol.Optional("categories"): [str],
+        vol.Optional("custom"): cv.boolean,
+        vol.Optional("downloaded"): cv.boolean,
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_refresh_many(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Refresh multiple repositories, selected by ID or filters."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    if (repository_ids := msg.get("repositories")) is not None:
+        candidates = []
+        for repository_id in repository_ids:
+            if (repository := hacs.repositories.get_by_id(repository_id)) is None:
+                connection.send_error(
+                    msg["id"],
+                    "repository_not_found",
+                    f"Repository with ID ({repository_id}) not found",
+                )
+                return
+            candidates.append(repository)
+    else:
+        candidates = hacs.repositories.list_all
+
+    def _selected(repo: HacsRepository) -> bool:
+        custom = not hacs.repositories.is_default(str(repo.data.id))
+        return (
+            repo.data.category in msg.get("categories", hacs.common.categories)
+            and msg.get("downloaded", repo.data.installed) == repo.data.installed
+            and msg.get("custom", custom) == custom
+        )
+
+    repositories = [repo for repo in candidates if _selected(repo)]
+
+    connection.send_message(
+        websocket_api.result_message(
+            msg["id"],
+            await hacs.async_refresh_repositories(repositories),
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/autocomplete",
+        vol.Required("query"): cv.string,
+        vol.Optional("limit", default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+        vol.Optional("categories"): [str],
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_autocomplete(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Suggest repositories where the full name or name starts with the query."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    query = msg["query"].strip()
+    limit = msg["limit"]
+    categories = msg.get("categories", hacs.common.categories)
+    results = []
+
+    if query:
+        # Overfetch so category filtering still leaves enough suggestions.
+        for repository in hacs.repositories.search(query, limit * 4):
+            if len(results) == limit:
+                break
+            if repository.data.category in categories:
+                results.append(_autocomplete_entry(repository, repository.data.full_name))
+
+        for old_name in hacs.repositories.search_renamed(
+            query, hacs.common.renamed_repositories, limit
+        ):
+            if len(results) == limit:
+                break
+            new_name = hacs.common.renamed_repositories[old_name]
+            repository = hacs.repositories.get_by_full_name(new_name)
+            if repository is not None and repository.data.category not in categories:
+                continue
+            if any(result["full_name"] == new_name for result in results):
+                continue
+            results.append({**_autocomplete_entry(repository, new_name), "renamed_from": old_name})
+
+    connection.send_message(websocket_api.result_message(msg["id"], results))
+
+
+def _autocomplete_entry(repository: HacsRepository | None, full_name: str) -> dict[str, Any]:
+    """Return an autocomplete result entry."""
+    return {
+        "category": repository.data.category if repository else None,
+        "full_name": full_name,
+        "id": str(repository.data.id) if repository else None,
+        "installed": repository.data.installed if repository else False,
+    }
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository
 
 
 @websocket_api.websocket_command(
@@ -44,60 +45,78 @@ async def hacs_repository_info(
         )
         return
 
-    if not repository.updated_info:
-        try:
-            await repository.update_repository(ignore_issues=True, force=True)
-        except Exception as exception:  # pylint: disable=broad-except
-            repository.logger.error("%s %s", repository.string, exception)
-        repository.updated_info = True
+    if not repository.updated_info and repository.updated_info_task is None:
+        repository.updated_info_task = hass.async_create_task(
+            _async_refresh_repository_info(hacs, repository),
+            f"hacs_repository_info_{repository_id}",
+        )
 
     if repository.data.new:
         repository.data.new = False
         await hacs.data.async_write()
 
     connection.send_message(
-        websocket_api.result_message(
-            msg["id"],
-            {
-                "additional_info": repository.additional_info,
-                "authors": repository.data.authors,
-                "available_version": repository.display_available_version,
-                "beta": repository.data.show_beta,
-                "can_download": repository.can_download,
-                "category": repository.data.category,
-                "config_flow": repository.data.config_flow,
-                "country": repository.repository_manifest.country,
-                "custom": not hacs.repositories.is_default(str(repository.data.id)),
-                "default_branch": repository.data.default_branch,
-                "description": repository.data.description,
-                "domain": repository.data.domain,
-                "downloads": repository.data.downloads,
-                "file_name": repository.data.file_name,
-                "full_name": repository.data.full_name,
-                "hide_default_branch": repository.repository_manifest.hide_default_branch,
-                "homeassistant": repository.repository_manifest.homeassistant,
-                "id": repository.data.id,
-                "installed_version": repository.display_installed_version,
-                "installed": repository.data.installed,
-                "issues": repository.data.open_issues,
-                "last_updated": repository.data.last_updated,
-                "local_path": repository.content.path.local,
-                "name": repository.display_name,
-                "new": False,
-                "pending_upgrade": repository.pending_update,
-                "releases": repository.data.published_tags,
-                "ref": repository.ref,
-                "selected_tag": repository.data.selected_tag,
-                "stars": repository.data.stargazers_count,
-                "state": repository.state,
-                "status": repository.display_status,
-                "topics": repository.data.topics,
-                "version_or_commit": repository.display_version_or_commit,
-            },
-        )
+        websocket_api.result_message(msg["id"], _repository_info(hacs, repository))
     )
 
 
+async def _async_refresh_repository_info(hacs: HacsBase, repository: HacsRepository) -> None:
+    """Refresh the repository in the background and push the result to subscribers."""
+    try:
+        await repository.update_repository(ignore_issues=True, force=True)
+    except Exception as exception:  # pylint: disable=broad-except
+        repository.logger.error("%s %s", repository.string, exception)
+    finally:
+        repository.updated_info = True
+        repository.updated_info_task = None
+
+    hacs.async_dispatch(
+        HacsDispatchEvent.REPOSITORY_INFO,
+        _repository_info(hacs, repository),
+    )
+
+
+def _repository_info(hacs: HacsBase, repository: HacsRepository) -> dict[str, Any]:
+    """Return the information about a repository that is sent to the frontend."""
+    return {
+        "additional_info": repository.additional_info,
+        "authors": repository.data.authors,
+        "available_version": repository.display_available_version,
+        "beta": repository.data.show_beta,
+        "can_download": repository.can_download,
+        "category": repository.data.category,
+        "config_flow": repository.data.config_flow,
+        "country": repository.repository_manifest.country,
+        "custom": not hacs.repositories.is_default(str(repository.data.id)),
+        "default_branch": repository.data.default_branch,
+        "description": repository.data.description,
+        "domain": repository.data.domain,
+        "downloads": repository.data.downloads,
+        "file_name": repository.data.file_name,
+        "full_name": repository.data.full_name,
+        "hide_default_branch": repository.repository_manifest.hide_default_branch,
+        "homeassistant": repository.repository_manifest.homeassistant,
+        "id": repository.data.id,
+        "installed_version": repository.display_installed_version,
+        "installed": repository.data.installed,
+        "issues": repository.data.open_issues,
+        "last_updated": repository.data.last_updated,
+        "local_path": repository.content.path.local,
+        "name": repository.display_name,
+        "new": False,
+        "pending_upgrade": repository.pending_update,
+        "releases": repository.data.published_tags,
+        "ref": repository.ref,
+        "selected_tag": repository.data.selected_tag,
+        "stale": not repository.updated_info,
+        "stars": repository.data.stargazers_count,
+        "state": repository.state,
+        "status": repository.display_status,
+        "topics": repository.data.topics,
+        "version_or_commit": repository.display_version_or_commit,
+    }
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repository/ignore",
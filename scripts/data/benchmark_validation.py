@@ -0,0 +1,97 @@
+"""Compare the voluptuous and compiled validators on HACS V2 data."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+from custom_components.hacs.utils.validate import (
+    COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    COMPILED_FETCHED_V2_REPO_DATA,
+    COMPILED_GENERATED_V2_REPO_DATA,
+    VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    VALIDATE_FETCHED_V2_REPO_DATA,
+    VALIDATE_GENERATED_V2_REPO_DATA,
+)
+
+FIXTURES = Path("tests", "fixtures")
+
+
+def _entries_per_second(validate: Callable[[], Any], entries: int, rounds: int) -> float:
+    """Return the best throughput of a number of rounds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        validate()
+        best = min(best, time.perf_counter() - start)
+    return entries / best
+
+
+def benchmark(section: str, file_path: str, rounds: int) -> None:
+    """Benchmark the validators of a section."""
+    with open(file_path, encoding="utf-8") as data_file:
+        data = json.loads(data_file.read())
+
+    if section in VALIDATE_FETCHED_V2_REPO_DATA:
+        entries = list(data.values())
+        pairs = {
+            "fetched": (
+                VALIDATE_FETCHED_V2_REPO_DATA[section],
+                COMPILED_FETCHED_V2_REPO_DATA[section],
+            ),
+        }
+        generated = (
+            VALIDATE_GENERATED_V2_REPO_DATA[section],
+            COMPILED_GENERATED_V2_REPO_DATA[section],
+        )
+    else:
+        entries = data
+        pairs = {
+            "fetched": {
+                "critical": (
+                    VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+                    COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+                ),
+                "removed": (
+                    VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
+                    COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA,
+                ),
+            }[section]
+        }
+        generated = None
+
+    results = {}
+    for name, (schema, compiled) in pairs.items():
+        results[name] = [
+            _entries_per_second(lambda v=v: [v(entry) for entry in entries], len(entries), rounds)
+            for v in (schema, compiled)
+        ]
+    if generated is not None:
+        results["generated"] = [
+            _entries_per_second(lambda v=v: v(data), len(entries), rounds) for v in generated
+        ]
+
+    for name, (schema, compiled) in results.items():
+        print(
+            f"{section:<14}{name:<10}{len(entries):>6} entries  "
+            f"voluptuous {schema:>10.0f}/s  compiled {compiled:>10.0f}/s  "
+            f"{compiled / schema:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        print("Usage: python3 -m scripts.data.benchmark_validation [rounds]")
+        sys.exit(1)
+    for path in sorted(Path(FIXTURES).glob("v2-*-data.json")):
+        benchmark(
+            path.name[3:-10],
+            str(path),
+            int(sys.argv[1]) if len(sys.argv) == 2 else 5,
+        )
@@ -7,6 +7,12 @@ from typing import Any
 
 import voluptuous as vol
 
+from custom_components.hacs.utils.compression import (
+    ENCODING_EXTENSIONS,
+    available_encodings,
+    compress,
+)
+
 
 def expand_and_humanize_error(content: dict[str, Any], error: vol.Invalid) -> list[str] | str:
     """Expand and humanize error."""
@@ -23,3 +29,17 @@ def print_error_and_exit(err: str, category: str, target_path: str | None = None
     else:
         print(f"::error::{err} for the {category} category")
     sys.exit(1)
+
+
+def write_precompressed(path: str) -> list[str]:
+    """Write the compressed variants of a file next to it, for hosts that serve them."""
+    with open(path, mode="rb") as source_file:
+        content = source_file.read()
+    written = []
+    for encoding in available_encodings():
+        if (extension := ENCODING_EXTENSIONS.get(encoding)) is None:
+            continue
+        with open(f"{path}.{extension}", mode="wb") as compressed_file:
+            compressed_file.write(compress(content, encoding))
+        written.append(f"{path}.{extension}")
+    return written
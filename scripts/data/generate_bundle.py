@@ -0,0 +1,54 @@
+"""Generate the HACS V2 data bundle."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+from custom_components.hacs.utils.data_patch import data_version
+
+from .common import write_precompressed
+from .generate_category_data import OUTPUT_DIR
+
+SECTIONS = (
+    "appdaemon",
+    "critical",
+    "integration",
+    "plugin",
+    "python_script",
+    "removed",
+    "template",
+    "theme",
+)
+
+
+def generate_bundle(output_dir: str = OUTPUT_DIR) -> dict[str, str]:
+    """Combine the data of the generated sections in bundle.json.
+
+    Every section has its own ETag, a hash of its content, so clients can
+    tell which sections changed since the last bundle they fetched.
+    """
+    sections = {}
+    for section in SECTIONS:
+        path = os.path.join(output_dir, section, "data.json")
+        if not os.path.isfile(path):
+            continue
+        with open(path, encoding="utf-8") as data_file:
+            data = json.loads(data_file.read())
+        sections[section] = {"etag": data_version(data), "data": data}
+
+    path = os.path.join(output_dir, "bundle.json")
+    with open(path, mode="w", encoding="utf-8") as bundle_file:
+        json.dump({"sections": sections}, bundle_file, separators=(",", ":"))
+    write_precompressed(path)
+
+    return {section: entry["etag"] for section, entry in sections.items()}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        print("Usage: python3 -m scripts.data.generate_bundle [output_dir]")
+        sys.exit(1)
+    etags = generate_bundle(*sys.argv[1:])
+    print(f"Bundled {len(etags)} sections: {', '.join(sorted(etags))}")
@@ -33,14 +33,17 @@ from custom_components.hacs.repositories.base import (
     REPOSITORY_KEYS_TO_EXPORT,
     HacsRepository,
 )
+from custom_components.hacs.utils.concurrency import HacsConcurrencySession
 from custom_components.hacs.utils.data import HacsData
+from custom_components.hacs.utils.data_patch import create_patch, data_version
 from custom_components.hacs.utils.decode import decode_content
 from custom_components.hacs.utils.decorator import concurrent
 from custom_components.hacs.utils.json import json_loads
 from custom_components.hacs.utils.queue_manager import QueueManager
-from custom_components.hacs.utils.validate import VALIDATE_GENERATED_V2_REPO_DATA
+from custom_components.hacs.utils.rate_limit import HacsRateLimitSession
+from custom_components.hacs.utils.validate import COMPILED_GENERATED_V2_REPO_DATA
 
-from .common import expand_and_humanize_error, print_error_and_exit
+from .common import expand_and_humanize_error, print_error_and_exit, write_precompressed
 
 logging.addLevelName(logging.DEBUG, "")
 logging.addLevelName(logging.INFO, "")
@@ -81,6 +84,30 @@ def dicts_are_equal(a: dict, b: dict, ignore: set[str]) -> bool:
     return _dumper(a) == _dumper(b)
 
 
+def write_patches(
+    category: str,
+    current_data: dict[str, dict[str, Any]],
+    updated_data: dict[str, dict[str, Any]],
+) -> None:
+    """Write the patches for the versions of the data next to data.json.
+
+    Clients with the current data get the changes, the patch for the updated
+    version is empty until the next run replaces it.
+    """
+    updated_data = json.loads(json.dumps(updated_data, cls=JSONEncoder))
+    patches = {
+        data_version(current_data): create_patch(current_data, updated_data),
+        data_version(updated_data): create_patch(updated_data, updated_data),
+    }
+
+    os.makedirs(os.path.join(OUTPUT_DIR, category, "patch"), exist_ok=True)
+    for key, content in patches.items():
+        path = os.path.join(OUTPUT_DIR, category, "patch", f"{key}.json")
+        with open(path, mode="w", encoding="utf-8") as patch_file:
+            json.dump(content, patch_file, separators=(",", ":"))
+        write_precompressed(path)
+
+
 def repository_has_missing_keys(
     repository: HacsRepository,
     stage: Literal["update", "store"],
@@ -167,22 +194,26 @@ class AdjustedHacs(HacsBase):
         self.data = AdjustedHacsData(hacs=self)
         self.data_client = HacsDataClient(session=session, client_name="HACS/Generator")
 
+        githubsession = HacsRateLimitSession(
+            HacsConcurrencySession(session, self.concurrency), self.rate_limit
+        )
         self.github = GitHub(
             token,
-            session,
+            githubsession,
             headers=HACS_ACTION_GITHUB_API_HEADERS,
         )
         self.githubapi = GitHubAPI(
             token=token,
-            session=session,
+            session=githubsession,
             **{"client_name": "HACS/Generator"},
         )
 
-    async def async_can_update(self) -> int:
+    @callback
+    def async_can_update(self) -> int:
         """Helper to calculate the number of repositories we can fetch data for."""
         if not os.getenv("DATA_GENERATOR_TOKEN"):
             return 10
-        return await super().async_can_update()
+        return super().async_can_update()
 
     @concurrent(concurrenttasks=10)
     async def concurrent_register_repository(
@@ -195,7 +226,7 @@ class AdjustedHacs(HacsBase):
             repository_full_name=repository_full_name, category=category, default=True
         )
 
-    @concurrent(concurrenttasks=2, backoff_time=1)
+    @concurrent(concurrenttasks=2)
     async def concurrent_update_repository(self, repository: HacsRepository) -> None:
         """Update a repository."""
         if repository_has_missing_keys(repository, "update"):
@@ -320,15 +351,16 @@ class AdjustedHacs(HacsBase):
         async def _handle_queue():
             if not self.queue.pending_tasks:
                 return
-            can_update = await self.async_can_update()
+            can_update = self.async_can_update()
             self.log.debug(
                 "Can update %s repositories, %s items in queue",
                 can_update,
                 self.queue.pending_tasks,
             )
             if can_update == 0:
-                self.log.info("Can't do anything, sleeping for 1 min.")
-                await asyncio.sleep(60)
+                delay = max(self.rate_limit.seconds_until_reset() or 60, 1)
+                self.log.info("Can't do anything, sleeping for %s seconds.", round(delay))
+                await asyncio.sleep(delay)
                 await _handle_queue()
 
             try:
@@ -498,7 +530,7 @@ async def generate_category_data(category: str, repository_name: str = None):
             did_raise = True
 
         try:
-            VALIDATE_GENERATED_V2_REPO_DATA[category](updated_data)
+            COMPILED_GENERATED_V2_REPO_DATA[category](updated_data)
         except vol.Invalid as error:
             did_raise = True
             errors = expand_and_humanize_error(updated_data, error)
@@ -546,6 +578,10 @@ async def generate_category_data(category: str, repository_name: str = None):
                 separators=(",", ":"),
                 sort_keys=True,
             )
+        for filename in ("data.json", "repositories.json"):
+            write_precompressed(os.path.join(OUTPUT_DIR, category, filename))
+        if repository_name is None:
+            write_patches(category, stored_data, updated_data)
 
         with open(
             os.path.join(OUTPUT_DIR, "diff", f"{category}_before.json"),
@@ -1,6 +1,7 @@
 # pylint: disable=missing-docstring,invalid-name
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from contextlib import contextmanager
 from contextvars import ContextVar
@@ -11,7 +12,8 @@ from types import NoneType
 from typing import Any, TypedDict
 from unittest.mock import AsyncMock, patch
 
-from aiohttp import ClientError, ClientSession, ClientWebSocketResponse
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, StreamReader
+from aiohttp.base_protocol import BaseProtocol
 from aiohttp.typedefs import StrOrURL
 from awesomeversion import AwesomeVersion
 from homeassistant import config_entries, core as ha
@@ -384,12 +386,46 @@ class WSClient:
         return await self.client.receive_json()
 
 
+class MockedBodyProtocol(BaseProtocol):
+    """Stands in for the connection the body of a mocked response is read from."""
+
+    @property
+    def connected(self) -> bool:
+        return True
+
+    def pause_reading(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def resume_reading(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
 class MockedResponse:
+    # The body is not read from a connection
+    connection = None
+
     def __init__(self, **kwargs) -> None:
         self.kwargs = kwargs
         self.exception = kwargs.get("exception")
         self.keep = kwargs.get("keep", False)
 
+    @property
+    def content(self) -> StreamReader:
+        # A new stream of the body on every access, kept responses are read more than once
+        loop = asyncio.get_running_loop()
+        stream = StreamReader(MockedBodyProtocol(loop), 2**16, loop=loop)
+
+        async def _feed() -> None:
+            try:
+                stream.feed_data(await self.read())
+            except Exception as exception:  # pylint: disable=broad-except
+                stream.set_exception(exception)
+            else:
+                stream.feed_eof()
+
+        self._feed_task = loop.create_task(_feed())
+        return stream
+
     @property
     def status(self):
         return self.kwargs.get("status", 200)
@@ -402,10 +438,14 @@ class MockedResponse:
     def headers(self):
         return self.kwargs.get("headers", {})
 
-    async def read(self, **kwargs):
-        if (content := self.kwargs.get("content")) is not None:
-            return content
-        return await self.kwargs.get("read", AsyncMock())()
+    async def read(self, **kwargs) -> bytes:
+        if (content := self.kwargs.get("content")) is None:
+            content = await self.kwargs.get("read", AsyncMock(return_value=b""))()
+        if isinstance(content, str):
+            return content.encode("utf-8")
+        if not isinstance(content, bytes):
+            return json_func.dumps(content).encode("utf-8")
+        return content
 
     async def json(self, **kwargs):
         if (content := self.kwargs.get("content")) is not None:
@@ -422,6 +462,15 @@ class MockedResponse:
             raise ClientError(self.status)
 
 
+def proxy_fixture_file(url: URL, kwargs: dict[str, Any]) -> str:
+    """Return the fixture file for a proxied request."""
+    if url.host == "api.github.com" and url.path == "/graphql":
+        variables = kwargs.get("json", {}).get("variables", {})
+        return f"fixtures/proxy/{url.host}/graphql/{variables['owner']}/{variables['name']}.json"
+    return f"fixtures/proxy/{url.host}{url.path}{'.json' if url.host in (
+        'api.github.com', 'data-v2.hacs.xyz') and not url.path.endswith('.json') else ''}"
+
+
 class ResponseMocker:
     calls: list[dict[str, Any]] = []
     responses: dict[str, MockedResponse] = {}
@@ -458,8 +507,7 @@ class ProxyClientSession(ClientSession):
             return resp
 
         url = URL(str_or_url)
-        fixture_file = f"fixtures/proxy/{url.host}{url.path}{'.json' if url.host in (
-            'api.github.com', 'data-v2.hacs.xyz') and not url.path.endswith('.json') else ''}"
+        fixture_file = proxy_fixture_file(url, kwargs)
         fp = os.path.join(
             os.path.dirname(__file__),
             fixture_file,
@@ -512,8 +560,7 @@ async def client_session_proxy(hass: ha.HomeAssistant) -> ClientSession:
             return resp
 
         url = URL(str_or_url)
-        fixture_file = f"fixtures/proxy/{url.host}{url.path}{'.json' if url.host in (
-            'api.github.com', 'data-v2.hacs.xyz') and not url.path.endswith('.json') else ''}"
+        fixture_file = proxy_fixture_file(url, kwargs)
         fp = os.path.join(
             os.path.dirname(__file__),
             fixture_file,
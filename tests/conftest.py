@@ -42,6 +42,7 @@ from custom_components.hacs.repositories import (
     HacsTemplateRepository,
     HacsThemeRepository,
 )
+from custom_components.hacs.utils.retry import HacsRetry, RetryPolicy
 from custom_components.hacs.utils.store import async_load_from_store
 
 from tests import _async_suggest_report_issue_mock_call_tracker
@@ -96,6 +97,17 @@ def set_request_context(request: pytest.FixtureRequest):
     REQUEST_CONTEXT.set(request)
 
 
+@pytest.fixture(autouse=True)
+def retry_policy() -> Generator[RetryPolicy, None, None]:
+    """Retry failed requests in tests without waiting between the attempts."""
+    policy = RetryPolicy(base_delay=0)
+    with patch(
+        "custom_components.hacs.base.HacsRetry",
+        side_effect=lambda: HacsRetry(policy),
+    ):
+        yield policy
+
+
 @pytest.fixture
 def connection():
     """Mock fixture for connection."""
@@ -1,7 +1,11 @@
 # pylint: disable=missing-module-docstring, missing-function-docstring
+import time
+from unittest.mock import patch
+
 import pytest
 
 from custom_components.hacs.base import HacsRepositories
+from custom_components.hacs.const import REPOSITORY_UPDATE_API_COST
 from custom_components.hacs.enums import HacsCategory
 
 
@@ -57,3 +61,87 @@ async def test_add_remove_repository(hacs, repository, tmpdir):
 
     # Verify second removal does not raise
     hacs.repositories.unregister(repository)
+
+
+def test_search_renamed():
+    repositories = HacsRepositories()
+    renamed = {"old/name": "new/name"}
+    assert repositories.search_renamed("old/", renamed) == ["old/name"]
+
+    # Same length changes are picked up once they are announced
+    renamed.pop("old/name")
+    renamed["other/name"] = "new/name"
+    repositories.renamed_changed()
+    assert repositories.search_renamed("old/", renamed) == []
+    assert repositories.search_renamed("other/", renamed) == ["other/name"]
+
+
+async def test_schedule_queue_after_reset(hacs):
+    recurring_tasks = len(hacs.recurring_tasks)
+    hacs.rate_limit.update_from_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 600)}
+    )
+
+    hacs.async_schedule_queue_after_reset()
+    first = hacs._queue_after_reset
+    hacs.async_schedule_queue_after_reset()
+    # The previous run is replaced, not added to the recurring tasks
+    assert hacs._queue_after_reset is not first
+    assert len(hacs.recurring_tasks) == recurring_tasks
+
+    hacs.async_cancel_queue_after_reset()
+    assert hacs._queue_after_reset is None
+
+
+async def test_process_queue_pacing(hacs):
+    executed = []
+
+    async def _update(number: int) -> None:
+        executed.append(number)
+
+    hacs.queue.clear()
+    for number in range(2):
+        hacs.queue.add(_update(number))
+    hacs.rate_limit.reserve = 0
+    hacs.rate_limit.update_from_headers(
+        {
+            "X-RateLimit-Remaining": str(REPOSITORY_UPDATE_API_COST),
+            "X-RateLimit-Reset": str(time.time() + 100),
+        }
+    )
+
+    # The budget covers one of the queued updates, the rest waits for the reset
+    with patch("custom_components.hacs.base.asyncio.sleep") as sleep:
+        await hacs.async_process_queue()
+    assert executed == [0]
+    sleep.assert_awaited_once()
+    assert 0 < sleep.call_args[0][0] <= 60
+    assert hacs._queue_after_reset is not None
+
+    hacs.async_cancel_queue_after_reset()
+    for task in hacs.queue.queue:
+        task.close()
+    hacs.queue.clear()
+
+
+async def test_process_queue_prefetch(hacs):
+    executed = []
+
+    async def _update() -> None:
+        executed.append(True)
+
+    hacs.queue.clear()
+    hacs.queue.add(_update())
+    hacs.rate_limit.reserve = 0
+    hacs.rate_limit.update_from_headers(
+        {
+            "X-RateLimit-Remaining": "5000",
+            "X-RateLimit-Reset": str(time.time() + 100),
+        }
+    )
+
+    # Pending updates are prefetched once the queue is drained
+    with patch.object(hacs, "async_prefetch_pending_updates") as prefetch:
+        await hacs.async_process_queue()
+    assert executed == [True]
+    prefetch.assert_awaited_once()
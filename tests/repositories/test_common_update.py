@@ -0,0 +1,84 @@
+"""Tests for the common update of repositories."""
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.integration import HacsIntegrationRepository
+from custom_components.hacs.utils.concurrency import HacsConcurrencySession
+
+LATENCY = 0.05
+
+
+class LatencyStandIn:
+    """Adds latency to every request, and counts the sequential round trips."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.round_trips = 0
+        self._request = HacsConcurrencySession.request
+
+    async def request(self, session: HacsConcurrencySession, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        if self.in_flight == 0:
+            self.round_trips += 1
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(LATENCY)
+            return await self._request(session, *args, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_common_update_round_trips(hacs: HacsBase) -> None:
+    """Test that independent requests of the common update are made at once."""
+    repository = HacsIntegrationRepository(hacs, "hacs-test-org/integration-basic")
+    repository.data.installed = True
+    repository.data.installed_version = "1.0.0"
+
+    stand_in = LatencyStandIn()
+    with patch.object(
+        HacsConcurrencySession,
+        "request",
+        lambda session, *args, **kwargs: stand_in.request(session, *args, **kwargs),
+    ):
+        assert await repository.common_update()
+
+    # Repository and releases, the tree of the resolved ref, then the last commit,
+    # hacs.json and the info file
+    assert stand_in.calls == 6
+    assert stand_in.round_trips == 3
+    assert repository.ref == "1.0.0"
+    assert repository.data.last_commit is not None
+    assert repository.additional_info
+
+
+async def test_common_update_unchanged_head(hacs: HacsBase) -> None:
+    """Test that nothing is fetched beyond the releases when they did not move."""
+    repository = HacsIntegrationRepository(hacs, "hacs-test-org/integration-basic")
+    repository.data.installed = True
+    repository.data.installed_version = "1.0.0"
+
+    stand_in = LatencyStandIn()
+    with patch.object(
+        HacsConcurrencySession,
+        "request",
+        lambda session, *args, **kwargs: stand_in.request(session, *args, **kwargs),
+    ):
+        assert await repository.common_update()
+        assert stand_in.calls == 6
+
+        assert not await repository.common_update()
+        assert stand_in.calls == 7
+
+        # A different installed version has to be processed again, the tree of the
+        # release is resolved again since tags can be moved, and hacs.json is served
+        # from the raw content cache
+        repository.data.installed_version = "2.0.0"
+        assert await repository.common_update()
+        assert stand_in.calls == 13
+
+        # Unless forced
+        assert await repository.common_update(force=True)
+        assert stand_in.calls == 18
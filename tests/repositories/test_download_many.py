@@ -0,0 +1,204 @@
+import asyncio
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientError
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.exceptions import HacsException
+from custom_components.hacs.repositories.base import HacsRepository
+
+from tests.common import WSClient, get_hacs
+
+REPOSITORIES = (
+    "hacs-test-org/integration-basic",
+    "hacs-test-org/template-basic",
+    "hacs-test-org/theme-basic",
+)
+
+
+async def test_download_many(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that every repository is refreshed and downloaded, and reloads run once."""
+    hacs = get_hacs(hass)
+    repositories = [hacs.repositories.get_by_full_name(name) for name in REPOSITORIES]
+    reload = AsyncMock()
+
+    async def _download(repository: HacsRepository, **kwargs: Any) -> None:
+        assert kwargs["refresh"] is False
+        kwargs["reloads"].setdefault("themes", reload)
+
+    with (
+        patch.object(HacsRepository, "update_repository", autospec=True) as update,
+        patch.object(
+            HacsRepository, "async_download_repository", autospec=True, side_effect=_download
+        ) as download,
+    ):
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/download_many",
+            {"repositories": [repository.data.id for repository in repositories]},
+        )
+
+    assert response["success"] == True
+    assert response["result"] == {"failed": {}}
+    assert update.call_count == len(repositories)
+    assert download.call_count == len(repositories)
+    reload.assert_awaited_once()
+
+
+async def test_download_many_partial_failure(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that failed repositories are reported, and the others are downloaded."""
+    hacs = get_hacs(hass)
+    refresh_failure, download_failure, success = (
+        hacs.repositories.get_by_full_name(name) for name in REPOSITORIES
+    )
+    downloaded = []
+
+    async def _update(repository: HacsRepository, **_: Any) -> None:
+        if repository is refresh_failure:
+            raise HacsException("Refresh failed")
+
+    async def _download(repository: HacsRepository, **_: Any) -> None:
+        if repository is download_failure:
+            raise HacsException("Download failed")
+        downloaded.append(repository)
+
+    with (
+        patch.object(HacsRepository, "update_repository", autospec=True, side_effect=_update),
+        patch.object(
+            HacsRepository, "async_download_repository", autospec=True, side_effect=_download
+        ) as download,
+    ):
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/download_many",
+            {
+                "repositories": [
+                    refresh_failure.data.id,
+                    download_failure.data.id,
+                    success.data.id,
+                ]
+            },
+        )
+
+    assert response["success"] == True
+    assert response["result"] == {
+        "failed": {
+            refresh_failure.data.id: "Refresh failed",
+            download_failure.data.id: "Download failed",
+        }
+    }
+    # Repositories that could not be refreshed are not downloaded
+    assert download.call_count == 2
+    assert downloaded == [success]
+
+
+async def test_download_many_download_path(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test the downloads, and that unexpected errors only fail their own repository."""
+    hacs = get_hacs(hass)
+    failure, *repositories = (hacs.repositories.get_by_full_name(name) for name in REPOSITORIES)
+    for repository in repositories:
+        # workaround for local path bug in tests
+        repository.content.path.local = repository.localpath
+    update_repository = HacsRepository.update_repository
+
+    async def _update(repository: HacsRepository, **kwargs: Any) -> None:
+        if repository is failure:
+            raise ClientError("Connection reset")
+        await update_repository(repository, **kwargs)
+
+    with patch.object(HacsRepository, "update_repository", autospec=True, side_effect=_update):
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/download_many",
+            {
+                "repositories": [
+                    failure.data.id,
+                    *(repository.data.id for repository in repositories),
+                ]
+            },
+        )
+
+    assert response["success"] == True
+    assert response["result"] == {"failed": {failure.data.id: "Connection reset"}}
+    assert failure.data.installed is False
+    for repository in repositories:
+        assert repository.data.installed is True
+        assert repository.data.installed_version == "1.0.0"
+
+
+async def test_download_many_unknown_repository(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that nothing is downloaded when a repository is unknown."""
+    hacs = get_hacs(hass)
+    repository = hacs.repositories.get_by_full_name(REPOSITORIES[0])
+
+    with patch.object(HacsRepository, "async_download_repository", autospec=True) as download:
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/download_many",
+            {"repositories": [repository.data.id, "0"]},
+        )
+
+    assert response["success"] == False
+    assert response["error"] == {
+        "code": "repository_not_found",
+        "message": "Repository with ID (0) not found",
+    }
+    download.assert_not_called()
+
+
+async def test_download_many_in_progress(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that a second bulk download is rejected, and single reloads are not deferred."""
+    hacs = get_hacs(hass)
+    repository, other = (hacs.repositories.get_by_full_name(name) for name in REPOSITORIES[:2])
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _download(_: HacsRepository, **__: Any) -> None:
+        started.set()
+        await release.wait()
+
+    with (
+        patch.object(HacsRepository, "update_repository", autospec=True),
+        patch.object(
+            HacsRepository, "async_download_repository", autospec=True, side_effect=_download
+        ),
+    ):
+        await ws_client.send_json(
+            "hacs/repositories/download_many", {"repositories": [repository.data.id]}
+        )
+        await started.wait()
+
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/download_many", {"repositories": [other.data.id]}
+        )
+        assert response["success"] == False
+        assert response["error"]["code"] == "in_progress"
+
+        # Reloads of repositories that are not part of the plan run right away
+        reload = AsyncMock()
+        await other.async_reload("custom_templates", reload)
+        reload.assert_awaited_once()
+
+        release.set()
+        response = await ws_client.receive_json()
+
+    assert response["success"] == True
+    assert response["result"] == {"failed": {}}
@@ -0,0 +1,50 @@
+"""Tests for getting the metadata files of a repository."""
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.base import HacsRepository
+
+from tests.common import client_session_proxy
+
+TREE_SHA = "9fb037999f264ba9a7fc6274d15fa3ae2ab98312"
+
+
+async def test_get_metadata_file_tag(hacs: HacsBase) -> None:
+    """Test that files of tags are downloaded from the raw CDN and kept in the raw content cache."""
+    repository = HacsRepository(hacs=hacs)
+    repository.data.full_name = "hacs-test-org/integration-basic"
+    repository.data.published_tags = ["1.0.0"]
+    repository.data.last_version = "1.0.0"
+
+    hacs.session = await client_session_proxy(hacs.hass)
+
+    # Tags can be moved, so files of a tag are only cached once its tree SHA is known
+    assert repository.raw_cache_key("1.0.0", "hacs.json") is None
+    await repository.get_tree("1.0.0")
+    assert (
+        repository.raw_cache_key("1.0.0", "hacs.json")
+        == f"hacs-test-org/integration-basic/{TREE_SHA}/hacs.json"
+    )
+
+    assert await repository.async_get_metadata_file("hacs.json", ref="1.0.0") == {
+        "name": "Proxy manifest"
+    }
+    assert (
+        await hacs.raw_cache.async_get(f"hacs-test-org/integration-basic/{TREE_SHA}/hacs.json")
+        is not None
+    )
+
+    # Other downloads of the file are served from the raw content cache
+    assert await repository.get_hacs_json_raw(version="1.0.0") == {"name": "Proxy manifest"}
+
+
+async def test_get_metadata_file_branch(hacs: HacsBase) -> None:
+    """Test that files of branches are read through the contents API."""
+    repository = HacsRepository(hacs=hacs)
+    repository.data.full_name = "hacs-test-org/integration-basic"
+    repository.data.published_tags = ["1.0.0"]
+    repository.data.last_version = "1.0.0"
+
+    hacs.session = await client_session_proxy(hacs.hass)
+    assert await repository.async_get_metadata_file("hacs.json", ref="main") == {
+        "name": "Proxy manifest"
+    }
+    assert repository.raw_cache_key("main", "hacs.json") is None
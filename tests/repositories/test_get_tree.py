@@ -0,0 +1,193 @@
+"""Tests for fetching the tree of repositories."""
+from types import SimpleNamespace
+from typing import Any
+
+from aiogithubapi.models.git_tree import GitHubGitTreeModel
+import pytest
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.const import TREE_TARGETED_MIN_SIZE
+from custom_components.hacs.repositories.base import HacsRepository
+from custom_components.hacs.repositories.integration import HacsIntegrationRepository
+from custom_components.hacs.repositories.plugin import HacsPluginRepository
+
+
+def blob(path: str) -> dict[str, Any]:
+    return {"path": path, "mode": "100644", "type": "blob", "sha": f"sha-{path}", "size": 1}
+
+
+def tree(path: str, sha: str) -> dict[str, Any]:
+    return {"path": path, "mode": "040000", "type": "tree", "sha": sha}
+
+
+class TreeStandIn:
+    """Serves trees by SHA, recursive or not, and records the requests."""
+
+    def __init__(self, trees: dict[tuple[str, bool], tuple[list[dict[str, Any]], bool]]) -> None:
+        self.trees = trees
+        self.shas: dict[str, str] = {}
+        self.requests: list[tuple[str, bool]] = []
+
+    async def get_tree(
+        self, repository: str, tree_sha: str, params: dict[str, str] | None = None
+    ) -> SimpleNamespace:
+        request = (tree_sha, params is not None and params.get("recursive") == "true")
+        self.requests.append(request)
+        entries, truncated = self.trees[request]
+        return SimpleNamespace(
+            data=GitHubGitTreeModel(
+                {
+                    "sha": self.shas.get(tree_sha, tree_sha),
+                    "tree": entries,
+                    "truncated": truncated,
+                }
+            )
+        )
+
+
+ROOT = [blob("README.md"), blob("hacs.json"), tree("custom_components", "cc"), tree("docs", "docs")]
+COMPONENTS = [
+    tree("example", "example"),
+    blob("example/manifest.json"),
+    tree("example/translations", "translations"),
+    blob("example/translations/en.json"),
+]
+RECURSIVE = [
+    *ROOT,
+    *({**entry, "path": f"custom_components/{entry['path']}"} for entry in COMPONENTS),
+    blob("docs/index.md"),
+]
+EXPECTED = [
+    "README.md",
+    "hacs.json",
+    "custom_components",
+    "docs",
+    "custom_components/example",
+    "custom_components/example/manifest.json",
+    "custom_components/example/translations",
+    "custom_components/example/translations/en.json",
+]
+
+
+def setup_repository(
+    hacs: HacsBase, repository: HacsRepository, trees: TreeStandIn, size: int
+) -> HacsRepository:
+    hacs.githubapi.repos.git.get_tree = trees.get_tree
+    repository.repository_object = SimpleNamespace(attributes={"size": size})
+    return repository
+
+
+async def test_get_tree_small_repository(hacs: HacsBase) -> None:
+    """Test that the tree of small repositories is fetched in a single request."""
+    trees = TreeStandIn({("main", True): (RECURSIVE, False)})
+    repository = setup_repository(
+        hacs, HacsIntegrationRepository(hacs, "hacs-test-org/small"), trees, 100
+    )
+
+    result = await repository.get_tree("main")
+    assert [entry.path for entry in result] == [entry["path"] for entry in RECURSIVE]
+    assert trees.requests == [("main", True)]
+
+
+async def test_get_tree_large_repository(hacs: HacsBase) -> None:
+    """Test that only the subtrees the category needs are fetched for large repositories."""
+    trees = TreeStandIn(
+        {
+            ("main", False): (ROOT, False),
+            ("cc", True): (COMPONENTS, False),
+        }
+    )
+    repository = setup_repository(
+        hacs,
+        HacsIntegrationRepository(hacs, "hacs-test-org/large"),
+        trees,
+        TREE_TARGETED_MIN_SIZE + 1,
+    )
+
+    result = await repository.get_tree("main")
+    assert [entry.path for entry in result] == EXPECTED
+    assert trees.requests == [("main", False), ("cc", True)]
+
+
+async def test_get_tree_truncated(hacs: HacsBase) -> None:
+    """Test that truncated trees are completed from their subtrees."""
+    trees = TreeStandIn(
+        {
+            ("main", True): (ROOT, True),
+            ("main", False): (ROOT, False),
+            ("cc", True): (COMPONENTS[:2], True),
+            ("cc", False): (COMPONENTS[:1], False),
+            ("example", True): ([blob("manifest.json"), tree("translations", "t")], True),
+            ("example", False): ([blob("manifest.json"), tree("translations", "t")], False),
+            ("t", True): ([blob("en.json")], False),
+        }
+    )
+    repository = setup_repository(
+        hacs, HacsIntegrationRepository(hacs, "hacs-test-org/truncated"), trees, 100
+    )
+
+    result = await repository.get_tree("main")
+    assert sorted(entry.path for entry in result) == sorted(EXPECTED)
+    assert ("docs", True) not in trees.requests
+    assert ("main", True) in trees.requests
+
+
+@pytest.mark.parametrize("content_in_root", (False, True))
+async def test_get_tree_layout_needs_whole_tree(hacs: HacsBase, content_in_root: bool) -> None:
+    """Test that the whole tree is fetched when the category layout does not match."""
+    root = [blob("README.md"), blob("manifest.json"), tree("translations", "translations")]
+    recursive = [*root, blob("translations/en.json")]
+    trees = TreeStandIn({("main", False): (root, False), ("main", True): (recursive, False)})
+    repository = setup_repository(
+        hacs,
+        HacsIntegrationRepository(hacs, f"hacs-test-org/in-root-{content_in_root}"),
+        trees,
+        TREE_TARGETED_MIN_SIZE + 1,
+    )
+    repository.repository_manifest.content_in_root = content_in_root
+
+    result = await repository.get_tree("main")
+    assert [entry.path for entry in result] == [entry["path"] for entry in recursive]
+    assert trees.requests == [("main", False), ("main", True)]
+
+
+async def test_get_tree_plugin_without_dist(hacs: HacsBase) -> None:
+    """Test that the root is enough for plugins without a dist directory."""
+    root = [blob("README.md"), blob("plugin.js"), tree("src", "src")]
+    trees = TreeStandIn({("main", False): (root, False)})
+    repository = setup_repository(
+        hacs,
+        HacsPluginRepository(hacs, "hacs-test-org/plugin"),
+        trees,
+        TREE_TARGETED_MIN_SIZE + 1,
+    )
+
+    result = await repository.get_tree("main")
+    assert [entry.path for entry in result] == ["README.md", "plugin.js", "src"]
+    assert trees.requests == [("main", False)]
+
+
+async def test_get_tree_moved_tag(hacs: HacsBase) -> None:
+    """Test that the tree of a tag is found by the tree SHA it resolved to during the update."""
+    trees = TreeStandIn({("1.0.0", True): (RECURSIVE, False)})
+    trees.shas["1.0.0"] = "first"
+    repository = setup_repository(
+        hacs, HacsIntegrationRepository(hacs, "hacs-test-org/moved-tag"), trees, 100
+    )
+    repository.data.published_tags = ["1.0.0"]
+    repository.data.last_version = "1.0.0"
+
+    await repository.get_tree("1.0.0")
+    await repository.get_tree("1.0.0")
+    assert trees.requests == [("1.0.0", True)]
+
+    # The tag is moved before the next update, so it has to be resolved again
+    repository._tag_tree_shas.clear()
+    trees.trees[("1.0.0", True)] = (ROOT, False)
+    trees.shas["1.0.0"] = "second"
+    result = await repository.get_tree("1.0.0")
+    assert [entry.path for entry in result] == [entry["path"] for entry in ROOT]
+    assert trees.requests == [("1.0.0", True), ("1.0.0", True)]
+    assert repository.raw_cache_key("1.0.0", "hacs.json") == (
+        "hacs-test-org/moved-tag/second/hacs.json"
+    )
@@ -0,0 +1,54 @@
+"""Tests for prefetching pending updates."""
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.integration import HacsIntegrationRepository
+from custom_components.hacs.utils.rate_limit import RateLimitBucket
+
+TREE_SHA = "9fb037999f264ba9a7fc6274d15fa3ae2ab98312"
+
+
+async def test_prefetch_pending_updates(hacs: HacsBase) -> None:
+    """Test that the release notes and files of a pending update are warmed once."""
+    repository = HacsIntegrationRepository(hacs, "hacs-test-org/integration-basic")
+    repository.data.id = "1296269"
+    repository.data.installed = True
+    repository.data.installed_version = "0.9.0"
+    repository.data.last_version = "1.0.0"
+    repository.data.releases = True
+    repository.treefiles = ["README.md"]
+    hacs.repositories.register(repository)
+    assert repository.pending_update
+
+    # Nothing is prefetched while the queue has pending tasks
+    hacs.queue.clear()
+
+    async def _queued() -> None:
+        pass
+
+    hacs.queue.add(_queued())
+    await hacs.async_prefetch_pending_updates()
+    assert repository.prefetched_version is None
+
+    # Nothing is prefetched when the budget is spent
+    for task in hacs.queue.queue:
+        task.close()
+    hacs.queue.clear()
+    hacs.rate_limit.buckets["core"] = RateLimitBucket(limit=5000, remaining=0)
+    await hacs.async_prefetch_pending_updates()
+    assert repository.prefetched_version is None
+
+    hacs.rate_limit.buckets["core"] = RateLimitBucket(limit=5000, remaining=5000)
+    await hacs.async_prefetch_pending_updates()
+    assert repository.prefetched_version == "1.0.0"
+    assert [release.tag_name for release in repository.releases.objects] == ["1.0.0"]
+    for filename in ("hacs.json", "README.md"):
+        assert (
+            await hacs.raw_cache.async_get(f"hacs-test-org/integration-basic/{TREE_SHA}/{filename}")
+            is not None
+        )
+
+    # Nothing is fetched again until there is a new version
+    stats = hacs.raw_cache.stats
+    remaining = hacs.rate_limit.buckets["core"].remaining
+    await hacs.async_prefetch_pending_updates()
+    assert hacs.raw_cache.stats == stats
+    assert hacs.rate_limit.buckets["core"].remaining == remaining
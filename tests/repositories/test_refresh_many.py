@@ -0,0 +1,169 @@
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.const import REPOSITORY_UPDATE_API_COST
+from custom_components.hacs.enums import HacsDispatchEvent
+from custom_components.hacs.exceptions import HacsException
+from custom_components.hacs.repositories.base import HacsRepository
+from custom_components.hacs.utils.rate_limit import RateLimitBucket
+
+from tests.common import WSClient, get_hacs
+
+REPOSITORIES = (
+    "hacs-test-org/integration-basic",
+    "hacs-test-org/template-basic",
+    "hacs-test-org/theme-basic",
+)
+
+
+async def test_refresh_many(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that repositories are refreshed, and failures are reported."""
+    hacs = get_hacs(hass)
+    repositories = [hacs.repositories.get_by_full_name(name) for name in REPOSITORIES]
+    failure = repositories[0]
+    hacs.rate_limit.buckets["core"] = RateLimitBucket(limit=5000, remaining=5000)
+
+    async def _update(repository: HacsRepository, **kwargs: Any) -> None:
+        assert kwargs == {"ignore_issues": True, "force": True}
+        if repository is failure:
+            raise HacsException("Refresh failed")
+
+    with patch.object(
+        HacsRepository, "update_repository", autospec=True, side_effect=_update
+    ) as update:
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/refresh_many",
+            {"repositories": [repository.data.id for repository in repositories]},
+        )
+
+    assert response["success"] == True
+    assert response["result"] == {
+        "estimated_api_calls": len(repositories) * REPOSITORY_UPDATE_API_COST,
+        "failed": {failure.data.id: "Refresh failed"},
+        "queued": [],
+        "refreshed": [repository.data.id for repository in repositories[1:]],
+    }
+    assert update.call_count == len(repositories)
+
+
+async def test_refresh_many_unexpected_error(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that errors other than HacsException only fail their own repository."""
+    hacs = get_hacs(hass)
+    repositories = [hacs.repositories.get_by_full_name(name) for name in REPOSITORIES]
+    timeout, failure = repositories[:2]
+    hacs.rate_limit.buckets["core"] = RateLimitBucket(limit=5000, remaining=5000)
+
+    async def _update(repository: HacsRepository, **_: Any) -> None:
+        if repository is timeout:
+            raise TimeoutError
+        if repository is failure:
+            raise ValueError("Unexpected content")
+
+    with (
+        patch.object(HacsRepository, "update_repository", autospec=True, side_effect=_update),
+        patch.object(hacs, "async_dispatch") as dispatch,
+    ):
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/refresh_many",
+            {"repositories": [repository.data.id for repository in repositories]},
+        )
+
+    assert response["success"] == True
+    assert response["result"]["failed"] == {
+        timeout.data.id: "TimeoutError",
+        failure.data.id: "Unexpected content",
+    }
+    assert response["result"]["refreshed"] == [repositories[2].data.id]
+    progress = [
+        call.args[1]
+        for call in dispatch.call_args_list
+        if call.args[0] == HacsDispatchEvent.BULK_PROGRESS
+    ]
+    assert progress[-1]["completed"] == len(repositories)
+    assert progress[-1]["failed"] == 2
+
+
+async def test_refresh_many_budget(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that repositories that do not fit in the budget are queued."""
+    hacs = get_hacs(hass)
+    repositories = [hacs.repositories.get_by_full_name(name) for name in REPOSITORIES]
+    hacs.rate_limit.buckets["core"] = RateLimitBucket(
+        limit=5000, remaining=REPOSITORY_UPDATE_API_COST
+    )
+    hacs.queue.clear()
+
+    with patch.object(HacsRepository, "update_repository", autospec=True) as update:
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/refresh_many",
+            {"repositories": [repository.data.id for repository in repositories]},
+        )
+
+    assert response["success"] == True
+    assert response["result"]["refreshed"] == [repositories[0].data.id]
+    assert response["result"]["queued"] == [repository.data.id for repository in repositories[1:]]
+    assert update.call_count == len(repositories)
+    assert hacs.queue.pending_tasks == 2
+
+    # The queued refreshes are not needed by the test
+    for task in hacs.queue.queue:
+        task.close()
+    hacs.queue.clear()
+
+
+async def test_refresh_many_filters(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that repositories are selected with the filters."""
+    hacs = get_hacs(hass)
+    theme = hacs.repositories.get_by_full_name("hacs-test-org/theme-basic")
+    theme.data.installed = True
+
+    with patch.object(HacsRepository, "update_repository", autospec=True) as update:
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/refresh_many",
+            {"categories": ["theme"], "downloaded": True},
+        )
+
+    assert response["success"] == True
+    assert response["result"]["refreshed"] == [theme.data.id]
+    update.assert_called_once()
+
+
+async def test_refresh_many_unknown_repository(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    """Test that unknown repositories are reported, like for download_many."""
+    hacs = get_hacs(hass)
+    repository = hacs.repositories.get_by_full_name(REPOSITORIES[0])
+
+    with patch.object(HacsRepository, "update_repository", autospec=True) as update:
+        response = await ws_client.send_and_receive_json(
+            "hacs/repositories/refresh_many",
+            {"repositories": [repository.data.id, "0"]},
+        )
+
+    assert response["success"] == False
+    assert response["error"] == {
+        "code": "repository_not_found",
+        "message": "Repository with ID (0) not found",
+    }
+    update.assert_not_called()
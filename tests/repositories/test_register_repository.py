@@ -36,10 +36,23 @@ async def test_register_repository(
     repo = hacs.repositories.get_by_full_name(repository_full_name)
     assert repo is not None
 
+    refreshed = []
+    async_dispatcher_connect(
+        hass,
+        HacsDispatchEvent.REPOSITORY_INFO,
+        lambda message: refreshed.append(message),
+    )
+
     response = await ws_client.send_and_receive_json(
         "hacs/repository/info", {"repository_id": repo.data.id},
     )
     assert response["success"] == True
+    assert response["result"]["stale"] == True
+
+    await hass.async_block_till_done()
+    assert len(refreshed) == 1
+    assert refreshed[0]["id"] == repo.data.id
+    assert refreshed[0]["stale"] == False
 
     snapshots.assert_match(
         safe_json_dumps(recursive_remove_key(response["result"], ("last_updated", "local_path"))),
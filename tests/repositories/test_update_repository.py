@@ -238,11 +238,11 @@ async def test_update_repository_entity_download_failure(
 
     response_mocker.add(
         "https://github.com/hacs-test-org/integration-basic/archive/refs/tags/2.0.0.zip",
-        MockedResponse(status=503),
+        MockedResponse(status=503, keep=True),
     )
     response_mocker.add(
         "https://github.com/hacs-test-org/integration-basic/archive/refs/heads/2.0.0.zip",
-        MockedResponse(status=503),
+        MockedResponse(status=503, keep=True),
     )
 
     # Get a new HACS instance after reload
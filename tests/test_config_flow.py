@@ -350,6 +350,8 @@ async def test_options_flow(hass: HomeAssistant, setup_integration: Generator) -
     assert result["data"] == {
         "appdaemon": True,
         "country": "ALL",
+        "data_bundle": False,
+        "dedicated_connections": False,
         "experimental": True,
         "sidepanel_icon": "hacs:hacs",
         "sidepanel_title": "new_title",
@@ -358,6 +360,8 @@ async def test_options_flow(hass: HomeAssistant, setup_integration: Generator) -
     assert config_entry.options == {
         "appdaemon": True,
         "country": "ALL",
+        "data_bundle": False,
+        "dedicated_connections": False,
         "experimental": True,
         "sidepanel_icon": "hacs:hacs",
         "sidepanel_title": "new_title",
@@ -2,13 +2,29 @@
 
 import asyncio
 from contextlib import nullcontext as does_not_raise
+import json
+import os
+from pathlib import Path
 from typing import ContextManager
 
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
 from homeassistant.core import HomeAssistant
 import pytest
+import voluptuous as vol
+from yarl import URL
+
+from scripts.data.common import write_precompressed
+from scripts.data.generate_bundle import generate_bundle
+from scripts.data.generate_category_data import write_patches
 
 from custom_components.hacs.base import HacsBase
+from custom_components.hacs.data_client import HacsDataClient
 from custom_components.hacs.exceptions import HacsException, HacsNotModifiedException
+from custom_components.hacs.utils.compression import TransferStats
+from custom_components.hacs.utils.data_patch import data_version
+from custom_components.hacs.utils.store import get_store_for_key
+from custom_components.hacs.utils.validate import VALIDATE_FETCHED_V2_REPO_DATA
 
 from tests.common import (
     CategoryTestData,
@@ -16,6 +32,7 @@ from tests.common import (
     ResponseMocker,
     category_test_data_parametrized,
     create_config_entry,
+    fixture,
     get_hacs,
     recursive_remove_key,
     safe_json_dumps,
@@ -77,7 +94,7 @@ async def test_exception_handling(
     """Test the base result."""
     response_mocker.add(
         "https://data-v2.hacs.xyz/integration/repositories.json",
-        response=MockedResponse(exception=exception),
+        response=MockedResponse(exception=exception, keep=True),
     )
 
     with expectation:
@@ -115,7 +132,7 @@ async def test_status_handling(
     """Test the base result."""
     response_mocker.add(
         "https://data-v2.hacs.xyz/integration/repositories.json",
-        response=MockedResponse(status=status),
+        response=MockedResponse(status=status, content=[], keep=True),
     )
 
     with expectation:
@@ -232,3 +249,408 @@ async def test_discard_invalid_repo_data(
         hacs,
         f"{repository}/test_discard_invalid_repo_data.json",
     )
+
+
+class DataSessionStandIn:
+    """Serves data-v2 responses, 304 when the ETag matches."""
+
+    def __init__(self, content: dict) -> None:
+        self.content = content
+        self.requests: list[str] = []
+
+    async def get(self, url: str, **kwargs) -> MockedResponse:
+        etag = kwargs["headers"]["If-None-Match"]
+        self.requests.append(etag)
+        if etag == "v1":
+            return MockedResponse(status=304)
+        return MockedResponse(content=self.content, headers={"etag": "v1"})
+
+
+async def test_persisted_etags_and_payloads(hass: HomeAssistant):
+    """Test that the first 304 after a restart returns the stored payload."""
+    session = DataSessionStandIn({"12345": GOOD_INTEGRATION_DATA})
+    store = get_store_for_key(hass, "data_client")
+
+    client = HacsDataClient(session=session, client_name="test", store=store)
+    await client.async_load()
+    data = await client.get_data("integration", validate=True)
+    assert "12345" in data
+    await client.async_save()
+
+    restarted = HacsDataClient(session=session, client_name="test", store=store)
+    await restarted.async_load()
+    assert await restarted.get_data("integration", validate=True) == data
+    with pytest.raises(HacsNotModifiedException):
+        await restarted.get_data("integration", validate=True)
+
+    assert session.requests == ["", "v1", "v1"]
+
+
+class LocalDataSession:
+    """Sends data-v2 requests to a local server that serves the fixture files."""
+
+    def __init__(self, session: ClientSession, server: TestServer) -> None:
+        self.session = session
+        self.server = server
+
+    async def get(self, url: str, **kwargs):
+        return await self.session.get(str(self.server.make_url(URL(url).path)), **kwargs)
+
+
+@pytest.mark.parametrize("section", ("integration", "plugin", "critical", "removed"))
+async def test_streamed_data_validation(section: str, monkeypatch: pytest.MonkeyPatch):
+    """Test that data streamed in small chunks is validated like the whole document."""
+    monkeypatch.setattr("custom_components.hacs.data_client.STREAM_CHUNK_SIZE", 100)
+    monkeypatch.setattr("custom_components.hacs.data_client.STREAM_BATCH_SIZE", 1000)
+    fixtures = os.path.join(os.path.dirname(__file__), "fixtures/proxy/data-v2.hacs.xyz")
+    with open(os.path.join(fixtures, section, "data.json"), encoding="utf-8") as fptr:
+        document = json.loads(fptr.read())
+    # An entry that does not validate is left out
+    if isinstance(document, dict):
+        document["0"] = {"full_name": "invalid/entry"}
+        expected = {}
+        for key, value in document.items():
+            try:
+                expected[key] = VALIDATE_FETCHED_V2_REPO_DATA[section](value)
+            except vol.Invalid:
+                continue
+    else:
+        document.append({"reason": "invalid"})
+        expected = document[:-1]
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response(document)
+
+    app = web.Application()
+    app.router.add_get(f"/{section}/data.json", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with ClientSession() as session:
+            client = HacsDataClient(session=LocalDataSession(session, server), client_name="test")
+            result = await client.get_data(section, validate=True)
+    finally:
+        await server.close()
+
+    assert result == expected
+    assert "0" not in result
+
+
+class StaticDataServer:
+    """A static file server that stands in for data-v2.hacs.xyz, and records the requests."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.requests: list[tuple[str, int]] = []
+        app = web.Application()
+        app.router.add_static("/", path)
+        app.on_response_prepare.append(self.record)
+        self.server = TestServer(app)
+
+    async def record(self, request: web.Request, response: web.StreamResponse) -> None:
+        self.requests.append((request.path, response.status))
+
+    def write(self, section: str, data: dict | list) -> None:
+        path = self.path / section / "data.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+
+async def test_delta_updates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that category data is updated from the patches the generator writes."""
+    monkeypatch.setattr("scripts.data.generate_category_data.OUTPUT_DIR", str(tmp_path))
+    current = fixture("v2-integration-data.json")
+    changed, removed = list(current)[:2]
+    updated = {key: value for key, value in current.items() if key != removed}
+    updated[changed] = {**current[changed], "stargazers_count": 999}
+    updated["12345"] = GOOD_INTEGRATION_DATA
+    updated["0"] = {"full_name": "invalid/entry"}
+
+    static = StaticDataServer(tmp_path)
+    requests = static.requests
+    server = static.server
+    await server.start_server()
+    patches = tmp_path / "integration" / "patch"
+    static.write("integration", current)
+    write_patches("integration", {}, current)
+    try:
+        async with ClientSession() as session:
+            client = HacsDataClient(
+                session=LocalDataSession(session, server), client_name="test", delta=True
+            )
+            assert await client.get_data("integration", validate=True) == current
+            assert requests == [("/integration/data.json", 200)]
+
+            # The patch for the current version is empty
+            requests.clear()
+            with pytest.raises(HacsNotModifiedException):
+                await client.get_data("integration", validate=True)
+            assert requests == [(f"/integration/patch/{data_version(current)}.json", 200)]
+
+            # The next run of the generator publishes the changes
+            static.write("integration", updated)
+            write_patches("integration", current, updated)
+            requests.clear()
+            data = await client.get_data("integration", validate=True)
+            expected = {key: value for key, value in updated.items() if key != "0"}
+            assert data == expected
+            assert requests == [
+                (f"/integration/patch/{data_version(current)}.json", 200),
+                (f"/integration/patch/{data_version(updated)}.json", 200),
+            ]
+
+            requests.clear()
+            with pytest.raises(HacsNotModifiedException):
+                await client.get_data("integration", validate=True)
+            assert requests == [(f"/integration/patch/{data_version(updated)}.json", 200)]
+
+            # Invalid patches fall back to the whole file
+            (patches / f"{data_version(updated)}.json").write_text("[]", encoding="utf-8")
+            requests.clear()
+            assert await client.get_data("integration", validate=True) == expected
+            assert requests == [
+                (f"/integration/patch/{data_version(updated)}.json", 200),
+                ("/integration/data.json", 200),
+            ]
+
+            # A missing patch is only requested once for a version
+            requests.clear()
+            with pytest.raises(HacsNotModifiedException):
+                await client.get_data("integration", validate=True)
+            with pytest.raises(HacsNotModifiedException):
+                await client.get_data("integration", validate=True)
+            assert requests == [
+                (f"/integration/patch/{data_version(expected)}.json", 404),
+                ("/integration/data.json", 304),
+                ("/integration/data.json", 304),
+            ]
+    finally:
+        await server.close()
+
+
+async def test_delta_updates_versions_behind(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that clients more than one version behind follow the patches to the latest."""
+    monkeypatch.setattr("scripts.data.generate_category_data.OUTPUT_DIR", str(tmp_path))
+    first = fixture("v2-integration-data.json")
+    second = {**first, "12345": GOOD_INTEGRATION_DATA}
+    third = {key: value for key, value in second.items() if key != next(iter(first))}
+
+    static = StaticDataServer(tmp_path)
+    requests = static.requests
+    server = static.server
+    await server.start_server()
+    static.write("integration", first)
+    write_patches("integration", {}, first)
+    try:
+        async with ClientSession() as session:
+            client = HacsDataClient(
+                session=LocalDataSession(session, server), client_name="test", delta=True
+            )
+            assert await client.get_data("integration", validate=True) == first
+
+            # Two runs of the generator, the patch for the first version only goes to the second
+            for current, updated in ((first, second), (second, third)):
+                static.write("integration", updated)
+                write_patches("integration", current, updated)
+
+            requests.clear()
+            assert await client.get_data("integration", validate=True) == third
+            assert requests == [
+                (f"/integration/patch/{data_version(first)}.json", 200),
+                (f"/integration/patch/{data_version(second)}.json", 200),
+                (f"/integration/patch/{data_version(third)}.json", 200),
+            ]
+
+            requests.clear()
+            with pytest.raises(HacsNotModifiedException):
+                await client.get_data("integration", validate=True)
+            assert requests == [(f"/integration/patch/{data_version(third)}.json", 200)]
+
+            # The whole file is used when a patch in between is missing
+            third_again = {**third, "67890": GOOD_INTEGRATION_DATA}
+            static.write("integration", third_again)
+            write_patches("integration", third, third_again)
+            (tmp_path / "integration" / "patch" / f"{data_version(third_again)}.json").unlink()
+            requests.clear()
+            assert await client.get_data("integration", validate=True) == third_again
+            assert requests == [
+                (f"/integration/patch/{data_version(third)}.json", 200),
+                (f"/integration/patch/{data_version(third_again)}.json", 404),
+                ("/integration/data.json", 200),
+            ]
+    finally:
+        await server.close()
+
+
+async def test_data_bundle(tmp_path: Path):
+    """Test that the sections in the bundle are fetched with a single request."""
+    data = {section: fixture(f"v2-{section}-data.json") for section in ("integration", "removed")}
+    data["critical"] = [{"link": "https://example.com", "reason": "test", "repository": "a/b"}]
+    static = StaticDataServer(tmp_path)
+    for section, content in data.items():
+        static.write(section, content)
+    generate_bundle(str(tmp_path))
+    # Sections that are not in the bundle are requested on their own
+    static.write("theme", {"12345": GOOD_COMMON_DATA})
+    sections = ["integration", "removed", "critical", "theme"]
+
+    await static.server.start_server()
+    try:
+        async with ClientSession() as session:
+            client = HacsDataClient(
+                session=LocalDataSession(session, static.server), client_name="test"
+            )
+            await client.async_prefetch_bundle(sections)
+            for section, content in data.items():
+                assert await client.get_data(section, validate=True) == content
+            assert await client.get_data("theme", validate=True) == {"12345": GOOD_COMMON_DATA}
+            assert static.requests == [("/bundle.json", 200), ("/theme/data.json", 200)]
+
+            # The bundle did not change
+            static.requests.clear()
+            await client.async_prefetch_bundle(sections)
+            for section in sections:
+                with pytest.raises(HacsNotModifiedException):
+                    await client.get_data(section, validate=True)
+            assert static.requests == [("/bundle.json", 304), ("/theme/data.json", 304)]
+
+            # Only the changed sections are modified
+            data["integration"]["12345"] = GOOD_INTEGRATION_DATA
+            static.write("integration", data["integration"])
+            generate_bundle(str(tmp_path))
+            static.requests.clear()
+            await client.async_prefetch_bundle(sections)
+            assert await client.get_data("integration", validate=True) == data["integration"]
+            assert await client.get_data("theme", validate=True) == {"12345": GOOD_COMMON_DATA}
+            for section in ("removed", "critical"):
+                with pytest.raises(HacsNotModifiedException):
+                    await client.get_data(section, validate=True)
+            assert static.requests == [("/bundle.json", 200)]
+
+            # Without a bundle every section is requested on its own
+            for path in tmp_path.glob("bundle.json*"):
+                path.unlink()
+            static.requests.clear()
+            await client.async_prefetch_bundle(sections)
+            assert await client.get_data("removed", validate=True) == data["removed"]
+            assert static.requests == [("/bundle.json", 404), ("/removed/data.json", 200)]
+    finally:
+        await static.server.close()
+
+
+async def test_data_bundle_stored(hass: HomeAssistant, tmp_path: Path):
+    """Test that the sections from the bundle are stored like the sections fetched on their own."""
+    data = {section: fixture(f"v2-{section}-data.json") for section in ("integration", "removed")}
+    static = StaticDataServer(tmp_path)
+    for section, content in data.items():
+        static.write(section, content)
+    generate_bundle(str(tmp_path))
+    store = get_store_for_key(hass, "data_client")
+
+    await static.server.start_server()
+    try:
+        async with ClientSession() as session:
+            local = LocalDataSession(session, static.server)
+            client = HacsDataClient(session=local, client_name="test", store=store, delta=True)
+            await client.async_load()
+            await client.async_prefetch_bundle(list(data))
+            for section, content in data.items():
+                assert await client.get_data(section, validate=True) == content
+            await client.async_save()
+
+            stored = (await store.async_load())["sections"]
+            assert stored["integration/data.json"]["version"] == data_version(data["integration"])
+            assert "version" not in stored["removed/data.json"]
+
+            # After a restart the unchanged bundle returns the stored data
+            static.requests.clear()
+            restarted = HacsDataClient(session=local, client_name="test", store=store, delta=True)
+            await restarted.async_load()
+            await restarted.async_prefetch_bundle(list(data))
+            for section, content in data.items():
+                assert await restarted.get_data(section, validate=True) == content
+            assert static.requests == [("/bundle.json", 304)]
+    finally:
+        await static.server.close()
+
+
+async def test_data_bundle_then_section(hass: HomeAssistant, tmp_path: Path):
+    """Test that the ETags of the bundle sections are only sent with the bundle request."""
+    data = {section: fixture(f"v2-{section}-data.json") for section in ("integration", "removed")}
+    static = StaticDataServer(tmp_path)
+    for section, content in data.items():
+        static.write(section, content)
+    etags = generate_bundle(str(tmp_path))
+    store = get_store_for_key(hass, "data_client")
+
+    await static.server.start_server()
+    try:
+        async with ClientSession() as session:
+            local = LocalDataSession(session, static.server)
+            client = HacsDataClient(session=local, client_name="test", store=store)
+            await client.async_load()
+            await client.async_prefetch_bundle(list(data))
+            for section, content in data.items():
+                assert await client.get_data(section, validate=True) == content
+
+            # Without the bundle the section is requested with its own ETag
+            static.requests.clear()
+            assert await client.get_data("integration", validate=True) == data["integration"]
+            with pytest.raises(HacsNotModifiedException):
+                await client.get_data("integration", validate=True)
+            assert static.requests == [
+                ("/integration/data.json", 200),
+                ("/integration/data.json", 304),
+            ]
+            await client.async_save()
+
+            stored = await store.async_load()
+            assert stored["bundle_etag"] is not None
+            assert stored["sections"]["integration/data.json"]["etag"] != etags["integration"]
+            assert stored["sections"]["integration/data.json"]["bundle_etag"] == etags["integration"]
+
+            # After a restart the unchanged bundle still returns the stored data
+            static.requests.clear()
+            restarted = HacsDataClient(session=local, client_name="test", store=store)
+            await restarted.async_load()
+            await restarted.async_prefetch_bundle(list(data))
+            for section, content in data.items():
+                assert await restarted.get_data(section, validate=True) == content
+            with pytest.raises(HacsNotModifiedException):
+                await restarted.get_data("integration", validate=True)
+            assert static.requests == [("/bundle.json", 304), ("/integration/data.json", 304)]
+    finally:
+        await static.server.close()
+
+
+async def test_compressed_data(tmp_path: Path):
+    """Test that the precompressed files are requested, and decoded outside the event loop."""
+    data = fixture("v2-integration-data.json")
+    static = StaticDataServer(tmp_path)
+    static.write("integration", data)
+    (tmp_path / "integration" / "repositories.json").write_text(
+        json.dumps([entry["full_name"] for entry in data.values()]), encoding="utf-8"
+    )
+    for filename in ("data.json", "repositories.json"):
+        write_precompressed(str(tmp_path / "integration" / filename))
+    stats = TransferStats()
+
+    await static.server.start_server()
+    try:
+        async with ClientSession() as session:
+            client = HacsDataClient(
+                session=LocalDataSession(session, static.server),
+                client_name="test",
+                transfer_stats=stats,
+            )
+            assert await client.get_data("integration", validate=True) == data
+            assert await client.get_repositories("integration") == [
+                entry["full_name"] for entry in data.values()
+            ]
+    finally:
+        await static.server.close()
+
+    assert stats.responses == 2
+    assert "identity" not in stats.encodings
+    assert stats.transferred < stats.decoded
+    assert stats.executor_time > 0
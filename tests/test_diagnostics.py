@@ -13,7 +13,9 @@ from tests.common import (
 from tests.conftest import SnapshotFixture
 
 REMOVE_KEYS = ("entry_id", "last_updated", "local", "minor_version",
-               "created_at", "modified_at", "discovery_keys", "subentries_data", "subentries")
+               "created_at", "modified_at", "discovery_keys", "subentries_data", "subentries",
+               "concurrency", "http_cache", "raw_cache", "retry", "single_flight", "transfer",
+               "tree_cache")
 
 
 async def test_diagnostics(hacs: HacsBase, snapshots: SnapshotFixture):
@@ -0,0 +1,146 @@
+"""Differential tests for the compiled data-v2 validators."""
+import copy
+from typing import Any
+
+import pytest
+import voluptuous as vol
+
+from custom_components.hacs.utils.compiled_schema import compile_check
+from custom_components.hacs.utils.validate import (
+    COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    COMPILED_FETCHED_V2_REPO_DATA,
+    COMPILED_GENERATED_V2_CRITICAL_REPO_SCHEMA,
+    COMPILED_GENERATED_V2_REMOVED_REPO_SCHEMA,
+    COMPILED_GENERATED_V2_REPO_DATA,
+    V2_INTEGRATION_DATA_JSON_SCHEMA,
+    VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+    VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
+    VALIDATE_FETCHED_V2_REPO_DATA,
+    VALIDATE_GENERATED_V2_CRITICAL_REPO_SCHEMA,
+    VALIDATE_GENERATED_V2_REMOVED_REPO_SCHEMA,
+    VALIDATE_GENERATED_V2_REPO_DATA,
+)
+
+from tests.common import fixture
+
+CATEGORIES = ["appdaemon", "integration", "plugin", "python_script", "template", "theme"]
+
+# Values that hit the edges of isinstance and literal checks
+VALUES = [None, True, False, 0, 0.0, 1, 1.5, "", "x", [], ["x"], [1], ["x", None], {}, {"a": 1}]
+
+
+def outcome(validator: Any, data: Any) -> tuple[Any, ...]:
+    """Return what a validator returns or raises, the schemas raise TypeError for some values."""
+    try:
+        return ("valid", validator(data))
+    except vol.Invalid as exception:
+        errors = getattr(exception, "errors", [exception])
+        return ("invalid", type(exception), sorted((str(e), e.path) for e in errors))
+    except Exception as exception:
+        return ("error", type(exception), str(exception))
+
+
+def mutations(entry: dict[str, Any], keys: list[str]) -> list[Any]:
+    """Return variations of an entry."""
+    variations: list[Any] = [entry, {**entry, "extra_key": "x"}, None, "x", [entry]]
+    for key in keys:
+        variations.append({k: v for k, v in entry.items() if k != key})
+        variations.extend({**entry, key: value} for value in VALUES)
+    if isinstance(entry.get("manifest"), dict):
+        for key in ("country", "name", "extra_key"):
+            variations.extend(
+                {**entry, "manifest": {**entry["manifest"], key: value}} for value in VALUES
+            )
+    return variations
+
+
+def assert_same(validator: Any, compiled: Any, data: Any) -> None:
+    """Assert that both validators agree, and do not change the input."""
+    original = copy.deepcopy(data)
+    assert outcome(compiled, data) == outcome(validator, data)
+    assert data == original
+
+
+@pytest.mark.parametrize("category", CATEGORIES)
+def test_compiled_repo_data(category: str):
+    """Test the compiled repo data validators against the voluptuous schemas."""
+    data = fixture(f"v2-{category}-data.json")
+    keys = [key.schema for key in V2_INTEGRATION_DATA_JSON_SCHEMA] + ["extra_key"]
+    fetched = VALIDATE_FETCHED_V2_REPO_DATA[category]
+    generated = VALIDATE_GENERATED_V2_REPO_DATA[category]
+
+    for entry in data.values():
+        assert COMPILED_FETCHED_V2_REPO_DATA[category](entry) is entry
+    assert_same(generated, COMPILED_GENERATED_V2_REPO_DATA[category], data)
+
+    for entry in list(data.values())[:3]:
+        for variation in mutations(entry, keys):
+            assert_same(fetched, COMPILED_FETCHED_V2_REPO_DATA[category], variation)
+            assert_same(generated, COMPILED_GENERATED_V2_REPO_DATA[category], {"repo": variation})
+
+    for variation in [None, [], {}, {1: next(iter(data.values()))}, list(data.values())]:
+        assert_same(generated, COMPILED_GENERATED_V2_REPO_DATA[category], variation)
+
+
+@pytest.mark.parametrize(
+    "section,fetched,generated,compiled_fetched,compiled_generated",
+    [
+        (
+            "critical",
+            VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+            VALIDATE_GENERATED_V2_CRITICAL_REPO_SCHEMA,
+            COMPILED_FETCHED_V2_CRITICAL_REPO_SCHEMA,
+            COMPILED_GENERATED_V2_CRITICAL_REPO_SCHEMA,
+        ),
+        (
+            "removed",
+            VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
+            VALIDATE_GENERATED_V2_REMOVED_REPO_SCHEMA,
+            COMPILED_FETCHED_V2_REMOVED_REPO_SCHEMA,
+            COMPILED_GENERATED_V2_REMOVED_REPO_SCHEMA,
+        ),
+    ],
+)
+def test_compiled_critical_removed(
+    section: str, fetched: Any, generated: Any, compiled_fetched: Any, compiled_generated: Any
+):
+    """Test the compiled critical and removed validators against the voluptuous schemas."""
+    data = fixture(f"v2-{section}-data.json")
+    keys = ["link", "reason", "removal_type", "repository", "extra_key"]
+
+    assert_same(generated, compiled_generated, data)
+    for entry in data:
+        assert_same(fetched, compiled_fetched, entry)
+        for variation in mutations(entry, keys):
+            assert_same(fetched, compiled_fetched, variation)
+            assert_same(generated, compiled_generated, [variation])
+
+    for variation in [None, {}, [None], (data[0],)]:
+        assert_same(generated, compiled_generated, variation)
+
+
+@pytest.mark.parametrize(
+    "schema,values",
+    [
+        (vol.In(["a", "b"]), ["a", "c", None, ["a"], {"a": 1}]),
+        (vol.Any(int, None), [1, True, None, "1", 1.5]),
+        ([], [[], [1], None]),
+        ([str, int], [["a", 1], ["a", None], "a"]),
+        (vol.Schema({vol.Required("a"): str}, extra=vol.ALLOW_EXTRA), [{"a": "x", "b": 1}, {}]),
+        ({str: int}, [{"a": 1}, {"a": "1"}, {1: 1}]),
+        (vol.Coerce(int), ["1", "x", None]),
+        (False, [False, 0, 0.0, None, []]),
+    ],
+)
+def test_compile_check(schema: Any, values: list[Any]):
+    """Test that compiled checks accept exactly what the schema accepts."""
+    check = compile_check(schema)
+    for value in values:
+        try:
+            vol.Schema(schema)(value)
+        except vol.Invalid:
+            valid = False
+        else:
+            valid = True
+        assert check(value) is valid, value
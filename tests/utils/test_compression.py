@@ -0,0 +1,114 @@
+"""Test the content encodings HACS decodes itself."""
+import json
+
+from aiohttp import ClientSession, hdrs, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.utils import compression
+from custom_components.hacs.utils.compression import (
+    ACCEPT_ENCODING,
+    Decompressor,
+    TransferStats,
+    async_read_decoded,
+    available_encodings,
+    compress,
+)
+
+CONTENT = json.dumps({str(i): {"full_name": f"hacs/repository-{i}"} for i in range(2000)}).encode()
+
+
+@pytest.mark.parametrize("encoding", available_encodings())
+def test_round_trip(encoding: str):
+    """Test that compressed content is decoded, also when it arrives in chunks."""
+    compressed = compress(CONTENT, encoding)
+    assert len(compressed) < len(CONTENT)
+
+    decompressor = Decompressor(encoding.upper())
+    assert decompressor.encoding == encoding
+    decoded = b"".join(
+        decompressor.decompress(compressed[i : i + 100]) for i in range(0, len(compressed), 100)
+    )
+    assert decoded + decompressor.flush() == CONTENT
+
+
+def test_accept_encoding():
+    """Test the encodings HACS asks for."""
+    assert ACCEPT_ENCODING.endswith("gzip, deflate")
+    for encoding in ("br", "zstd"):
+        assert (encoding in ACCEPT_ENCODING) is (encoding in available_encodings())
+
+
+def test_decompressor_errors():
+    """Test that unknown encodings and invalid content raise ValueError."""
+    assert Decompressor(None).decompress(CONTENT) == CONTENT
+    with pytest.raises(ValueError, match="Unsupported content encoding"):
+        Decompressor("unknown")
+    with pytest.raises(ValueError, match="Invalid gzip content"):
+        Decompressor("gzip").decompress(CONTENT)
+    with pytest.raises(ValueError, match="Unsupported content encoding"):
+        compress(CONTENT, "unknown")
+
+
+async def test_async_read_decoded(monkeypatch: pytest.MonkeyPatch):
+    """Test that bodies are decoded on the event loop when small, and in the executor when large."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=compress(CONTENT, "gzip"), headers={hdrs.CONTENT_ENCODING: "gzip"})
+
+    app = web.Application()
+    app.router.add_get("/data.json", handler)
+    server = TestServer(app)
+    await server.start_server()
+    stats = TransferStats()
+    try:
+        async with ClientSession() as session:
+            for size in (0, 1024 * 1024):
+                monkeypatch.setattr(compression, "DECODE_EXECUTOR_MIN_SIZE", size)
+                response = await session.get(server.make_url("/data.json"), auto_decompress=False)
+                assert await async_read_decoded(response, stats, json.loads) == json.loads(CONTENT)
+    finally:
+        await server.close()
+
+    assert stats.responses == 2
+    assert stats.encodings == {"gzip": 2}
+    assert stats.decoded == 2 * len(CONTENT)
+    assert stats.transferred == 2 * len(compress(CONTENT, "gzip"))
+    assert stats.loop_time > 0
+    assert stats.executor_time > 0
+    assert set(stats.stats) == {
+        "decoded",
+        "encodings",
+        "executor_time",
+        "loop_time",
+        "responses",
+        "transferred",
+    }
+
+
+async def test_download_file_decoded():
+    """Test that downloads ask for compressed content, and return it decoded."""
+    accepted = []
+
+    async def handler(request: web.Request) -> web.Response:
+        accepted.append(request.headers[hdrs.ACCEPT_ENCODING])
+        return web.Response(
+            body=compress(CONTENT, "deflate"), headers={hdrs.CONTENT_ENCODING: "deflate"}
+        )
+
+    app = web.Application()
+    app.router.add_get("/file", handler)
+    server = TestServer(app)
+    await server.start_server()
+    hacs = HacsBase()
+    try:
+        async with ClientSession() as session:
+            hacs.session = session
+            assert await hacs.async_download_file(str(server.make_url("/file"))) == CONTENT
+    finally:
+        await server.close()
+
+    assert accepted == [ACCEPT_ENCODING]
+    assert hacs.transfer_stats.encodings == {"deflate": 1}
+    assert hacs.transfer_stats.decoded == len(CONTENT)
@@ -0,0 +1,147 @@
+"""Tests for the utils.concurrency module."""
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDict
+import pytest
+
+from custom_components.hacs.utils.concurrency import (
+    AdaptiveConcurrency,
+    HacsConcurrency,
+    HacsConcurrencySession,
+    throttle_delay,
+)
+
+
+@pytest.mark.parametrize(
+    "status,headers,expected",
+    (
+        (200, {}, None),
+        (404, {}, None),
+        (403, {}, None),
+        (429, {}, 0.0),
+        (429, {"Retry-After": "5"}, 5.0),
+        (403, {"retry-after": "600"}, 60),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}, 30),
+        (403, {"X-RateLimit-Remaining": "10"}, None),
+    ),
+)
+def test_throttle_delay(status: int, headers: dict[str, str], expected: float | None) -> None:
+    """Test throttle_delay."""
+    assert throttle_delay(status, CIMultiDict(headers), 1000) == expected
+
+
+def test_adaptive_concurrency_limit() -> None:
+    """Test additive increase and multiplicative decrease of the limit."""
+    limiter = AdaptiveConcurrency(initial=4, maximum=6)
+
+    # Roughly one more per window of limit responses
+    for _ in range(5):
+        limiter.success(0.1)
+    assert limiter.stats["limit"] == 5
+    for _ in range(20):
+        limiter.success(0.1)
+    assert limiter.stats["limit"] == 6
+
+    # A response much slower than the average shrinks the limit a little
+    limiter.success(1.0)
+    assert limiter.limit == pytest.approx(5.4)
+
+    limiter.throttle(10)
+    assert limiter.limit == pytest.approx(2.7)
+    assert limiter.stats["throttled"] == 1
+
+    for _ in range(10):
+        limiter.throttle(0)
+    assert limiter.limit == 1
+
+
+async def test_adaptive_concurrency_slots() -> None:
+    """Test that no more requests than the limit run at once."""
+    limiter = AdaptiveConcurrency(initial=2)
+    running = 0
+    highest = 0
+
+    async def _request() -> None:
+        nonlocal running, highest
+        async with limiter.async_slot():
+            running += 1
+            highest = max(highest, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+    await asyncio.gather(*(_request() for _ in range(10)))
+    assert highest == 2
+    assert limiter.stats["active"] == 0
+
+
+async def test_concurrency_session() -> None:
+    """Test that the session proxy feeds responses to the limiter of the host."""
+    responses = {
+        "https://api.github.com/repos/hacs/integration": SimpleNamespace(
+            status=200, headers={}, connection=None
+        ),
+        "https://raw.githubusercontent.com/hacs/integration/main/hacs.json": SimpleNamespace(
+            status=429, headers={"Retry-After": "0"}, connection=None
+        ),
+    }
+
+    class SessionStandIn:
+        async def request(self, method: str, url: str, **kwargs: Any) -> SimpleNamespace:
+            return responses[url]
+
+    concurrency = HacsConcurrency()
+    session = HacsConcurrencySession(SessionStandIn(), concurrency)
+
+    for url in responses:
+        assert (await session.get(url)) is responses[url]
+
+    assert concurrency.stats["api.github.com"]["limit"] == 10
+    assert concurrency.stats["api.github.com"]["latency"] is not None
+    assert concurrency.stats["raw.githubusercontent.com"]["limit"] == 5
+    assert concurrency.stats["raw.githubusercontent.com"]["throttled"] == 1
+
+
+async def test_concurrency_session_holds_slot_until_read() -> None:
+    """Test that the slot of a request is held until the body of the response is read."""
+    send_body = asyncio.Event()
+
+    async def _handler(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"head")
+        if request.path == "/slow":
+            await send_body.wait()
+        await response.write(b"tail")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/{name}", _handler)
+    server = TestServer(app)
+    await server.start_server()
+    concurrency = HacsConcurrency()
+    limiter = concurrency.host(server.host)
+    limiter.limit = 1
+    try:
+        async with ClientSession() as client:
+            session = HacsConcurrencySession(client, concurrency)
+            slow = await session.get(server.make_url("/slow"))
+            assert limiter.stats["active"] == 1
+
+            fast = asyncio.create_task(session.get(server.make_url("/fast")))
+            await asyncio.sleep(0.05)
+            assert not fast.done()
+            assert limiter.stats["latency"] is None
+
+            send_body.set()
+            assert await slow.read() == b"headtail"
+            # The latency covers the time until the body was read
+            assert limiter.stats["latency"] >= 0.04
+            assert await (await fast).read() == b"headtail"
+    finally:
+        await server.close()
+
+    assert limiter.stats["active"] == 0
@@ -0,0 +1,105 @@
+"""Tests for the utils.connection_pool module."""
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.hacs.utils.connection_pool import (
+    HacsConnectionPools,
+    HacsConnectionPoolSession,
+)
+
+
+class SlowServer:
+    """Local HTTP server that answers slowly, and records the concurrent requests."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.server = TestServer(web.Application())
+        self.server.app.router.add_route("*", "/{path:.*}", self.handler)
+
+    async def handler(self, request: web.Request) -> web.Response:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.active -= 1
+        return web.Response(body=b"x" * 1024, headers={"X-Agent": request.headers["User-Agent"]})
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(f"/{path}"))
+
+
+class SharedSessionStandIn:
+    """Records the requests that are passed to the shared session."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> str:
+        self.requests.append((method, url))
+        return "shared"
+
+
+@pytest.fixture
+async def slow_server() -> AsyncGenerator[SlowServer, None]:
+    """Start the slow server."""
+    server = SlowServer()
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+async def test_connection_pool_limits_and_reuses(slow_server: SlowServer) -> None:
+    """Test that the pool of a host limits and reuses its connections."""
+    pools = HacsConnectionPools(
+        {slow_server.server.host: 2, "example.com": 1}, headers={"User-Agent": "HACS/test"}
+    )
+    shared = SharedSessionStandIn()
+    session = HacsConnectionPoolSession(shared, pools)
+
+    async def download(path: str) -> bytes:
+        response = await session.get(slow_server.url(path))
+        assert response.headers["X-Agent"] == "HACS/test"
+        return await response.read()
+
+    try:
+        results = await asyncio.gather(*(download(str(index)) for index in range(6)))
+        assert await session.get("https://other.example.org/file") == "shared"
+    finally:
+        await pools.async_close()
+
+    assert all(len(result) == 1024 for result in results)
+    assert slow_server.max_active == 2
+    assert shared.requests == [("GET", "https://other.example.org/file")]
+
+    stats = pools.stats[slow_server.server.host]
+    assert stats["requests"] == 6
+    assert stats["bytes"] == 6 * 1024
+    assert stats["created"] == 2
+    assert stats["reused"] == 4
+    assert stats["queued"] == 4
+    assert stats["queued_time"] > 0
+    assert stats["errors"] == 0
+    assert pools.stats["example.com"]["requests"] == 0
+
+
+async def test_connection_pool_closed(slow_server: SlowServer) -> None:
+    """Test that a closed pool does not open a new session."""
+    pools = HacsConnectionPools({slow_server.server.host: 1})
+    session = HacsConnectionPoolSession(SharedSessionStandIn(), pools)
+    try:
+        assert (await session.get(slow_server.url("first"))).status == 200
+        await pools.async_close()
+        with pytest.raises(RuntimeError, match="Session is closed"):
+            await session.get(slow_server.url("second"))
+    finally:
+        await pools.async_close()
+
+    assert pools.pool(slow_server.server.host).session.closed
+    assert pools.stats[slow_server.server.host]["created"] == 1
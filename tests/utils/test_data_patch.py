@@ -0,0 +1,36 @@
+"""Tests for the utils.data_patch module."""
+from custom_components.hacs.utils.data_patch import create_patch, data_version, is_patch
+
+
+def test_data_version():
+    """Test that the version only depends on the content."""
+    assert data_version({"1": {"a": 1, "b": 2}, "2": {}}) == data_version(
+        {"2": {}, "1": {"b": 2, "a": 1}}
+    )
+    assert data_version({"1": {"a": 1}}) != data_version({"1": {"a": 2}})
+
+
+def test_create_patch():
+    """Test that patches contain the changed and removed entries."""
+    current = {"1": {"a": 1}, "2": {"a": 2}, "3": {"a": 3}}
+    updated = {"1": {"a": 1}, "2": {"a": 20}, "4": {"a": 4}}
+
+    patch = create_patch(current, updated)
+    assert is_patch(patch)
+    assert patch == {
+        "remove": ["3"],
+        "upsert": {"2": {"a": 20}, "4": {"a": 4}},
+        "version": data_version(updated),
+    }
+    assert create_patch(updated, updated) == {
+        "remove": [],
+        "upsert": {},
+        "version": data_version(updated),
+    }
+
+
+def test_is_patch():
+    """Test that other content is not a patch."""
+    assert not is_patch([])
+    assert not is_patch({"remove": [], "upsert": {}})
+    assert not is_patch({"remove": {}, "upsert": {}, "version": "1"})
@@ -1,7 +1,9 @@
 """Test HACS decorators."""
+import asyncio
+
 import pytest
 
-from custom_components.hacs.utils.decorator import return_none_on_exception
+from custom_components.hacs.utils.decorator import concurrent, return_none_on_exception
 
 
 def test_sync_function_no_exception():
@@ -116,3 +118,20 @@ async def test_async_method_with_args_exception():
     instance = TestClass()
     assert await instance.test_method("test") is None
     assert await instance.test_method("test", "value") == "test_value"
+
+
+async def test_concurrent_caps_running_calls():
+    """Test that concurrent caps the number of calls that run at once."""
+    running = 0
+    most_running = 0
+
+    @concurrent(concurrenttasks=2)
+    async def test_func():
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    await asyncio.gather(*(test_func() for _ in range(5)))
+    assert most_running == 2
@@ -0,0 +1,102 @@
+"""Tests for the utils.http_cache module."""
+
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.utils.http_cache import HacsHttpCache, HacsHttpCacheSession
+
+from tests.common import MockedResponse
+
+URL = "https://api.github.com/repos/hacs/integration"
+
+
+class GitHubStandIn:
+    """Answers requests like GitHub does for a single resource with an ETag."""
+
+    def __init__(self, body: bytes, etag: str = '"abc"') -> None:
+        self.body = body
+        self.etag = etag
+        self.requests: list[dict[str, Any]] = []
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> MockedResponse:
+        headers = kwargs.get("headers") or {}
+        self.requests.append({"method": method, "url": url, "headers": dict(headers)})
+        if headers.get("If-None-Match") == self.etag:
+            return MockedResponse(status=304, headers={"ETag": self.etag})
+        return MockedResponse(
+            status=200,
+            headers={"Content-Type": "application/json", "ETag": self.etag},
+            content=self.body,
+        )
+
+
+async def test_http_cache(hass: HomeAssistant) -> None:
+    """Test that a 304 is answered from the cache."""
+    github = GitHubStandIn(b'{"full_name": "hacs/integration"}')
+    cache = HacsHttpCache(hass, "token")
+    session = HacsHttpCacheSession(github, cache)
+
+    response = await session.get(URL)
+    assert response.status == 200
+    assert "If-None-Match" not in github.requests[0]["headers"]
+
+    response = await session.get(URL)
+    assert response.status == 200
+    assert github.requests[1]["headers"]["If-None-Match"] == '"abc"'
+    assert response.headers["Content-Type"] == "application/json"
+    assert await response.json() == {"full_name": "hacs/integration"}
+
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hit_rate"] == 0.5
+
+    # Requests that bring their own ETag are passed through untouched.
+    response = await session.get(URL, headers={"If-None-Match": '"abc"'})
+    assert response.status == 304
+    assert cache.stats["hits"] == 1
+
+    # Entries are scoped to the token.
+    other = HacsHttpCache(hass, "other")
+    await HacsHttpCacheSession(github, other).get(URL)
+    assert "If-None-Match" not in github.requests[-1]["headers"]
+
+
+async def test_http_cache_uncached(hass: HomeAssistant) -> None:
+    """Test requests that are not cached."""
+    github = GitHubStandIn(b"{}")
+    cache = HacsHttpCache(hass, "token")
+    session = HacsHttpCacheSession(github, cache)
+
+    for url in ("https://api.github.com/rate_limit", "https://data-v2.hacs.xyz/data.json"):
+        await session.get(url)
+        await session.get(url)
+        assert "If-None-Match" not in github.requests[-1]["headers"]
+
+    # Bodies that are decoded by the caller are not cached
+    await session.get(URL, auto_decompress=False)
+    await session.get(URL, auto_decompress=False)
+    assert "If-None-Match" not in github.requests[-1]["headers"]
+
+    await session.request("post", "https://api.github.com/graphql", json={})
+    assert cache.stats["entries"] == 0
+
+
+async def test_http_cache_eviction(hass: HomeAssistant) -> None:
+    """Test that the least recently used entries are evicted."""
+    github = GitHubStandIn(os.urandom(1024))
+    cache = HacsHttpCache(hass, "token", max_size=16 * 1024)
+    session = HacsHttpCacheSession(github, cache)
+
+    for number in range(20):
+        await session.get(f"{URL}/{number}")
+
+    assert cache.stats["size"] <= 16 * 1024
+    assert cache.stats["evictions"] > 0
+    assert cache.stats["entries"] == 20 - cache.stats["evictions"]
+
+    await session.get(f"{URL}/19")
+    assert github.requests[-1]["headers"]["If-None-Match"] == '"abc"'
+    await session.get(f"{URL}/0")
+    assert "If-None-Match" not in github.requests[-1]["headers"]
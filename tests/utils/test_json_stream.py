@@ -0,0 +1,64 @@
+"""Tests for the utils.json_stream module."""
+import json
+import os
+
+import pytest
+
+from custom_components.hacs.utils.json_stream import JsonStream
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "../fixtures/proxy/data-v2.hacs.xyz")
+
+
+def parse(document: bytes, chunk_size: int) -> tuple[JsonStream, list]:
+    stream = JsonStream()
+    members = []
+    for index in range(0, len(document), chunk_size):
+        members.extend(stream.feed(document[index : index + chunk_size]))
+    stream.close()
+    return stream, members
+
+
+@pytest.mark.parametrize("section", ("integration", "plugin", "critical", "removed"))
+@pytest.mark.parametrize("chunk_size", (1, 7, 1024))
+def test_json_stream_fixture_data(section: str, chunk_size: int) -> None:
+    """Test that streamed members match the parsed document."""
+    with open(os.path.join(FIXTURES, section, "data.json"), "rb") as fptr:
+        document = fptr.read()
+
+    stream, members = parse(document, chunk_size)
+    expected = json.loads(document)
+    if isinstance(expected, dict):
+        assert not stream.is_array
+        assert dict(members) == expected
+        assert [key for key, _ in members] == list(expected)
+    else:
+        assert stream.is_array
+        assert [value for _, value in members] == expected
+
+
+@pytest.mark.parametrize(
+    "document,expected",
+    (
+        (
+            b' { "a" : 1 , "b":[1, 2.5e3], "\\u00e6\xc3\xb8": null }\n',
+            [("a", 1), ("b", [1, 2500.0]), ("æø", None)],
+        ),
+        (b'[1, true, 12345, "x"]', [(None, 1), (None, True), (None, 12345), (None, "x")]),
+        (b"{}", []),
+        (b"[ ]", []),
+    ),
+)
+def test_json_stream_values(document: bytes, expected: list) -> None:
+    """Test that every kind of value is only returned once it is complete."""
+    for chunk_size in range(1, len(document) + 1):
+        assert parse(document, chunk_size)[1] == expected
+
+
+@pytest.mark.parametrize(
+    "document",
+    (b"", b'"string"', b'{"a": 1', b'{"a" 1}', b'{"a": 1 "b": 2}', b"{1: 2}", b"[1] 2"),
+)
+def test_json_stream_invalid(document: bytes) -> None:
+    """Test that invalid and incomplete documents raise."""
+    with pytest.raises(ValueError):
+        parse(document, 2)
@@ -0,0 +1,45 @@
+"""Tests for the utils.prefix_index module."""
+import pytest
+
+from custom_components.hacs.utils.prefix_index import PrefixIndex
+
+
+@pytest.fixture
+def index() -> PrefixIndex:
+    """Return a populated prefix index."""
+    index = PrefixIndex()
+    for full_name in ("hacs/integration", "hacs/frontend", "octocat/Hello-World"):
+        index.add(full_name, full_name)
+        index.add(full_name.split("/")[-1], full_name)
+    return index
+
+
+@pytest.mark.parametrize(
+    "prefix,expected",
+    (
+        ("hacs/", ["hacs/frontend", "hacs/integration"]),
+        ("HACS/IN", ["hacs/integration"]),
+        ("hello", ["octocat/Hello-World"]),
+        ("h", ["hacs/frontend", "hacs/integration", "octocat/Hello-World"]),
+        ("missing", []),
+    ),
+)
+def test_search(index: PrefixIndex, prefix: str, expected: list[str]) -> None:
+    """Test search."""
+    assert index.search(prefix) == expected
+
+
+def test_search_limit(index: PrefixIndex) -> None:
+    """Test search with a limit."""
+    assert index.search("hacs", limit=1) == ["hacs/frontend"]
+
+
+def test_remove(index: PrefixIndex) -> None:
+    """Test remove."""
+    index.remove("hacs/frontend", "hacs/frontend")
+    assert index.search("hacs/") == ["hacs/integration"]
+    assert index.search("frontend") == ["hacs/frontend"]
+
+    index.clear()
+    assert len(index) == 0
+    assert index.search("") == []
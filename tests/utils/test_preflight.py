@@ -0,0 +1,111 @@
+"""Tests for the utils.preflight module."""
+from typing import Any
+
+import pytest
+
+from custom_components.hacs.enums import HacsCategory
+from custom_components.hacs.exceptions import (
+    AddonRepositoryException,
+    HacsException,
+    HacsRepositoryArchivedException,
+)
+from custom_components.hacs.utils.preflight import preflight_repository, preflight_variables
+
+
+def _result(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "nameWithOwner": "owner/repo",
+        "isArchived": False,
+        "defaultBranchRef": {"name": "main"},
+        "latestRelease": None,
+        "hacsJson": None,
+        "root": {"entries": []},
+        "directory": None,
+        **kwargs,
+    }
+
+
+def test_preflight_variables() -> None:
+    """Test preflight_variables."""
+    assert preflight_variables("owner/repo", HacsCategory.INTEGRATION) == {
+        "owner": "owner",
+        "name": "repo",
+        "directory": "HEAD:custom_components",
+    }
+    assert preflight_variables("owner/repo", HacsCategory.PLUGIN)["directory"] == "HEAD:"
+
+
+@pytest.mark.parametrize(
+    "category,result,expected",
+    (
+        (
+            HacsCategory.INTEGRATION,
+            _result(directory={"entries": [{"name": "example", "type": "tree"}]}),
+            "owner/repo",
+        ),
+        (HacsCategory.INTEGRATION, _result(latestRelease={"tagName": "1.0.0"}), "owner/repo"),
+        (HacsCategory.INTEGRATION, _result(hacsJson={"text": '{"content_in_root": true}'}), "owner/repo"),
+        (HacsCategory.PLUGIN, _result(nameWithOwner="Owner/Repo"), "owner/repo"),
+        (HacsCategory.PLUGIN, _result(nameWithOwner="new-owner/repo"), "new-owner/repo"),
+        (
+            HacsCategory.THEME,
+            _result(directory={"entries": [{"name": "theme.yaml", "type": "blob"}]}),
+            "owner/repo",
+        ),
+    ),
+)
+def test_preflight_repository(
+    category: HacsCategory,
+    result: dict[str, Any],
+    expected: str,
+) -> None:
+    """Test preflight_repository."""
+    assert preflight_repository("owner/repo", category, result) == expected
+
+
+@pytest.mark.parametrize(
+    "category,result,exception,message",
+    (
+        (
+            HacsCategory.INTEGRATION,
+            None,
+            HacsException,
+            "<Integration owner/repo> Repository does not exist.",
+        ),
+        (
+            HacsCategory.PLUGIN,
+            _result(isArchived=True),
+            HacsRepositoryArchivedException,
+            "<Plugin owner/repo> Repository is archived.",
+        ),
+        (
+            HacsCategory.INTEGRATION,
+            _result(directory={"entries": [{"name": "manifest.json", "type": "blob"}]}),
+            HacsException,
+            "<Integration owner/repo> Repository structure for main is not compliant",
+        ),
+        (
+            HacsCategory.INTEGRATION,
+            _result(root={"entries": [{"name": "repository.yaml", "type": "blob"}]}),
+            AddonRepositoryException,
+            None,
+        ),
+        (
+            HacsCategory.PYTHON_SCRIPT,
+            _result(directory={"entries": [{"name": "script.txt", "type": "blob"}]}),
+            HacsException,
+            "<Python_Script owner/repo> Repository structure for main is not compliant",
+        ),
+    ),
+)
+def test_preflight_repository_failures(
+    category: HacsCategory,
+    result: dict[str, Any] | None,
+    exception: type[Exception],
+    message: str | None,
+) -> None:
+    """Test preflight_repository failures."""
+    with pytest.raises(exception) as raised:
+        preflight_repository("owner/repo", category, result)
+    if message is not None:
+        assert str(raised.value) == message
@@ -0,0 +1,122 @@
+"""Tests for the utils.rate_limit module."""
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.hacs.enums import RateLimitPriority
+from custom_components.hacs.utils.rate_limit import HacsRateLimit, HacsRateLimitSession
+
+
+class Clock:
+    """Controllable time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limit_buckets() -> None:
+    """Test that buckets follow the response headers and hand out budget by priority."""
+    clock = Clock()
+    rate_limit = HacsRateLimit(reserve=100, time_func=clock)
+    assert rate_limit.available() == 4900
+    assert rate_limit.seconds_until_reset() is None
+
+    rate_limit.update_from_headers(
+        {
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "150",
+            "x-ratelimit-reset": "1600",
+            "x-ratelimit-resource": "core",
+            "x-ratelimit-used": "4850",
+        }
+    )
+    assert rate_limit.available() == 50
+    assert rate_limit.available(priority=RateLimitPriority.USER) == 150
+    assert rate_limit.seconds_until_reset() == 600
+
+    # Background work only gets what is left above the reserve
+    assert rate_limit.consume_estimate(10, count=20) == 5
+    assert rate_limit.consume_estimate(10, count=20) == 0
+    assert rate_limit.consume_estimate(10, count=20, priority=RateLimitPriority.USER) == 10
+    assert rate_limit.available(priority=RateLimitPriority.USER) == 0
+
+    # Other resources have their own bucket
+    rate_limit.update_from_headers(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Reset": "1600",
+            "X-RateLimit-Resource": "graphql",
+        }
+    )
+    assert rate_limit.consume_estimate(1, resource="graphql") == 1
+    assert rate_limit.stats["graphql"]["remaining"] == 4998
+    assert rate_limit.stats["core"]["remaining"] == 0
+
+    # Responses without rate limit headers are ignored
+    rate_limit.update_from_headers({"Content-Type": "application/json"})
+    assert rate_limit.stats["core"]["remaining"] == 0
+
+    # The bucket is refilled when the window resets
+    clock.now = 1600
+    assert rate_limit.available() == 4900
+    assert rate_limit.stats["core"] == {"limit": 5000, "remaining": 5000, "reset": None, "used": 0}
+
+
+async def test_rate_limit_session() -> None:
+    """Test that the session proxy feeds response headers to the budget."""
+    requests = []
+
+    class SessionStandIn:
+        closed = False
+
+        async def request(self, method: str, url: str, **kwargs: Any) -> SimpleNamespace:
+            requests.append((method, url))
+            return SimpleNamespace(
+                status=200,
+                headers={"X-RateLimit-Remaining": "1234", "X-RateLimit-Limit": "5000"},
+            )
+
+    rate_limit = HacsRateLimit(reserve=0)
+    session = HacsRateLimitSession(SessionStandIn(), rate_limit)
+
+    await session.get("https://api.github.com/repos/hacs/integration")
+    await session.post("https://api.github.com/graphql", json={})
+    assert requests == [
+        ("GET", "https://api.github.com/repos/hacs/integration"),
+        ("POST", "https://api.github.com/graphql"),
+    ]
+    assert rate_limit.available() == 1234
+    assert session.closed is False
+
+
+def test_rate_limit_pacing() -> None:
+    """Test that work is only paced when the budget does not cover it."""
+    clock = Clock()
+    rate_limit = HacsRateLimit(reserve=0, time_func=clock)
+    assert rate_limit.pacing_delay(10, 100) == 0
+
+    rate_limit.update_from_headers(
+        {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "200", "X-RateLimit-Reset": "1400"}
+    )
+    assert rate_limit.pacing_delay(10, 20) == 0
+    assert rate_limit.pacing_delay(10, 40) == 20
+    rate_limit.update_from_headers(
+        {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1400"}
+    )
+    assert rate_limit.pacing_delay(10, 1) == 60
+
+
+def test_rate_limit_pacing_reserve() -> None:
+    """Test that the reserve is not counted as budget for background work."""
+    clock = Clock()
+    rate_limit = HacsRateLimit(reserve=1000, time_func=clock)
+    rate_limit.update_from_headers(
+        {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "1500", "X-RateLimit-Reset": "1500"}
+    )
+    # 50 of the 100 pending updates fit in the budget above the reserve
+    assert rate_limit.pacing_delay(10, 100) == 10
+    assert rate_limit.pacing_delay(10, 100, priority=RateLimitPriority.USER) == 0
+    assert rate_limit.pacing_delay(10, 50) == 0
@@ -0,0 +1,50 @@
+"""Tests for the utils.raw_cache module."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.utils.raw_cache import HacsRawCache
+
+
+async def test_raw_cache(hass: HomeAssistant) -> None:
+    """Test the raw cache."""
+    cache = HacsRawCache(hass, hass.config.path(".storage", "hacs", "raw"))
+    await cache.async_load()
+
+    assert await cache.async_get("hacs/integration/1.0.0/hacs.json") is None
+
+    await cache.async_set("hacs/integration/1.0.0/hacs.json", b'{"name": "HACS"}')
+    await cache.async_set("hacs/integration/2.0.0/hacs.json", b'{"name": "HACS"}')
+    assert await cache.async_get("hacs/integration/1.0.0/hacs.json") == b'{"name": "HACS"}'
+
+    # Identical content is stored once
+    assert cache.stats["entries"] == 2
+    assert cache.stats["files"] == 1
+    assert len(list(cache.path.iterdir())) == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+    # Files that are not in the index are removed on load
+    await hass.async_add_executor_job((cache.path / "orphan").touch)
+    await cache.async_save()
+    reloaded = HacsRawCache(hass, cache.path)
+    await reloaded.async_load()
+    assert reloaded.stats["entries"] == 2
+    assert not (cache.path / "orphan").exists()
+
+
+async def test_raw_cache_eviction(hass: HomeAssistant) -> None:
+    """Test that the least recently used files are evicted."""
+    cache = HacsRawCache(hass, hass.config.path(".storage", "hacs", "raw"), max_size=8 * 1024)
+    await cache.async_load()
+
+    for number in range(10):
+        await cache.async_set(f"owner/repo/1.0.0/{number}", bytes([number]) * 1024)
+
+    assert cache.stats["size"] <= 8 * 1024
+    assert await cache.async_get("owner/repo/1.0.0/0") is None
+    assert await cache.async_get("owner/repo/1.0.0/9") == bytes([9]) * 1024
+    assert len(list(cache.path.iterdir())) == cache.stats["files"]
+
+    # Files larger than an eighth of the cache are not cached
+    await cache.async_set("owner/repo/1.0.0/large", b"0" * 2048)
+    assert await cache.async_get("owner/repo/1.0.0/large") is None
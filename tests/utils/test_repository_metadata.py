@@ -0,0 +1,126 @@
+"""Tests for the utils.repository_metadata module."""
+from types import SimpleNamespace
+from typing import Any
+
+from aiogithubapi import GitHubGraphQLException
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.integration import HacsIntegrationRepository
+from custom_components.hacs.utils.repository_metadata import (
+    metadata_moved,
+    metadata_query,
+    metadata_variables,
+    parse_metadata,
+)
+
+from tests.common import dummy_repository_base
+
+
+class GraphQLStandIn:
+    """Answers metadata queries from a dict of repositories, like the GitHub GraphQL API."""
+
+    def __init__(self, repositories: dict[str, dict[str, Any]]) -> None:
+        self.repositories = repositories
+        self.queries = 0
+
+    async def graphql(self, query: str, variables: dict[str, str]) -> SimpleNamespace:
+        self.queries += 1
+        data = {}
+        idx = 0
+        while f"owner{idx}" in variables:
+            assert f"r{idx}: repository(owner: $owner{idx}, name: $name{idx})" in query
+            full_name = f"{variables[f'owner{idx}']}/{variables[f'name{idx}']}"
+            data[f"r{idx}"] = self.repositories.get(full_name)
+            if data[f"r{idx}"] is None:
+                raise GitHubGraphQLException(
+                    f"Could not resolve to a Repository with the name '{full_name}'."
+                )
+            idx += 1
+        return SimpleNamespace(data={"data": data})
+
+
+def _result(full_name: str, oid: str = "abc1234def", releases: list | None = None) -> dict:
+    return {
+        "nameWithOwner": full_name,
+        "isArchived": False,
+        "pushedAt": "2024-01-01T00:00:00Z",
+        "stargazerCount": 42,
+        "issues": {"totalCount": 2},
+        "pullRequests": {"totalCount": 1},
+        "defaultBranchRef": {"name": "main", "target": {"oid": oid}},
+        "releases": {
+            "nodes": (
+                releases
+                if releases is not None
+                else [{"tagName": "3", "isDraft": False, "isPrerelease": False}]
+            )
+        },
+    }
+
+
+def test_metadata_query() -> None:
+    """Test metadata_query and metadata_variables."""
+    query = metadata_query(2)
+    assert "query ($owner0: String!, $name0: String!, $owner1: String!, $name1: String!)" in query
+    assert "r1: repository(owner: $owner1, name: $name1) { ...metadata }" in query
+    assert metadata_variables(["a/b", "c/d"]) == {
+        "owner0": "a",
+        "name0": "b",
+        "owner1": "c",
+        "name1": "d",
+    }
+
+
+def test_parse_metadata() -> None:
+    """Test parse_metadata."""
+    assert parse_metadata(None) is None
+    assert parse_metadata(
+        _result(
+            "test/test",
+            releases=[
+                {"tagName": "4-draft", "isDraft": True, "isPrerelease": False},
+                {"tagName": "4b1", "isDraft": False, "isPrerelease": True},
+                {"tagName": "3", "isDraft": False, "isPrerelease": False},
+            ],
+        )
+    ) == {
+        "archived": False,
+        "default_branch": "main",
+        "full_name": "test/test",
+        "last_commit": "abc1234",
+        "last_updated": "2024-01-01T00:00:00Z",
+        "last_version": "3",
+        "open_issues": 3,
+        "prerelease": "4b1",
+        "stargazers_count": 42,
+    }
+
+
+async def test_refresh_repository_metadata(hacs: HacsBase) -> None:
+    """Test that only repositories that moved need a full update."""
+    repositories = []
+    for idx in range(30):
+        repository = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/test"))
+        repository.data.full_name = f"test/repository{idx}"
+        repository.data.last_commit = "abc1234"
+        repositories.append(repository)
+
+    results = {x.data.full_name: _result(x.data.full_name) for x in repositories}
+    results["test/repository3"] = _result("test/repository3", oid="fff0000")
+    results["test/repository27"] = _result(
+        "test/repository27", releases=[{"tagName": "4", "isDraft": False, "isPrerelease": False}]
+    )
+    hacs.githubapi = GraphQLStandIn(results)
+
+    moved = await hacs.async_refresh_repository_metadata(repositories)
+    assert moved == [repositories[3], repositories[27]]
+    assert hacs.githubapi.queries == 2
+    assert repositories[0].data.stargazers_count == 42
+    assert repositories[0].data.open_issues == 3
+    assert repositories[3].data.stargazers_count == 999
+    assert not metadata_moved(repositories[0].data, parse_metadata(results["test/repository0"]))
+
+    # A batch that can not be fetched needs a full update for every repository in it
+    del results["test/repository29"]
+    moved = await hacs.async_refresh_repository_metadata(repositories)
+    assert moved == [repositories[3], *repositories[25:]]
@@ -0,0 +1,181 @@
+"""Tests for the utils.retry module."""
+import asyncio
+from collections.abc import AsyncGenerator
+
+from aiohttp import ClientSession, ClientTimeout, web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDict
+import pytest
+
+from custom_components.hacs.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HacsRetry,
+    HacsRetrySession,
+    RetryPolicy,
+)
+
+
+class FaultInjectingServer:
+    """Local HTTP server that answers with queued faults before succeeding."""
+
+    def __init__(self) -> None:
+        self.faults: dict[str, list[dict]] = {}
+        self.hits: dict[str, int] = {}
+        self.server = TestServer(web.Application())
+        self.server.app.router.add_route("*", "/{path:.*}", self.handler)
+
+    async def handler(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        self.hits[path] = self.hits.get(path, 0) + 1
+        if faults := self.faults.get(path):
+            fault = faults.pop(0)
+            await asyncio.sleep(fault.get("delay", 0))
+            return web.Response(status=fault.get("status", 200), headers=fault.get("headers"))
+        return web.Response(text=path)
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(f"/{path}"))
+
+
+@pytest.fixture
+async def fault_server() -> AsyncGenerator[FaultInjectingServer, None]:
+    """Start the fault injecting server."""
+    server = FaultInjectingServer()
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[ClientSession, None]:
+    """Client session for the fault injecting server."""
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest.mark.parametrize(
+    "status,headers,expected",
+    (
+        (200, {}, None),
+        (404, {}, None),
+        (403, {}, None),
+        (500, {}, 4),
+        (503, {}, 4),
+        (429, {}, 4),
+        (429, {"Retry-After": "5"}, 5),
+        (429, {"Retry-After": "Thu, 01 Jan 1970 00:16:50 GMT"}, 10),
+        (429, {"Retry-After": "120"}, None),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}, 30),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}, None),
+    ),
+)
+def test_retry_policy_response_delay(
+    status: int, headers: dict[str, str], expected: float | None
+) -> None:
+    """Test when and for how long responses are retried."""
+    policy = RetryPolicy(base_delay=2, random_func=lambda: 1.0)
+    assert policy.response_delay(1, status, CIMultiDict(headers), 1000) == expected
+
+
+def test_retry_policy_backoff() -> None:
+    """Test that the backoff grows exponentially, up to the maximum."""
+    policy = RetryPolicy(base_delay=1, max_delay=10, random_func=lambda: 1.0)
+    assert [policy.backoff(attempt) for attempt in range(5)] == [1, 2, 4, 8, 10]
+    assert RetryPolicy(random_func=lambda: 0.5).backoff(0) == 0.5
+
+
+def test_circuit_breaker() -> None:
+    """Test that the circuit opens, probes after the cooldown and closes again."""
+    now = 0.0
+    breaker = CircuitBreaker(threshold=3, cooldown=10, time_func=lambda: now)
+
+    breaker.failure()
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    breaker.failure()
+    assert breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    # A single probe goes through after the cooldown, and a failed probe opens it again
+    now = 10
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open"
+
+    now = 20
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.allow()
+    assert breaker.stats == {"failures": 0, "opened": 1, "state": "closed"}
+
+
+async def test_retry_session_retries_failures(
+    fault_server: FaultInjectingServer, session: ClientSession
+) -> None:
+    """Test that server errors, throttling and timeouts are retried."""
+    retry = HacsRetry(RetryPolicy(attempts=4, base_delay=0.01))
+    retry_session = HacsRetrySession(session, retry)
+
+    fault_server.faults["flaky"] = [{"status": 503}, {"status": 502}]
+    fault_server.faults["throttled"] = [{"status": 429, "headers": {"Retry-After": "0"}}]
+    fault_server.faults["slow"] = [{"delay": 1}]
+
+    for path in ("flaky", "throttled", "slow"):
+        response = await retry_session.get(fault_server.url(path), timeout=ClientTimeout(total=0.2))
+        assert response.status == 200
+        assert await response.text() == path
+
+    assert fault_server.hits == {"flaky": 3, "throttled": 2, "slow": 2}
+    assert retry.stats["retries"] == 4
+    assert retry.stats["gave_up"] == 0
+
+
+async def test_retry_session_gives_up(
+    fault_server: FaultInjectingServer, session: ClientSession
+) -> None:
+    """Test that failures are returned once retrying does not help."""
+    retry = HacsRetry(RetryPolicy(attempts=2, base_delay=0.01))
+    retry_session = HacsRetrySession(session, retry)
+
+    fault_server.faults["down"] = [{"status": 503}] * 3
+    fault_server.faults["limited"] = [{"status": 429, "headers": {"Retry-After": "3600"}}]
+    fault_server.faults["post"] = [{"status": 503}]
+    fault_server.faults["missing"] = [{"status": 404}]
+
+    assert (await retry_session.get(fault_server.url("down"))).status == 503
+    assert (await retry_session.get(fault_server.url("limited"))).status == 429
+    assert (await retry_session.post(fault_server.url("post"))).status == 503
+    assert (await retry_session.get(fault_server.url("missing"))).status == 404
+
+    assert fault_server.hits == {"down": 2, "limited": 1, "post": 1, "missing": 1}
+    assert retry.stats["gave_up"] == 1
+
+
+async def test_retry_session_circuit_breaker(
+    fault_server: FaultInjectingServer, session: ClientSession
+) -> None:
+    """Test that requests to a failing host are stopped until it recovers."""
+    now = 0.0
+    retry = HacsRetry(RetryPolicy(attempts=1), time_func=lambda: now)
+    retry_session = HacsRetrySession(session, retry)
+    host = fault_server.server.host
+
+    fault_server.faults["broken"] = [{"status": 500}] * 10
+    for _ in range(10):
+        assert (await retry_session.get(fault_server.url("broken"))).status == 500
+
+    with pytest.raises(CircuitOpenError):
+        await retry_session.get(fault_server.url("working"))
+    assert "working" not in fault_server.hits
+    assert retry.stats["rejected"] == 1
+    assert retry.stats["hosts"][host]["state"] == "open"
+
+    now = 30
+    assert (await retry_session.get(fault_server.url("working"))).status == 200
+    assert retry.stats["hosts"][host] == {"failures": 0, "opened": 1, "state": "closed"}
@@ -0,0 +1,80 @@
+"""Tests for the utils.single_flight module."""
+import asyncio
+
+import pytest
+
+from custom_components.hacs.utils.single_flight import SingleFlight, call_key
+
+
+async def test_single_flight_coalesces_concurrent_calls() -> None:
+    """Test that concurrent identical calls share one call."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def _job(value: str) -> str:
+        calls.append(value)
+        await release.wait()
+        return value
+
+    waiters = [
+        asyncio.create_task(single_flight.async_call(key, lambda key=key: _job(key)))
+        for key in ("a", "a", "a", "b")
+    ]
+    await asyncio.sleep(0)
+
+    # Cancelling one caller does not cancel the call for the others
+    waiters[0].cancel()
+    release.set()
+    assert await asyncio.gather(*waiters[1:]) == ["a", "a", "b"]
+    assert calls == ["a", "b"]
+    assert single_flight.stats == {"calls": 2, "coalesced": 2, "memo_hits": 0, "saved": 2}
+
+    # Without a refresh cycle nothing is kept
+    assert await single_flight.async_call("a", lambda: _job("a")) == "a"
+    assert calls == ["a", "b", "a"]
+
+
+async def test_single_flight_memo() -> None:
+    """Test that results are kept within a refresh cycle."""
+    now = 0.0
+    single_flight = SingleFlight(ttl=10, time_func=lambda: now)
+    calls = 0
+
+    async def _job() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async def _failing_job() -> None:
+        raise ValueError("Something went wrong")
+
+    async with single_flight.async_cycle():
+        assert await single_flight.async_call("key", _job) == 1
+        assert await single_flight.async_call("key", _job) == 1
+        assert await single_flight.async_call("key", _job, memo=False) == 2
+
+        now = 11
+        assert await single_flight.async_call("key", _job) == 3
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Something went wrong"):
+                await single_flight.async_call("failing", _failing_job)
+
+    assert await single_flight.async_call("key", _job) == 4
+    assert single_flight.stats == {"calls": 6, "coalesced": 0, "memo_hits": 1, "saved": 1}
+
+
+def test_call_key() -> None:
+    """Test call_key."""
+
+    class Namespace:
+        async def get(self, *args, **kwargs) -> None:
+            """Get."""
+
+    namespace = Namespace()
+    assert call_key(namespace.get, ("a",), {"b": 1, "a": 2}) == call_key(
+        namespace.get, ("a",), {"a": 2, "b": 1}
+    )
+    assert call_key(namespace.get, ("a",), {}) != call_key(Namespace().get, ("a",), {})
+    assert call_key(namespace.get, ("a",), {}) != call_key(namespace.get, ("b",), {})
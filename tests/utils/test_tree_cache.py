@@ -0,0 +1,39 @@
+"""Tests for the utils.tree_cache module."""
+
+from aiogithubapi.models.git_tree import GitHubGitTreeEntryModel
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.utils.tree_cache import HacsTreeCache
+
+TREE_SHA = "b4eecafa9be2f2006ce1b709d6857b07069b4608"
+
+
+async def test_tree_cache(hass: HomeAssistant) -> None:
+    """Test that trees are cached by tree SHA and pinned refs."""
+    cache = HacsTreeCache(hass, hass.config.path(".storage", "hacs", "trees"))
+    await cache.async_load()
+
+    assert await cache.async_get_tree(TREE_SHA) is None
+
+    tree = [
+        GitHubGitTreeEntryModel(
+            {"path": "hacs.json", "type": "blob", "sha": "abc", "size": 10, "url": "https://"}
+        ),
+        GitHubGitTreeEntryModel({"path": "custom_components", "type": "tree", "sha": "def"}),
+    ]
+    await cache.async_set_tree([TREE_SHA, "hacs/integration/1.0.0/tree"], tree)
+
+    for key in (TREE_SHA, "hacs/integration/1.0.0/tree"):
+        cached = await cache.async_get_tree(key)
+        assert [(entry.path, entry.type, entry.sha) for entry in cached] == [
+            ("hacs.json", "blob", "abc"),
+            ("custom_components", "tree", "def"),
+        ]
+    assert cached[0].size == 10
+
+    # Both keys share a single file, and survive a restart
+    assert cache.stats["files"] == 1
+    await cache.async_save()
+    reloaded = HacsTreeCache(hass, cache.path)
+    await reloaded.async_load()
+    assert await reloaded.async_get_tree("hacs/integration/1.0.0/tree") is not None
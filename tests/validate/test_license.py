@@ -51,7 +51,7 @@ async def test_repository_non_osi_license(repository):
 
 
 async def test_spdx_license_list_fetch_failure(repository, response_mocker: ResponseMocker):
-    response_mocker.add(SPDX_LICENSE_LIST_URL, MockedResponse(status=500))
+    response_mocker.add(SPDX_LICENSE_LIST_URL, MockedResponse(status=500, keep=True))
     repository.repository_object = MagicMock()
     repository.repository_object.attributes = {
         # An uncommon (non-cached) license so the check falls back to the fetch.